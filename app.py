@@ -5,7 +5,6 @@
 실행: streamlit run app.py
 """
 
-import os
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -13,10 +12,15 @@ load_dotenv()
 
 import streamlit as st
 
-from config.styles import generate_css, get_header_html
+from config.styles import get_artifact_card_html, get_header_html, get_image_placeholder_html, get_style_html
 from config.settings import APP_CONFIG
-from data.artifacts import ARTIFACTS, get_random_artifacts, generate_dynamic_quiz
-from services.llm_service import LLMService
+from data.artifacts import ARTIFACTS, catalog_ready, get_random_artifact_ids, start_catalog_loading
+from data.artifact_store import get_artifact_store
+from data.search import get_search_engine
+from services.circuit_breaker import OPEN, breaker_states
+from services.llm_service import get_llm_service
+from services.image_cache import get_thumbnail
+from services.quiz_pipeline import QuizPipeline
 
 
 # ============================================================
@@ -29,7 +33,11 @@ st.set_page_config(
     layout=APP_CONFIG["layout"]
 )
 
-st.markdown(generate_css(), unsafe_allow_html=True)
+# 테마 CSS는 내용 해시별로 한 번만 생성 (정적 파일이 있으면 @import 한 줄)
+st.markdown(get_style_html(), unsafe_allow_html=True)
+
+# 카탈로그와 검색 색인은 백그라운드에서 불러옴 (첫 화면을 기다리게 하지 않음)
+start_catalog_loading()
 
 
 # ============================================================
@@ -39,11 +47,13 @@ st.markdown(generate_css(), unsafe_allow_html=True)
 if "stage" not in st.session_state:
     st.session_state.stage = "select"  # select, quiz, result
 
-if "available_artifacts" not in st.session_state:
-    st.session_state.available_artifacts = get_random_artifacts(10)
+# 유물 정보는 프로세스 공유 저장소에 두고, 세션에는 id만 보관
+if "available_artifact_ids" not in st.session_state:
+    # 카탈로그가 아직 로드 중이면 기본 유물로 바로 첫 화면 표시
+    st.session_state.available_artifact_ids = get_random_artifact_ids(10, block=False)
 
-if "selected_artifacts" not in st.session_state:
-    st.session_state.selected_artifacts = []
+if "selected_artifact_ids" not in st.session_state:
+    st.session_state.selected_artifact_ids = []
 
 if "current_quiz_index" not in st.session_state:
     st.session_state.current_quiz_index = 0
@@ -60,20 +70,13 @@ if "chat_history" not in st.session_state:
 if "quiz_started" not in st.session_state:
     st.session_state.quiz_started = False
 
-if "llm_service" not in st.session_state:
-    # 환경변수에서 API 키 로드
-    api_key = os.getenv("GEMINI_API_KEY", "")
-    st.session_state.llm_service = LLMService(api_key)
-    if api_key:
-        print(f"✅ API 키 로드됨: {api_key[:20]}...")
-    else:
-        print("⚠️ API 키가 없습니다")
+# 프로세스 전체가 공유하는 LLM 서비스 (세션마다 새로 만들지 않음)
+llm_service = get_llm_service()
 
-# API 키가 있는데 client가 없으면 다시 초기화
-api_key = os.getenv("GEMINI_API_KEY", "")
-if api_key and not st.session_state.llm_service.client:
-    st.session_state.llm_service = LLMService(api_key)
-    print("🔄 LLM 서비스 재초기화")
+# 이번 실행에서 사용할 유물 레코드 (공유 저장소 참조)
+artifact_store = get_artifact_store()
+available_artifacts = artifact_store.get_many(st.session_state.available_artifact_ids)
+selected_artifacts = artifact_store.get_many(st.session_state.selected_artifact_ids)
 
 if "user_question" not in st.session_state:
     st.session_state.user_question = ""
@@ -90,6 +93,15 @@ if "generated_quizzes" not in st.session_state:
 if "quiz_generating" not in st.session_state:
     st.session_state.quiz_generating = False
 
+if "quiz_pipeline" not in st.session_state:
+    st.session_state.quiz_pipeline = None
+
+if "seen_questions" not in st.session_state:
+    st.session_state.seen_questions = set()  # 퀴즈 은행에서 이미 본 질문
+
+if "submitted_answer" not in st.session_state:
+    st.session_state.submitted_answer = None  # 제출한 선택지 (전체 rerun에서 처리)
+
 
 # ============================================================
 # 🔧 유틸리티 함수
@@ -103,6 +115,11 @@ def toggle_artifact_selection(artifact_id: str):
         st.session_state.selected_ids.add(artifact_id)
 
 
+def select_answer(index: int):
+    """퀴즈 선택지 선택"""
+    st.session_state.selected_answer = index
+
+
 def add_message(role: str, content: str):
     """채팅 히스토리에 메시지 추가"""
     st.session_state.chat_history.append({
@@ -112,12 +129,145 @@ def add_message(role: str, content: str):
 
 
 def display_chat_history():
-    """채팅 히스토리 표시"""
+    """
+    채팅 히스토리 표시
+
+    위젯이 없어 스스로 다시 실행될 일이 없으므로 fragment로 감싸지 않습니다.
+    유물 선택/선택지 클릭은 각자의 fragment만 다시 그리므로
+    대화가 길어져도 클릭할 때마다 히스토리를 다시 그리지 않습니다.
+    """
     for msg in st.session_state.chat_history:
         with st.chat_message(msg["role"], avatar="🏛️" if msg["role"] == "assistant" else "👤"):
             st.markdown(msg["content"], unsafe_allow_html=True)
 
 
+@st.fragment
+def render_artifact_selector(artifacts: list):
+    """
+    유물 선택 목록 (fragment)
+
+    카드를 선택/해제하면 전체 페이지가 아니라 이 목록만 다시 그립니다.
+    퀴즈 시작 버튼만 전체 페이지를 다시 실행합니다.
+    """
+    st.markdown("### 📜 유물 선택 (클릭하여 선택/해제)")
+
+    # 카드 리스트 형태로 유물 표시
+    for artifact in artifacts:
+        is_selected = artifact['id'] in st.session_state.selected_ids
+
+        col1, col2, col3 = st.columns([1, 4, 1])
+
+        with col1:
+            # 왼쪽: 이미지 영역 (로컬 썸네일 우선, 아직 없으면 원격 URL)
+            image_url = get_thumbnail(artifact)
+            if image_url:
+                try:
+                    st.image(image_url, width=70)
+                except Exception:
+                    st.markdown(get_image_placeholder_html(), unsafe_allow_html=True)
+            else:
+                st.markdown(get_image_placeholder_html(), unsafe_allow_html=True)
+
+        with col2:
+            # 가운데: 유물 정보 (HTML은 내용별로 캐시)
+            st.markdown(
+                get_artifact_card_html(
+                    artifact['name'],
+                    artifact.get('gallery', '국립중앙박물관'),
+                    artifact.get('designation', ''),
+                    artifact['period'],
+                    is_selected
+                ),
+                unsafe_allow_html=True
+            )
+
+        with col3:
+            # 오른쪽: 선택 버튼 (콜백으로 상태 변경 → 이 fragment만 다시 그림)
+            st.button(
+                "✓" if is_selected else "○",
+                key=f"select_{artifact['id']}",
+                type="primary" if is_selected else "secondary",
+                on_click=toggle_artifact_selection,
+                args=(artifact['id'],)
+            )
+
+        # 구분선
+        st.markdown("<hr style='margin: 8px 0; border: none; border-top: 1px solid #E2E8F0;'>", unsafe_allow_html=True)
+
+    # 선택된 유물 리스트 생성
+    selected = [a for a in artifacts if a['id'] in st.session_state.selected_ids]
+
+    st.markdown("---")
+
+    # 선택 개수 표시
+    select_count = len(selected)
+
+    if select_count < 3:
+        st.warning(f"⚠️ {select_count}개 선택됨 (최소 3개 필요)")
+    elif select_count > 10:
+        st.error(f"❌ {select_count}개 선택됨 (최대 10개까지)")
+    else:
+        st.success(f"✅ {select_count}개 선택됨")
+
+    # 시작 버튼
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        # 퀴즈 생성 중이면 버튼 비활성화
+        is_generating = st.session_state.quiz_generating
+        button_disabled = (select_count < 3 or select_count > 10 or is_generating)
+        button_label = "⏳ 퀴즈 생성 중..." if is_generating else "🎯 퀴즈 시작!"
+
+        if st.button(button_label, use_container_width=True, disabled=button_disabled):
+            # 중복 클릭 방지
+            st.session_state.quiz_generating = True
+
+            # 선택된 유물 저장 (먼저!)
+            st.session_state.selected_artifact_ids = [a['id'] for a in selected]
+
+            # 선택 메시지 추가
+            artifact_names = ", ".join([a["name"] for a in selected])
+            add_message("user", f"**{select_count}개의 유물을 선택했습니다:**\n{artifact_names}")
+            add_message("assistant", f"좋아요! {select_count}개의 유물에 대한 퀴즈를 생성할게요. 잠시만 기다려주세요... ⏳")
+
+            st.rerun()  # 전체 페이지를 다시 실행해 퀴즈 생성 처리
+
+
+@st.fragment
+def render_quiz_options(quiz: dict, current: int):
+    """
+    퀴즈 선택지와 제출 버튼 (fragment)
+
+    선택지를 누르면 이 영역만 다시 그리고, 제출할 때만 전체 페이지를 다시 실행합니다.
+    """
+    st.markdown("### 정답을 선택하세요:")
+
+    # 버튼 스타일 선택지 표시
+    for i, option in enumerate(quiz["options"]):
+        is_selected = st.session_state.selected_answer == i
+
+        # 선택된 상태 표시 (체크 아이콘 + primary 스타일)
+        btn_label = f"{'✓ ' if is_selected else ''}{i + 1}. {option}"
+        btn_type = "primary" if is_selected else "secondary"
+
+        st.button(
+            btn_label,
+            key=f"option_{current}_{i}",
+            use_container_width=True,
+            type=btn_type,
+            on_click=select_answer,
+            args=(i,)
+        )
+
+    # 제출 버튼
+    st.markdown("---")
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        submit_disabled = st.session_state.selected_answer is None
+        if st.button("✅ 정답 제출", key=f"submit_{current}", use_container_width=True, disabled=submit_disabled):
+            st.session_state.submitted_answer = st.session_state.selected_answer
+            st.rerun()  # 채점/해설은 전체 페이지에서 처리
+
+
 def get_encouragement_message(score: int, total: int) -> str:
     """점수에 따른 응원 메시지"""
     percentage = (score / total) * 100
@@ -155,7 +305,14 @@ with st.sidebar:
     st.markdown("## 🏛️ 박물관 퀴즈")
     st.markdown("---")
 
-    st.info("🤖 AI 맞춤 해설이 활성화되어 있습니다.")
+    if llm_service.health_check()["ok"]:
+        st.info("🤖 AI 맞춤 해설이 활성화되어 있습니다.")
+    else:
+        st.warning("💡 AI 연결 없이 기본 해설로 진행합니다.")
+
+    # 박물관 API가 차단 중이면 안내 (저장된 유물 데이터로 바로 진행)
+    if breaker_states().get("museum_api", {}).get("state") == OPEN:
+        st.caption("⚡ 박물관 API 응답이 없어 저장된 유물 데이터로 진행합니다.")
 
     st.markdown("---")
     st.markdown("### 📊 현재 진행 상황")
@@ -163,7 +320,7 @@ with st.sidebar:
     if st.session_state.stage == "select":
         st.markdown("📝 유물 선택 중...")
     elif st.session_state.stage == "quiz":
-        total = len(st.session_state.selected_artifacts)
+        total = len(selected_artifacts)
         current = st.session_state.current_quiz_index
         if total > 0:
             st.markdown(f"🎯 퀴즈 진행 중: {current + 1} / {total}")
@@ -171,7 +328,29 @@ with st.sidebar:
         else:
             st.markdown("🎯 퀴즈 준비 중...")
     elif st.session_state.stage == "result":
-        st.markdown(f"🏆 완료! 점수: {st.session_state.score}/{len(st.session_state.selected_artifacts)}")
+        st.markdown(f"🏆 완료! 점수: {st.session_state.score}/{len(selected_artifacts)}")
+
+    # 유물 검색 (로컬 색인, API 호출 없음)
+    st.markdown("---")
+    st.markdown("### 🔍 유물 검색")
+
+    if not catalog_ready():
+        st.caption("⏳ 유물 목록을 불러오는 중입니다...")
+    else:
+        search_engine = get_search_engine()
+        search_query = st.text_input("검색어", placeholder="예: 청자, 반가사유상", label_visibility="collapsed")
+        period_options = ["전체 시대"] + [value for value, _ in search_engine.facets("period")]
+        search_period = st.selectbox("시대", period_options, label_visibility="collapsed")
+
+        if search_query or search_period != "전체 시대":
+            search_filters = {"period": search_period} if search_period != "전체 시대" else {}
+            search_page = st.number_input("페이지", min_value=1, value=1, step=1)
+            search_result = search_engine.search(search_query, search_filters, page=search_page, page_size=5)
+
+            st.caption(f"{search_result['total']}건")
+            for hit in search_result["results"]:
+                found = hit["artifact"]
+                st.markdown(f"**{found['name']}**  \n<span style='font-size: 12px; color: #94A3B8;'>{found.get('period', '')} · {found.get('designation', '')}</span>", unsafe_allow_html=True)
 
 
 # ============================================================
@@ -200,132 +379,25 @@ with chat_container:
                 """)
 
         st.markdown("---")
-        st.markdown("### 📜 유물 선택 (클릭하여 선택/해제)")
-
-        # 카드 리스트 형태로 유물 표시
-        for i, artifact in enumerate(st.session_state.available_artifacts):
-            is_selected = artifact['id'] in st.session_state.selected_ids
-
-            # 카드 스타일 컨테이너
-            card_bg = "rgba(59, 130, 246, 0.1)" if is_selected else "rgba(248, 250, 252, 0.95)"
-            card_border = "2px solid #3B82F6" if is_selected else "1px solid #E2E8F0"
-
-            col1, col2, col3 = st.columns([1, 4, 1])
-
-            with col1:
-                # 왼쪽: 이미지 영역
-                image_url = artifact.get('image_url', '')
-                if image_url:
-                    try:
-                        st.image(image_url, width=70)
-                    except Exception:
-                        st.markdown(f"""
-                        <div style="
-                            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                            border-radius: 8px;
-                            padding: 15px;
-                            text-align: center;
-                            color: white;
-                            font-size: 24px;
-                            height: 70px;
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-                        ">🏛️</div>
-                        """, unsafe_allow_html=True)
-                else:
-                    st.markdown(f"""
-                    <div style="
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        border-radius: 8px;
-                        padding: 15px;
-                        text-align: center;
-                        color: white;
-                        font-size: 24px;
-                        height: 70px;
-                        display: flex;
-                        align-items: center;
-                        justify-content: center;
-                    ">🏛️</div>
-                    """, unsafe_allow_html=True)
-
-            with col2:
-                # 가운데: 유물 정보
-                st.markdown(f"""
-                <div style="padding: 5px 0;">
-                    <div style="font-weight: 600; font-size: 16px; color: #1E293B;">
-                        {'✅ ' if is_selected else ''}{artifact['name']}
-                    </div>
-                    <div style="font-size: 13px; color: #64748B; margin-top: 4px;">
-                        📍 {artifact.get('gallery', '국립중앙박물관')}
-                    </div>
-                    <div style="font-size: 12px; color: #94A3B8; margin-top: 2px;">
-                        {artifact.get('designation', '')} · {artifact['period']}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-
-            with col3:
-                # 오른쪽: 선택 버튼
-                if st.button(
-                    "✓" if is_selected else "○",
-                    key=f"select_{artifact['id']}",
-                    type="primary" if is_selected else "secondary"
-                ):
-                    toggle_artifact_selection(artifact['id'])
-                    st.rerun()
-
-            # 구분선
-            st.markdown("<hr style='margin: 8px 0; border: none; border-top: 1px solid #E2E8F0;'>", unsafe_allow_html=True)
-
-        # 선택된 유물 리스트 생성
-        selected = [a for a in st.session_state.available_artifacts if a['id'] in st.session_state.selected_ids]
-
-        st.markdown("---")
-
-        # 선택 개수 표시
-        select_count = len(selected)
-
-        if select_count < 3:
-            st.warning(f"⚠️ {select_count}개 선택됨 (최소 3개 필요)")
-        elif select_count > 10:
-            st.error(f"❌ {select_count}개 선택됨 (최대 10개까지)")
-        else:
-            st.success(f"✅ {select_count}개 선택됨")
-
-        # 시작 버튼
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            # 퀴즈 생성 중이면 버튼 비활성화
-            is_generating = st.session_state.quiz_generating
-            button_disabled = (select_count < 3 or select_count > 10 or is_generating)
-            button_label = "⏳ 퀴즈 생성 중..." if is_generating else "🎯 퀴즈 시작!"
-
-            if st.button(button_label, use_container_width=True, disabled=button_disabled):
-                # 중복 클릭 방지
-                st.session_state.quiz_generating = True
-
-                # 선택된 유물 저장 (먼저!)
-                st.session_state.selected_artifacts = selected
-
-                # 선택 메시지 추가
-                artifact_names = ", ".join([a["name"] for a in selected])
-                add_message("user", f"**{select_count}개의 유물을 선택했습니다:**\n{artifact_names}")
-                add_message("assistant", f"좋아요! {select_count}개의 유물에 대한 퀴즈를 생성할게요. 잠시만 기다려주세요... ⏳")
-
-                st.rerun()  # 로딩 상태 표시를 위해 먼저 rerun
+        render_artifact_selector(available_artifacts)
 
         # 퀴즈 생성 처리 (버튼 클릭 후 별도로 처리)
         if st.session_state.quiz_generating and st.session_state.stage == "select":
             with st.spinner("🤖 AI가 퀴즈를 생성하고 있어요..."):
-                llm = st.session_state.llm_service
-                generated_quizzes = {}
-
-                for artifact in st.session_state.selected_artifacts:
-                    quiz = generate_dynamic_quiz(artifact, llm)
-                    generated_quizzes[artifact['id']] = quiz
-
-                st.session_state.generated_quizzes = generated_quizzes
+                llm = llm_service
+
+                # 백그라운드에서 전체 퀴즈 생성 시작, 첫 문제만 기다림
+                pipeline = QuizPipeline(
+                    selected_artifacts,
+                    llm,
+                    seen_questions=st.session_state.seen_questions
+                ).start()
+                first_quiz = pipeline.wait_for(0)
+
+                st.session_state.quiz_pipeline = pipeline
+                st.session_state.generated_quizzes = {
+                    selected_artifacts[0]['id']: first_quiz
+                }
                 st.session_state.current_quiz_index = 0
                 st.session_state.score = 0
                 st.session_state.answers = []
@@ -343,15 +415,32 @@ with chat_container:
     # ============================================================
 
     elif st.session_state.stage == "quiz":
-        total = len(st.session_state.selected_artifacts)
+        total = len(selected_artifacts)
         current = st.session_state.current_quiz_index
 
         if current < total:
-            artifact = st.session_state.selected_artifacts[current]
+            artifact = selected_artifacts[current]
+
+            # 백그라운드에서 생성된 퀴즈 반영
+            pipeline = st.session_state.quiz_pipeline
+            if pipeline is not None:
+                # 이미 화면에 나간 문제는 바꾸지 않고 없는 것만 채움
+                for artifact_id, generated in pipeline.results().items():
+                    st.session_state.generated_quizzes.setdefault(artifact_id, generated)
+
+                # 현재 문제가 아직 없으면 그 문제만 기다림
+                if artifact['id'] not in st.session_state.generated_quizzes:
+                    with st.spinner("🤖 다음 문제를 준비하고 있어요..."):
+                        st.session_state.generated_quizzes[artifact['id']] = pipeline.wait_for(current)
+
+                # 다음 문제부터 우선 생성
+                pipeline.prioritize(current + 1)
+
             # 동적 생성된 퀴즈 사용 (없으면 기존 퀴즈)
             quiz = st.session_state.get("generated_quizzes", {}).get(
                 artifact['id'], artifact.get("quiz", {})
             )
+            st.session_state.seen_questions.add(quiz['question'])
 
             # 현재 문제를 채팅 형식으로 표시
             with st.chat_message("assistant", avatar="🏛️"):
@@ -383,86 +472,72 @@ with chat_container:
             )
 
             st.markdown("---")
-            st.markdown("### 정답을 선택하세요:")
-
-            # 버튼 스타일 선택지 표시
-            for i, option in enumerate(quiz["options"]):
-                is_selected = st.session_state.selected_answer == i
-
-                # 선택된 상태 표시 (체크 아이콘 + primary 스타일)
-                btn_label = f"{'✓ ' if is_selected else ''}{i + 1}. {option}"
-                btn_type = "primary" if is_selected else "secondary"
-
-                if st.button(
-                    btn_label,
-                    key=f"option_{current}_{i}",
-                    use_container_width=True,
-                    type=btn_type
-                ):
-                    st.session_state.selected_answer = i
-                    st.rerun()
-
-            # 제출 버튼
-            st.markdown("---")
-            col1, col2, col3 = st.columns([1, 2, 1])
-            with col2:
-                submit_disabled = st.session_state.selected_answer is None
-                if st.button("✅ 정답 제출", key=f"submit_{current}", use_container_width=True, disabled=submit_disabled):
-                    # 선택한 답 인덱스 추출
-                    selected_index = st.session_state.selected_answer
-                    selected_answer = quiz["options"][selected_index]
-
-                    # 정답 체크
-                    is_correct = (selected_index == quiz["answer"])
-
-                    if is_correct:
-                        st.session_state.score += 1
-
-                    # 사용자 답변 메시지 추가
-                    user_msg = f"**{selected_index + 1}번:** {selected_answer}"
-                    if user_question and user_question.strip():
-                        user_msg += f"\n\n💬 **궁금한 점:** {user_question}"
-                    add_message("user", user_msg)
-
-                    # 맞춤 해설 생성 (LLM 사용)
-                    enhanced_explanation = st.session_state.llm_service.generate_enhanced_explanation(
-                        artifact=artifact,
-                        quiz=quiz,
-                        is_correct=is_correct,
-                        user_question=user_question
-                    )
+            render_quiz_options(quiz, current)
 
-                    # 결과 메시지 추가
-                    if is_correct:
-                        result_msg = f"""
-✅ **정답입니다!**
+            if st.session_state.submitted_answer is not None:
+                # 선택한 답 인덱스 추출
+                selected_index = st.session_state.submitted_answer
+                st.session_state.submitted_answer = None
+                selected_answer = quiz["options"][selected_index]
 
-{enhanced_explanation}
-                        """
-                    else:
-                        result_msg = f"""
-❌ **아쉽네요!**
+                # 정답 체크
+                is_correct = (selected_index == quiz["answer"])
 
-정답은 **{quiz['options'][quiz['answer']]}** 입니다.
+                if is_correct:
+                    st.session_state.score += 1
 
-{enhanced_explanation}
-                        """
+                # 사용자 답변 메시지 추가
+                user_msg = f"**{selected_index + 1}번:** {selected_answer}"
+                if user_question and user_question.strip():
+                    user_msg += f"\n\n💬 **궁금한 점:** {user_question}"
+                add_message("user", user_msg)
 
-                    add_message("assistant", result_msg)
+                # 결과 메시지 머리말
+                if is_correct:
+                    result_header = "✅ **정답입니다!**"
+                else:
+                    result_header = f"""❌ **아쉽네요!**
+
+정답은 **{quiz['options'][quiz['answer']]}** 입니다."""
+
+                with st.chat_message("user", avatar="👤"):
+                    st.markdown(user_msg, unsafe_allow_html=True)
+
+                # 맞춤 해설 생성 (LLM 응답을 도착하는 대로 표시)
+                with st.chat_message("assistant", avatar="🏛️"):
+                    st.markdown(result_header)
+                    enhanced_explanation = st.write_stream(
+                        llm_service.generate_enhanced_explanation_stream(
+                            artifact=artifact,
+                            quiz=quiz,
+                            is_correct=is_correct,
+                            user_question=user_question
+                        )
+                    )
 
-                    st.session_state.answers.append({
-                        "artifact": artifact["name"],
-                        "question": quiz["question"],
-                        "user_answer": selected_answer,
-                        "correct_answer": quiz["options"][quiz["answer"]],
-                        "is_correct": is_correct,
-                        "user_question": user_question,
-                        "explanation": enhanced_explanation
-                    })
+                # 결과 메시지 추가
+                result_msg = f"""
+{result_header}
 
-                    st.session_state.current_quiz_index += 1
-                    st.session_state.selected_answer = None  # 다음 문제를 위해 선택 초기화
-                    st.rerun()
+{enhanced_explanation}
+                """
+
+                add_message("assistant", result_msg)
+
+                st.session_state.answers.append({
+                    "artifact_id": artifact["id"],
+                    "artifact": artifact["name"],
+                    "question": quiz["question"],
+                    "user_answer": selected_answer,
+                    "correct_answer": quiz["options"][quiz["answer"]],
+                    "is_correct": is_correct,
+                    "user_question": user_question,
+                    "explanation": enhanced_explanation
+                })
+
+                st.session_state.current_quiz_index += 1
+                st.session_state.selected_answer = None  # 다음 문제를 위해 선택 초기화
+                st.rerun()
 
         else:
             # 모든 퀴즈 완료 -> 결과 화면으로
@@ -475,7 +550,7 @@ with chat_container:
     # ============================================================
 
     elif st.session_state.stage == "result":
-        total = len(st.session_state.selected_artifacts)
+        total = len(selected_artifacts)
         score = st.session_state.score
 
         # 결과 메시지 (한 번만 추가)
@@ -530,9 +605,17 @@ with chat_container:
                 add_message("user", "다시 도전할게요!")
                 add_message("assistant", "좋아요! 새로운 유물들로 다시 시작해볼까요? 🏛️")
 
+                # 이전 게임의 남은 퀴즈 생성 중단
+                if st.session_state.quiz_pipeline is not None:
+                    st.session_state.quiz_pipeline.cancel()
+                    st.session_state.quiz_pipeline = None
+
                 st.session_state.stage = "select"
-                st.session_state.available_artifacts = get_random_artifacts(10)
-                st.session_state.selected_artifacts = []
+                # 틀린 유물과 비슷한 유물 위주로 다음 목록 추천 (모자라면 랜덤으로 채움)
+                from data.recommender import recommend_artifact_ids
+
+                st.session_state.available_artifact_ids = recommend_artifact_ids(st.session_state.answers, 10)
+                st.session_state.selected_artifact_ids = []
                 st.session_state.selected_ids = set()
                 st.session_state.current_quiz_index = 0
                 st.session_state.score = 0
@@ -0,0 +1,127 @@
+"""
+⏱️ startup.py - 시작 시간 벤치마크
+==================================
+
+앱 시작 경로의 import 시간과 첫 화면(유물 선택 단계) 렌더링 시간을 잽니다.
+매 측정은 새 파이썬 프로세스에서 실행하므로 항상 콜드 스타트 기준입니다.
+
+실행: python -m benchmarks.startup
+      python -m benchmarks.startup --runs 5 --budget-ms 1500
+
+- import: python -X importtime 출력에서 누적 시간이 큰 모듈 순으로 표시
+- 첫 화면: streamlit.testing의 AppTest로 app.py를 한 번 실행한 시간
+- 첫 화면 시간 중앙값이 --budget-ms를 넘으면 종료 코드 1
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# app.py가 시작할 때 불러오는 모듈
+BOOT_MODULES = (
+    "config.styles",
+    "config.settings",
+    "data.artifacts",
+    "data.artifact_store",
+    "data.search",
+    "services.llm_service",
+    "services.quiz_pipeline",
+)
+
+
+def measure_imports(modules=BOOT_MODULES, top: int = 15) -> dict:
+    """
+    -X importtime으로 시작 모듈 import 시간 측정
+
+    Returns:
+        dict: {"total_ms", "top": [(모듈, 누적 ms), ...]}
+    """
+    code = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, _, cumulative_us, name = line.replace("import time:", "|", 1).split("|")
+        cumulative[name.rstrip()[1:]] = int(cumulative_us) / 1000
+
+    # 최상위(들여쓰기 없는) 모듈의 누적 시간 합이 전체 import 시간
+    total = sum(ms for name, ms in cumulative.items() if not name.startswith(" "))
+    ranked = sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {"total_ms": round(total, 1), "top": [(name.strip(), round(ms, 1)) for name, ms in ranked]}
+
+
+def render_once(timeout: float) -> dict:
+    """현재 프로세스에서 app.py 첫 화면을 한 번 렌더링 (자식 프로세스에서 호출)"""
+    started = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(os.path.join(PROJECT_DIR, "app.py"), default_timeout=timeout)
+    app.run()
+    elapsed = (time.perf_counter() - started) * 1000
+
+    return {
+        "ms": round(elapsed, 1),
+        "stage": app.session_state["stage"] if "stage" in app.session_state else None,
+        "errors": [str(e.value) for e in app.exception],
+    }
+
+
+def measure_first_render(runs: int = 3, timeout: float = 30) -> list:
+    """새 프로세스에서 첫 화면 렌더링 시간을 runs번 측정"""
+    results = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-m", "benchmarks.startup", "--render-once", "--timeout", str(timeout)],
+            cwd=PROJECT_DIR, capture_output=True, text=True
+        )
+        lines = result.stdout.strip().splitlines()
+        if result.returncode != 0 or not lines:
+            raise RuntimeError(result.stderr.strip() or "렌더링 측정 실패")
+        results.append(json.loads(lines[-1]))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="앱 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=3, help="첫 화면 측정 횟수")
+    parser.add_argument("--top", type=int, default=15, help="표시할 import 모듈 수")
+    parser.add_argument("--timeout", type=float, default=30, help="렌더링 타임아웃 (초)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="첫 화면 시간 상한 (중앙값, ms)")
+    parser.add_argument("--render-once", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.render_once:
+        print(json.dumps(render_once(args.timeout), ensure_ascii=False))
+        sys.exit(0)
+
+    imports = measure_imports(top=args.top)
+    print(f"📦 시작 모듈 import: {imports['total_ms']}ms")
+    for name, ms in imports["top"]:
+        print(f"  {ms:>8.1f}ms  {name}")
+
+    renders = measure_first_render(args.runs, args.timeout)
+    for render in renders:
+        if render["errors"] or render["stage"] != "select":
+            print(f"⚠️ 첫 화면 렌더링 오류: stage={render['stage']} {render['errors']}")
+            sys.exit(1)
+
+    median = statistics.median(render["ms"] for render in renders)
+    print(f"🖥️ 첫 화면(유물 선택) 렌더링: 중앙값 {median:.1f}ms ({', '.join(str(r['ms']) for r in renders)})")
+
+    if args.budget_ms is not None and median > args.budget_ms:
+        print(f"⚠️ 상한 {args.budget_ms:.0f}ms 초과")
+        sys.exit(1)
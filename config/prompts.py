@@ -81,6 +81,20 @@ ARTIFACT_CONTEXT = """
 """
 
 
+# ============================================================
+# 🧭 관련 유물 컨텍스트 템플릿 (전체 소장품에서 검색된 유물)
+# ============================================================
+
+RELATED_ARTIFACTS_CONTEXT = """
+## 관련 소장품 (전체 소장품 검색 결과)
+{related}
+
+관람객이 비슷한 유물이나 다른 유물을 물어보면 위 목록을 참고해 추천해주세요.
+"""
+
+RELATED_ARTIFACT_LINE = "- {name} ({period}, {material}) {designation}: {summary}"
+
+
 # ============================================================
 # 💬 기타 메시지
 # ============================================================
@@ -13,4 +13,146 @@ AI_CONFIG = {
     "model": "gemini-2.0-flash",
     "max_tokens": 1024,
     "temperature": 0.7,
+    "init_retry_seconds": 60,   # 모델 초기화 실패 후 다시 시도하기까지 대기 (초)
+}
+
+MUSEUM_API_CONFIG = {
+    "timeout": 10,          # 요청당 읽기 타임아웃 (초)
+    "connect_timeout": 3,   # 연결 타임아웃 (초)
+    "max_workers": 10,      # 유물 상세 동시 조회 개수
+    "pool_size": 20,        # 호스트당 keep-alive 연결 수
+    "max_retries": 3,       # 5xx/연결 오류 재시도 횟수
+    "backoff_factor": 0.3,  # 재시도 간격 (0.3s, 0.6s, 1.2s ...)
+    "async_concurrency": 32,  # 비동기 클라이언트 동시 요청 수 (연결 풀 크기)
+}
+
+CACHE_CONFIG = {
+    "dir": ".cache",                    # 로컬 캐시 디렉터리
+    "artifact_db": "artifacts.sqlite3", # 유물 응답 캐시 파일
+    "ttl": 7 * 24 * 3600,               # 신선한 캐시 유지 시간 (7일)
+    "stale_ttl": 30 * 24 * 3600,        # 만료 후에도 먼저 보여주는 기간 (백그라운드 갱신)
+    "negative_ttl": 3600,               # 조회 실패 ID 캐시 시간 (1시간)
+    "max_entries": 5000,                # 최대 항목 수 (초과 시 LRU 제거)
+}
+
+HARVEST_CONFIG = {
+    "dir": ".cache/catalog",    # 수집한 카탈로그 저장 위치 ({museum_code}.jsonl)
+    "rows": 100,                # 페이지당 결과 수
+    "max_workers": 4,           # 동시 페이지 요청 수
+}
+
+QUIZ_CONFIG = {
+    "max_workers": 5,       # 동시 퀴즈 생성 개수
+    "timeout": 20,          # 유물당 퀴즈 생성 타임아웃 (초)
+}
+
+LLM_CACHE_CONFIG = {
+    "enabled": True,
+    "db": "llm.sqlite3",        # CACHE_CONFIG["dir"] 아래 저장
+    "ttl": 24 * 3600,           # 응답 유지 시간 (1일)
+    "memory_entries": 512,      # 프로세스 내 LRU 크기
+    "disk_entries": 20000,      # 디스크 캐시 최대 항목 수
+    "quiz_variants": 3,         # 같은 유물에 대해 돌려 쓸 퀴즈 개수
+}
+
+ARTIFACT_STORE_CONFIG = {
+    "max_records": 2000,        # 카탈로그에 없는 API 유물을 보관할 최대 개수 (LRU)
+}
+
+QUIZ_BANK_CONFIG = {
+    "path": "data/quiz_bank.json.gz",   # 미리 생성한 퀴즈 은행 파일
+    "per_artifact": 5,                  # 유물당 퀴즈 개수
+    "max_workers": 4,                   # 빌드 시 동시 생성 유물 수
+    "max_attempts": 3,                  # 퀴즈 하나당 최대 생성 시도
+}
+
+SEARCH_CONFIG = {
+    "field_weights": {          # 필드별 가중치 (BM25F)
+        "name": 3.0,
+        "designation": 2.0,
+        "period": 1.5,
+        "material": 1.5,
+        "gallery": 1.0,
+        "description": 1.0,
+    },
+    "k1": 1.2,                  # BM25 용어 빈도 포화 계수
+    "b": 0.75,                  # BM25 문서 길이 정규화 계수
+    "page_size": 10,
+}
+
+RETRIEVAL_CONFIG = {
+    "backend": "auto",                          # auto(키 있으면 gemini) / gemini / local
+    "embedding_model": "models/text-embedding-004",
+    "local_dim": 512,                           # 로컬 해시 임베딩 차원
+    "top_k": 3,                                 # 프롬프트에 넣을 관련 유물 수
+    "min_score": 0.15,                          # 이 유사도 미만은 제외
+    "batch_size": 100,                          # 임베딩 API 요청당 문서 수
+    "embed_timeout": 10,                        # 임베딩 요청 타임아웃 (초)
+}
+
+RECOMMENDER_CONFIG = {
+    "dir": ".cache/recommender",    # 이웃 테이블 저장 위치
+    "neighbors": 10,                # 유물당 저장할 이웃 수
+    "memory_budget_mb": 64,         # 이웃 계산 시 유사도 묶음 메모리 예산 (MB)
+    "weights": {                    # 유사도 가중치
+        "period": 1.0,
+        "material": 1.0,
+        "designation": 0.5,
+        "description": 2.0,
+    },
+    "wrong_weight": 2.0,            # 틀린 유물의 이웃 가중치
+    "correct_weight": 0.5,          # 맞힌 유물의 이웃 가중치
+}
+
+IMAGE_CONFIG = {
+    "dir": ".cache/images",         # 이미지 캐시 위치 (내용 해시로 저장)
+    "index_db": "index.sqlite3",    # URL → 내용 해시 색인
+    "variants": {                   # 변형 이름: 최대 (가로, 세로) 픽셀
+        "thumb": (140, 140),        # 선택 목록 썸네일 (70px 표시, 고해상도 화면 대비 2배)
+        "detail": (960, 960),       # 상세 보기
+    },
+    "quality": 82,                  # JPEG 품질
+    "max_bytes": 20 * 1024 * 1024,  # 원본 최대 크기
+    "ttl": 30 * 24 * 3600,          # 색인 유지 시간 (30일)
+    "negative_ttl": 3600,           # 다운로드 실패 URL 재시도 간격 (1시간)
+    "max_workers": 8,               # 동시 다운로드 수
+    "timeout": 10,                  # 다운로드 타임아웃 (초)
+    "warm_count": 200,              # 카탈로그 로드 시 미리 받을 유물 수
+}
+
+LLM_SCHEDULER_CONFIG = {
+    "requests_per_minute": 15,      # Gemini 분당 요청 한도
+    "tokens_per_minute": 1000000,   # Gemini 분당 토큰 한도
+    "burst": 5,                     # 한 번에 몰아 보낼 수 있는 요청 수
+    "max_queue": 64,                # 대기열 최대 길이 (초과 시 바로 실패 → 기본 응답)
+    "deadlines": {                  # 우선순위별 기본 대기 마감 (초)
+        "interactive": 30,
+        "background": 60,
+        "batch": 600,
+    },
+    "max_retries": 4,               # 429 응답 재시도 횟수
+    "backoff_base": 1.0,            # 재시도 대기 기본값 (초, 지수 증가 + 지터)
+    "backoff_max": 20.0,            # 재시도 대기 최대값 (초)
+    "async_poll": 0.05,             # 코루틴이 차례를 확인하는 간격 (초)
+}
+
+CIRCUIT_BREAKER_CONFIG = {
+    # 백엔드별 설정: 최근 window초 동안 min_calls번 이상 호출했고
+    # 실패(오류 또는 slow_call초 이상 걸린 호출) 비율이 failure_rate 이상이면 차단
+    "museum_api": {
+        "window": 60,
+        "min_calls": 5,
+        "failure_rate": 0.5,
+        "slow_call": 5.0,
+        "open_seconds": 30,         # 차단 유지 시간 (이후 시험 호출 허용)
+        "half_open_calls": 1,       # 시험 호출 동시 허용 수
+    },
+    "gemini": {
+        "window": 60,
+        "min_calls": 3,
+        "failure_rate": 0.5,
+        "slow_call": 20.0,
+        "open_seconds": 30,
+        "half_open_calls": 1,
+    },
 }
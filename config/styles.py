@@ -8,6 +8,13 @@
 수정 후 저장 → git add . → git commit -m "스타일 변경" → git push
 """
 
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+
+
 # ============================================================
 # 🎨 색상 (Colors) - 흰색/파란색 테마
 # ============================================================
@@ -184,15 +191,129 @@ COMPONENTS = {
 }
 
 
+# ============================================================
+# 🗂️ 테마 변형 (선택)
+# ============================================================
+
+# 기본 테마에서 바꿀 값만 섹션별로 적으면 됩니다. 예:
+# THEME_VARIANTS = {
+#     "high_contrast": {"COLORS": {"primary": "#1d4ed8", "text": "#000000"}},
+# }
+THEME_VARIANTS = {}
+
+
 # ============================================================
 # 📱 CSS 생성 함수 (건드리지 마세요!)
 # ============================================================
 
-def generate_css() -> str:
-    """위 설정값들로 CSS를 생성합니다."""
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+
+
+def _build_themes() -> dict:
+    """기본 테마 + 변형 테마 (섹션별로 덮어쓰기)"""
+    base = {
+        "COLORS": COLORS,
+        "FONTS": FONTS,
+        "SPACING": SPACING,
+        "SIZING": SIZING,
+        "EFFECTS": EFFECTS,
+        "COMPONENTS": COMPONENTS,
+    }
+    themes = {"default": base}
+    for name, overrides in THEME_VARIANTS.items():
+        themes[name] = {section: {**values, **overrides.get(section, {})} for section, values in base.items()}
+    return themes
+
+
+def _theme_hash(theme: dict) -> str:
+    """테마 설정값의 내용 해시 (값이 바뀌면 캐시/정적 파일 이름도 바뀜)"""
+    payload = json.dumps(theme, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+THEMES = _build_themes()
+THEME_HASHES = {name: _theme_hash(theme) for name, theme in THEMES.items()}
+
+
+def _minify_css(css: str) -> str:
+    """주석과 불필요한 공백 제거"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};])\s*", r"\1", css).strip()
+
+
+def _compact_html(html: str) -> str:
+    """줄바꿈과 들여쓰기 제거"""
+    return re.sub(r"\s*\n\s*", " ", html).replace("> <", "><").strip()
+
+
+@lru_cache(maxsize=512)
+def _render(kind: str, theme_hash: str, theme: str, args: tuple) -> str:
+    """
+    렌더링 결과 캐시 (테마 내용 해시 + 인자 기준)
+
+    Streamlit은 버튼을 누를 때마다 app.py를 다시 실행하므로
+    같은 테마/인자면 문자열을 다시 만들지 않고 그대로 돌려줍니다.
+    """
+    if kind == "css":
+        return _minify_css(_render_css(THEMES[theme]))
+    return _compact_html(_RENDERERS[kind](THEMES[theme], *args))
+
+
+def generate_css(theme: str = "default") -> str:
+    """위 설정값들로 CSS를 생성합니다. (<style> 태그 포함, 테마별 캐시)"""
+    return f"<style>{_render('css', THEME_HASHES[theme], theme, ())}</style>"
+
+
+def get_static_css_name(theme: str = "default") -> str:
+    """미리 컴파일한 테마 CSS 파일 이름 (내용 해시 포함)"""
+    return f"theme-{theme}-{THEME_HASHES[theme]}.css"
+
+
+def precompile_themes(out_dir: str = STATIC_DIR) -> list:
+    """
+    모든 테마의 CSS를 정적 파일로 저장
+
+    .streamlit/config.toml의 enableStaticServing으로 app/static/ 경로에서 제공되며,
+    브라우저가 한 번 받아 두면 다시 실행할 때마다 CSS 전체를 보내지 않아도 됩니다.
+
+    Returns:
+        list: 저장한 파일 경로
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for theme in THEMES:
+        path = os.path.join(out_dir, get_static_css_name(theme))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_render("css", THEME_HASHES[theme], theme, ()))
+        paths.append(path)
+    return paths
+
+
+@lru_cache(maxsize=None)
+def _style_html(theme: str, theme_hash: str) -> str:
+    if os.path.exists(os.path.join(STATIC_DIR, get_static_css_name(theme))):
+        return f"<style>@import url('app/static/{get_static_css_name(theme)}');</style>"
+    return generate_css(theme)
+
+
+def get_style_html(theme: str = "default") -> str:
+    """
+    앱에 넣을 스타일 태그
+
+    현재 테마 내용과 같은 정적 CSS 파일이 있으면 @import 한 줄만,
+    없으면 (테마를 바꾼 뒤 다시 컴파일하지 않았으면) 인라인 CSS를 반환합니다.
+    """
+    return _style_html(theme, THEME_HASHES[theme])
+
+
+def _render_css(theme: dict) -> str:
+    """테마 설정값으로 CSS 본문 생성"""
+    COLORS, FONTS, SPACING, SIZING, EFFECTS, COMPONENTS = (
+        theme[section] for section in ("COLORS", "FONTS", "SPACING", "SIZING", "EFFECTS", "COMPONENTS")
+    )
 
     return f"""
-    <style>
         /* Google Fonts 로드 */
         @import url('{FONTS["import_url"]}');
 
@@ -523,7 +644,6 @@ def generate_css() -> str:
         .stRadio [data-testid="stMarkdownContainer"] {{
             width: 100%;
         }}
-    </style>
     """
 
 
@@ -531,8 +651,22 @@ def generate_css() -> str:
 # 🏷️ HTML 컴포넌트 템플릿
 # ============================================================
 
-def get_header_html(title: str, subtitle: str = "") -> str:
+def get_header_html(title: str, subtitle: str = "", theme: str = "default") -> str:
     """헤더 HTML 생성"""
+    return _render("header", THEME_HASHES[theme], theme, (title, subtitle))
+
+
+def get_card_html(content: str, title: str = "", theme: str = "default") -> str:
+    """카드 컴포넌트 HTML 생성"""
+    return _render("card", THEME_HASHES[theme], theme, (content, title))
+
+
+def get_badge_html(text: str, color: str = "primary", theme: str = "default") -> str:
+    """배지 HTML 생성"""
+    return _render("badge", THEME_HASHES[theme], theme, (text, color))
+
+
+def _header_html(theme: dict, title: str, subtitle: str) -> str:
     return f"""
     <div class="main-header">
         <h1>🏛️ {title}</h1>
@@ -541,8 +675,8 @@ def get_header_html(title: str, subtitle: str = "") -> str:
     """
 
 
-def get_card_html(content: str, title: str = "") -> str:
-    """카드 컴포넌트 HTML 생성"""
+def _card_html(theme: dict, content: str, title: str) -> str:
+    COLORS, SIZING, SPACING = theme["COLORS"], theme["SIZING"], theme["SPACING"]
     title_html = f"<h4>{title}</h4>" if title else ""
     return f"""
     <div style="
@@ -558,8 +692,8 @@ def get_card_html(content: str, title: str = "") -> str:
     """
 
 
-def get_badge_html(text: str, color: str = "primary") -> str:
-    """배지 HTML 생성"""
+def _badge_html(theme: dict, text: str, color: str) -> str:
+    COLORS, FONTS = theme["COLORS"], theme["FONTS"]
     bg_color = COLORS.get(color, COLORS["primary"])
     return f"""
     <span style="
@@ -571,3 +705,61 @@ def get_badge_html(text: str, color: str = "primary") -> str:
         font-weight: 500;
     ">{text}</span>
     """
+
+
+def get_artifact_card_html(name: str, gallery: str, designation: str, period: str, selected: bool = False, theme: str = "default") -> str:
+    """유물 선택 목록의 카드 본문 HTML 생성"""
+    return _render("artifact_card", THEME_HASHES[theme], theme, (name, gallery, designation, period, selected))
+
+
+def get_image_placeholder_html(theme: str = "default") -> str:
+    """이미지가 없는 유물의 자리 표시 HTML 생성"""
+    return _render("image_placeholder", THEME_HASHES[theme], theme, ())
+
+
+def _artifact_card_html(theme: dict, name: str, gallery: str, designation: str, period: str, selected: bool) -> str:
+    return f"""
+    <div style="padding: 5px 0;">
+        <div style="font-weight: 600; font-size: 16px; color: #1E293B;">
+            {'✅ ' if selected else ''}{name}
+        </div>
+        <div style="font-size: 13px; color: #64748B; margin-top: 4px;">
+            📍 {gallery}
+        </div>
+        <div style="font-size: 12px; color: #94A3B8; margin-top: 2px;">
+            {designation} · {period}
+        </div>
+    </div>
+    """
+
+
+def _image_placeholder_html(theme: dict) -> str:
+    return """
+    <div style="
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        border-radius: 8px;
+        padding: 15px;
+        text-align: center;
+        color: white;
+        font-size: 24px;
+        height: 70px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+    ">🏛️</div>
+    """
+
+
+_RENDERERS = {
+    "header": _header_html,
+    "card": _card_html,
+    "badge": _badge_html,
+    "artifact_card": _artifact_card_html,
+    "image_placeholder": _image_placeholder_html,
+}
+
+
+if __name__ == "__main__":
+    # 테마 CSS를 static/ 폴더에 미리 컴파일: python -m config.styles
+    for path in precompile_themes():
+        print(f"✅ {path}")
@@ -0,0 +1,232 @@
+"""
+🔎 artifact_index.py - 유물 색인
+================================
+
+유물 id 해시맵과 이름 매칭용 Aho–Corasick 오토마톤을 한 번만 만들어 둡니다.
+
+- get(id): O(1) 조회
+- find_all(text): 카탈로그 크기와 관계없이 텍스트를 한 번만 훑어서
+  언급된 모든 유물을 찾음 (name, name_en, name_kr, 별칭)
+"""
+
+import threading
+from collections import deque
+
+
+class AhoCorasick:
+    """다중 문자열 매칭 오토마톤"""
+
+    def __init__(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        self._built = True
+
+    def add(self, pattern: str, value) -> None:
+        """패턴 추가 (build 전까지 검색에 반영되지 않음)"""
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(pattern), value))
+        self._built = False
+
+    def build(self) -> None:
+        """실패 링크 계산 (BFS)"""
+        queue = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            queue.append(nxt)
+
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+        self._built = True
+
+    def find_all(self, text: str) -> list:
+        """
+        텍스트에서 모든 패턴 위치 찾기
+
+        Returns:
+            list: (시작 위치, 끝 위치, 값) 목록
+        """
+        if not self._built:
+            self.build()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        matches = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, value in out[node]:
+                matches.append((i - length + 1, i + 1, value))
+        return matches
+
+
+class ArtifactIndex:
+    """유물 id 해시맵 + 수집 카탈로그 + 이름 매처"""
+
+    MIN_PATTERN_LENGTH = 2
+    NAME_FIELDS = ("name", "name_kr", "name_en")
+
+    def __init__(self):
+        self._by_id = {}
+        self._catalog = None
+        self._matcher = AhoCorasick()
+        self._lock = threading.Lock()
+
+    def _add_names(self, artifact_id: str, names) -> None:
+        """이름 패턴 등록 (lock 안에서 호출)"""
+        for name in names:
+            if name and len(name.strip()) >= self.MIN_PATTERN_LENGTH:
+                # 영문명은 대소문자 구분 없이 매칭
+                self._matcher.add(name.strip().lower(), artifact_id)
+
+    def add_catalog(self, catalog) -> None:
+        """
+        수집 카탈로그 등록 (CompactCatalog)
+
+        이름 필드만 읽어 매처에 넣고, 레코드는 get/artifacts에서 필요할 때 읽습니다.
+        """
+        with self._lock:
+            self._catalog = catalog
+            for row in range(len(catalog)):
+                self._add_names(
+                    catalog.value(row, "id"),
+                    {catalog.value(row, field) for field in self.NAME_FIELDS}
+                )
+
+    def add(self, artifact, aliases=()) -> None:
+        """유물과 별칭 등록"""
+        artifact_id = artifact.get("id")
+        if not artifact_id:
+            return
+
+        names = {
+            artifact.get("name"),
+            artifact.get("name_kr"),
+            artifact.get("name_en"),
+            *artifact.get("aliases", ()),
+            *aliases,
+        }
+
+        with self._lock:
+            self._by_id[artifact_id] = artifact
+            self._add_names(artifact_id, names)
+
+    def get(self, artifact_id: str):
+        """id로 유물 조회 (기본 유물 우선, 없으면 수집 카탈로그)"""
+        artifact = self._by_id.get(artifact_id)
+        if artifact is None and self._catalog is not None:
+            artifact = self._catalog.get(artifact_id)
+        return artifact
+
+    def artifacts(self):
+        """
+        색인된 전체 유물을 하나씩 내보내는 제너레이터
+
+        카탈로그 레코드는 그때그때 읽으므로 한꺼번에 메모리에 올리지 않습니다.
+        """
+        catalog = self._catalog
+        if catalog is not None:
+            for row in range(len(catalog)):
+                artifact_id = catalog.value(row, "id")
+                yield self._by_id.get(artifact_id) or catalog.record(row)
+
+        for artifact_id, artifact in list(self._by_id.items()):
+            if catalog is None or catalog.find_row(artifact_id) is None:
+                yield artifact
+
+    def iter_fields(self, fields: tuple):
+        """
+        전체 유물의 필드 값 튜플을 하나씩 내보내는 제너레이터 (artifacts()와 같은 순서)
+
+        카탈로그 레코드는 필요한 필드만 읽고 dict로 만들지 않습니다.
+        카탈로그에 없는 필드는 빈 문자열입니다.
+        """
+        from services.compact_catalog import FIELDS
+
+        catalog = self._catalog
+        if catalog is not None:
+            for row in range(len(catalog)):
+                artifact = self._by_id.get(catalog.value(row, "id"))
+                if artifact is not None:
+                    yield tuple(artifact.get(field, "") or "" for field in fields)
+                else:
+                    yield tuple(catalog.value(row, field) if field in FIELDS else "" for field in fields)
+
+        for artifact_id, artifact in list(self._by_id.items()):
+            if catalog is None or catalog.find_row(artifact_id) is None:
+                yield tuple(artifact.get(field, "") or "" for field in fields)
+
+    def find_all(self, text: str) -> list:
+        """
+        텍스트에 언급된 모든 유물 (처음 언급된 순서, 중복 제거)
+
+        같은 위치에서 겹치면 더 긴 이름이 먼저 옵니다.
+        """
+        if not text:
+            return []
+
+        with self._lock:
+            matches = self._matcher.find_all(text.lower())
+
+        matches.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+
+        found = []
+        seen = set()
+        for _, _, artifact_id in matches:
+            if artifact_id not in seen:
+                seen.add(artifact_id)
+                artifact = self.get(artifact_id)
+                if artifact:
+                    found.append(artifact)
+        return found
+
+    def __len__(self) -> int:
+        if self._catalog is None:
+            return len(self._by_id)
+        extra = sum(1 for artifact_id in self._by_id if self._catalog.find_row(artifact_id) is None)
+        return len(self._catalog) + extra
+
+
+# 싱글톤 인스턴스
+_artifact_index = None
+_index_lock = threading.Lock()
+
+
+def get_artifact_index() -> ArtifactIndex:
+    """유물 색인 반환 (처음 호출 시 ARTIFACTS + 수집 카탈로그로 한 번 생성)"""
+    global _artifact_index
+    if _artifact_index is None:
+        with _index_lock:
+            if _artifact_index is None:
+                from data.artifacts import ARTIFACTS, load_harvested_catalog
+
+                index = ArtifactIndex()
+                catalog = load_harvested_catalog()
+                if hasattr(catalog, "find_row"):
+                    index.add_catalog(catalog)
+                else:
+                    for artifact in catalog:
+                        index.add(artifact)
+                # 기본 유물은 dict 키도 별칭으로 등록 (예: "금동미륵보살반가사유상_78호")
+                for key, artifact in ARTIFACTS.items():
+                    index.add(artifact, aliases=(key,))
+                _artifact_index = index
+    return _artifact_index
@@ -0,0 +1,145 @@
+"""
+🗂️ artifact_store.py - 프로세스 공유 유물 저장소
+================================================
+
+모든 Streamlit 세션이 유물 id로만 참조하도록 합니다.
+세션에는 id 목록만 남으므로 방문자 수가 늘어도 유물 사본이 늘지 않습니다.
+
+- 기본 유물(ARTIFACTS)과 수집 카탈로그 유물은 복사하지 않고 유물 색인(mmap)에서 조회
+- 카탈로그에 없는 API 유물만 크기 제한이 있는 LRU에 보관
+- 레코드는 __slots__ 객체 (dict보다 작고, 읽기 전용)
+- 원본 API 데이터(_raw)는 저장하지 않음
+"""
+
+import threading
+from collections import OrderedDict
+
+from config.settings import ARTIFACT_STORE_CONFIG
+
+
+class ArtifactRecord:
+    """읽기 전용 유물 레코드 (기존 dict 코드와 같은 방식으로 접근 가능)"""
+
+    FIELDS = (
+        "id", "name", "name_kr", "name_cn", "name_en",
+        "period", "material", "location", "gallery", "designation",
+        "description", "image_url", "thumbnail_url", "fun_facts", "quiz",
+    )
+    __slots__ = FIELDS
+
+    def __init__(self, artifact: dict):
+        for field in self.FIELDS:
+            object.__setattr__(self, field, artifact.get(field))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ArtifactRecord는 읽기 전용입니다.")
+
+    def __getitem__(self, key: str):
+        """dict처럼 조회 (값이 None인 필드는 None, 없는 필드명만 KeyError)"""
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.FIELDS
+
+    def get(self, key: str, default=None):
+        value = getattr(self, key, None) if key in self.FIELDS else None
+        return default if value is None else value
+
+    def to_dict(self) -> dict:
+        """값이 있는 필드만 dict로 변환"""
+        return {field: getattr(self, field) for field in self.FIELDS if getattr(self, field) is not None}
+
+    def __repr__(self) -> str:
+        return f"ArtifactRecord(id={self.id!r}, name={self.name!r})"
+
+
+class ArtifactStore:
+    """
+    유물 id → 유물 저장소
+
+    base/resolve로 찾을 수 있는 유물은 저장하지 않고 그때그때 조회하며,
+    나머지(카탈로그에 없는 API 유물)만 최대 max_records개까지 LRU로 보관합니다.
+    """
+
+    def __init__(self, base: dict = None, resolve=None, max_records: int = None):
+        self._base = base or {}           # 기본 유물 {id: dict} (원본 참조, 복사 안 함)
+        self._resolve = resolve           # id → 유물 조회 함수 (수집 카탈로그, 없으면 None)
+        self.max_records = max_records or ARTIFACT_STORE_CONFIG["max_records"]
+        self._records = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, artifact_id: str):
+        """기본 유물/카탈로그에서 조회"""
+        artifact = self._base.get(artifact_id)
+        if artifact is None and self._resolve is not None:
+            artifact = self._resolve(artifact_id)
+        return artifact
+
+    def add(self, artifact) -> str:
+        """유물 추가 후 id 반환 (기본 유물/카탈로그 유물은 저장하지 않음)"""
+        artifact_id = artifact.get("id")
+        if self._lookup(artifact_id) is not None:
+            return artifact_id
+
+        record = artifact if isinstance(artifact, ArtifactRecord) else ArtifactRecord(artifact)
+        with self._lock:
+            self._records[artifact_id] = record
+            self._records.move_to_end(artifact_id)
+            while len(self._records) > self.max_records:
+                self._records.popitem(last=False)
+        return artifact_id
+
+    def add_many(self, artifacts: list) -> list:
+        """여러 유물 추가 후 id 목록 반환 (입력 순서 유지)"""
+        return [self.add(artifact) for artifact in artifacts]
+
+    def get(self, artifact_id: str):
+        """id로 유물 조회 (없으면 None)"""
+        with self._lock:
+            record = self._records.get(artifact_id)
+            if record is not None:
+                self._records.move_to_end(artifact_id)
+                return record
+        return self._lookup(artifact_id)
+
+    def get_many(self, artifact_ids: list) -> list:
+        """id 목록에 해당하는 유물 목록 (없는 id는 제외)"""
+        artifacts = (self.get(i) for i in artifact_ids)
+        return [artifact for artifact in artifacts if artifact is not None]
+
+    def __contains__(self, artifact_id: str) -> bool:
+        return self.get(artifact_id) is not None
+
+    def __len__(self) -> int:
+        """보관 중인 API 유물 수 (기본/카탈로그 유물 제외)"""
+        return len(self._records)
+
+
+def _resolve_from_catalog(artifact_id: str):
+    """카탈로그 준비가 끝났으면 유물 색인에서 조회 (요청 스레드에서 색인을 만들지 않음)"""
+    from data.artifacts import catalog_ready
+
+    if not catalog_ready():
+        return None
+    from data.artifact_index import get_artifact_index
+    return get_artifact_index().get(artifact_id)
+
+
+# 싱글톤 인스턴스
+_artifact_store = None
+_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """유물 저장소 인스턴스 반환 (기본 ARTIFACTS와 수집 카탈로그를 조회원으로 사용)"""
+    global _artifact_store
+    if _artifact_store is None:
+        with _store_lock:
+            if _artifact_store is None:
+                from data.artifacts import ARTIFACTS
+
+                base = {artifact["id"]: artifact for artifact in ARTIFACTS.values()}
+                _artifact_store = ArtifactStore(base=base, resolve=_resolve_from_catalog)
+    return _artifact_store
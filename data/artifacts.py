@@ -8,6 +8,114 @@
 
 import os
 import random
+import threading
+
+
+# ============================================================
+# 🧺 수집한 카탈로그에서 유물 가져오기
+# ============================================================
+
+_catalog_cache = None
+_catalog_lock = threading.Lock()
+_catalog_ready = threading.Event()
+_catalog_thread = None
+
+
+def load_harvested_catalog():
+    """
+    로컬에 수집해 둔 카탈로그 로드 (프로세스당 1회)
+
+    python -m services.harvester 로 만든 카탈로그를 mmap 바이너리 형식으로 엽니다.
+    레코드는 접근할 때 하나씩 dict로 만들어집니다.
+
+    Returns:
+        CompactCatalog | list: 유물 시퀀스 (카탈로그가 없으면 빈 리스트)
+    """
+    global _catalog_cache
+    if _catalog_cache is None:
+        with _catalog_lock:
+            if _catalog_cache is None:
+                from config.settings import HARVEST_CONFIG
+                from services.compact_catalog import open_catalog
+                from services.harvester import get_catalog_path
+
+                museum_code = os.getenv("MUSEUM_CODE", "PS01001001")
+                catalog = open_catalog(get_catalog_path(museum_code)) or []
+                if catalog:
+                    print(f"🧺 수집 카탈로그 {len(catalog)}개 로드 ({HARVEST_CONFIG['dir']})")
+                _catalog_cache = catalog
+    return _catalog_cache
+
+
+def _warm_catalog() -> None:
+    """카탈로그, 카탈로그 기반 색인, 추천/검색 색인, 썸네일 캐시를 미리 만들어 둠 (백그라운드 스레드)"""
+    try:
+        from data.artifact_index import get_artifact_index
+        from data.search import get_search_engine
+
+        catalog = load_harvested_catalog()
+        get_artifact_index()
+        get_search_engine()
+    except Exception as e:
+        print(f"⚠️ 카탈로그 미리 불러오기 실패: {e}")
+        return
+    finally:
+        _catalog_ready.set()
+
+    # 썸네일은 색인 준비와 별개로 천천히 채움 (다운로드는 백그라운드 작업)
+    try:
+        from config.settings import IMAGE_CONFIG
+        from services.image_cache import warm_image_cache
+
+        warm_image_cache(list(ARTIFACTS.values()) + catalog[:IMAGE_CONFIG["warm_count"]])
+    except Exception as e:
+        print(f"⚠️ 썸네일 미리 받기 실패: {e}")
+
+    # 추천용 이웃 테이블 (저장된 표만 불러옴, 계산은 python -m data.recommender)
+    try:
+        from data.recommender import warm_recommender
+
+        warm_recommender()
+    except Exception as e:
+        print(f"⚠️ 추천 테이블 준비 실패: {e}")
+
+    # 임베딩 검색 색인 (Gemini 백엔드면 카탈로그 전체 임베딩이 오래 걸릴 수 있음)
+    try:
+        from services.retrieval import warm_retriever
+
+        warm_retriever()
+    except Exception as e:
+        print(f"⚠️ 검색 색인 준비 실패: {e}")
+
+
+def start_catalog_loading() -> None:
+    """카탈로그/유물 색인/검색 색인/썸네일을 백그라운드에서 불러오기 시작 (프로세스당 1회)"""
+    global _catalog_thread
+    if _catalog_thread is None:
+        with _catalog_lock:
+            if _catalog_thread is None:
+                _catalog_thread = threading.Thread(target=_warm_catalog, daemon=True)
+                _catalog_thread.start()
+
+
+def catalog_ready() -> bool:
+    """백그라운드 카탈로그 불러오기 완료 여부"""
+    return _catalog_ready.is_set()
+
+
+def fetch_artifacts_from_catalog(count: int = 10) -> list:
+    """
+    수집한 카탈로그에서 랜덤 유물 선택 (API 호출 없음)
+
+    Returns:
+        list: 유물 목록 사본 (카탈로그가 없으면 빈 리스트)
+    """
+    catalog = load_harvested_catalog()
+    if not catalog:
+        return []
+
+    selected = random.sample(catalog, min(count, len(catalog)))
+    return [dict(artifact) for artifact in selected]
 
 
 # ============================================================
@@ -322,15 +430,16 @@ ARTIFACTS = {
 # ============================================================
 
 def find_artifact(text: str) -> dict | None:
-    """텍스트에서 유물을 찾습니다."""
-    if not text:
-        return None
+    """텍스트에서 유물을 찾습니다. (가장 먼저 언급된 유물)"""
+    found = find_artifacts(text)
+    return found[0] if found else None
+
 
-    for key, artifact in ARTIFACTS.items():
-        if key in text or artifact["name"] in text:
-            return artifact
+def find_artifacts(text: str) -> list:
+    """텍스트에 언급된 모든 유물을 찾습니다. (색인으로 한 번에 검색)"""
+    from data.artifact_index import get_artifact_index
 
-    return None
+    return get_artifact_index().find_all(text)
 
 
 def get_artifact_list() -> list:
@@ -340,29 +449,43 @@ def get_artifact_list() -> list:
 
 def get_artifact_by_id(artifact_id: str) -> dict | None:
     """ID로 유물을 찾습니다."""
-    for artifact in ARTIFACTS.values():
-        if artifact.get("id") == artifact_id:
-            return artifact
-    return None
+    from data.artifact_index import get_artifact_index
+
+    return get_artifact_index().get(artifact_id)
 
 
-def get_random_artifacts(count: int = 10, use_api: bool = True) -> list:
+def get_random_artifacts(
+    count: int = 10,
+    use_api: bool = True,
+    with_quizzes: bool = True,
+    block: bool = True
+) -> list:
     """
     랜덤으로 유물을 선택합니다.
 
     Parameters:
         count: 가져올 유물 개수
         use_api: API 사용 여부 (기본 True - API 우선 사용)
+        with_quizzes: 카탈로그/API 유물에 퀴즈를 미리 붙일지 여부
+        block: False면 카탈로그가 아직 로드 중일 때 기다리지 않고 기본 데이터 사용
 
     Returns:
         list: 유물 목록
     """
-    # API에서 가져오기 시도
-    if use_api:
-        api_artifacts = fetch_artifacts_from_api(count=count)
-        if api_artifacts:
-            # API 유물에 퀴즈 생성
-            return _add_quizzes_to_artifacts(api_artifacts)
+    if block or catalog_ready():
+        # 수집한 카탈로그가 있으면 API 호출 없이 사용
+        catalog_artifacts = fetch_artifacts_from_catalog(count=count)
+        if catalog_artifacts:
+            return _add_quizzes_to_artifacts(catalog_artifacts) if with_quizzes else catalog_artifacts
+
+        # API에서 가져오기 시도
+        if use_api:
+            api_artifacts = fetch_artifacts_from_api(count=count)
+            if api_artifacts:
+                # API 유물에 퀴즈 생성
+                return _add_quizzes_to_artifacts(api_artifacts) if with_quizzes else api_artifacts
+    else:
+        start_catalog_loading()
 
     # 기본: 하드코딩된 데이터 사용
     print("📚 기본 유물 데이터를 사용합니다.")
@@ -371,6 +494,19 @@ def get_random_artifacts(count: int = 10, use_api: bool = True) -> list:
     return [ARTIFACTS[key] for key in selected]
 
 
+def get_random_artifact_ids(count: int = 10, use_api: bool = True, block: bool = True) -> list:
+    """
+    랜덤으로 유물을 선택해 공유 저장소에 넣고 id 목록만 반환합니다.
+
+    세션에는 id만 보관하고, 유물 정보는 get_artifact_store()에서 조회합니다.
+    퀴즈는 퀴즈를 시작할 때 QuizPipeline이 만들므로 여기서는 붙이지 않습니다.
+    """
+    from data.artifact_store import get_artifact_store
+
+    artifacts = get_random_artifacts(count, use_api=use_api, with_quizzes=False, block=block)
+    return get_artifact_store().add_many(artifacts)
+
+
 def _add_quizzes_to_artifacts(artifacts: list) -> list:
     """
     API에서 가져온 유물에 퀴즈 추가
@@ -387,17 +523,21 @@ def _generate_quiz_for_artifact(artifact: dict) -> dict:
     """
     유물에 대한 퀴즈 생성
 
-    Gemini API 사용 가능하면 AI 생성, 아니면 기본 퀴즈
+    퀴즈 은행 → Gemini API 생성 → 기본 퀴즈 순서
     """
+    from data.quiz_bank import get_quiz_bank
+
+    quiz = get_quiz_bank().draw(artifact.get("id"))
+    if quiz:
+        return quiz
+
     try:
-        from services.llm_service import LLMService
-        import os
-
-        api_key = os.getenv("GEMINI_API_KEY", "")
-        if api_key:
-            llm = LLMService(api_key)
-            if llm.model:
-                return _generate_quiz_with_gemini(llm, artifact)
+        from services.llm_service import get_llm_service
+
+        # 프로세스 공유 인스턴스 사용 (유물마다 새로 초기화하지 않음)
+        llm = get_llm_service()
+        if llm.model:
+            return _generate_quiz_with_gemini(llm, artifact)
     except Exception as e:
         print(f"퀴즈 생성 오류: {e}")
 
@@ -407,9 +547,6 @@ def _generate_quiz_for_artifact(artifact: dict) -> dict:
 
 def _generate_quiz_with_gemini(llm, artifact: dict) -> dict:
     """Gemini API로 퀴즈 생성"""
-    import json
-    import re
-
     prompt = f"""다음 유물에 대한 4지선다 퀴즈를 만들어주세요.
 
 유물 정보:
@@ -436,16 +573,20 @@ def _generate_quiz_with_gemini(llm, artifact: dict) -> dict:
 """
 
     try:
-        response = llm.model.generate_content(prompt)
-        response_text = response.text
-
-        # JSON 추출
-        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-        if json_match:
-            quiz = json.loads(json_match.group())
-            # 필수 필드 확인
-            if all(k in quiz for k in ["question", "options", "answer", "explanation"]):
-                return quiz
+        from config.settings import LLM_CACHE_CONFIG
+        from services.llm_scheduler import BACKGROUND
+
+        response_text = llm.generate_text(
+            prompt,
+            variants=LLM_CACHE_CONFIG["quiz_variants"],
+            validate=lambda text: _parse_quiz(text) is not None,
+            priority=BACKGROUND
+        )
+
+        # JSON 추출 + 필수 필드 확인
+        quiz = _parse_quiz(response_text)
+        if quiz:
+            return quiz
     except Exception as e:
         print(f"Gemini 퀴즈 생성 실패: {e}")
 
@@ -469,24 +610,9 @@ def _create_default_quiz(artifact: dict) -> dict:
 # 🎯 동적 퀴즈 생성 (외부 호출용)
 # ============================================================
 
-def generate_dynamic_quiz(artifact: dict, llm_service=None) -> dict:
-    """
-    유물 정보를 바탕으로 동적으로 퀴즈 생성
-
-    Parameters:
-        artifact: 유물 정보 dict
-        llm_service: LLMService 인스턴스 (선택)
-
-    Returns:
-        dict: 퀴즈 정보 (question, options, answer, explanation)
-    """
-    # LLM 서비스가 있으면 동적 생성 시도
-    if llm_service and llm_service.model:
-        try:
-            import json
-            import re
-
-            prompt = f"""다음 유물 정보를 바탕으로 4지선다 퀴즈를 만들어주세요.
+def _build_quiz_prompt(artifact: dict) -> str:
+    """동적 퀴즈 생성 프롬프트"""
+    return f"""다음 유물 정보를 바탕으로 4지선다 퀴즈를 만들어주세요.
 
 유물 정보:
 - 이름: {artifact.get('name', '알 수 없음')}
@@ -512,23 +638,88 @@ def generate_dynamic_quiz(artifact: dict, llm_service=None) -> dict:
 - 기존 하드코딩 퀴즈와 다른 새로운 질문으로 생성
 """
 
-            response = llm_service.model.generate_content(prompt)
-            response_text = response.text
 
-            # JSON 추출
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                quiz = json.loads(json_match.group())
-                if all(k in quiz for k in ["question", "options", "answer", "explanation"]):
-                    print(f"✅ 동적 퀴즈 생성: {artifact.get('name')}")
-                    return quiz
+def _is_valid_quiz(quiz) -> bool:
+    """퀴즈 필수 필드 확인"""
+    return isinstance(quiz, dict) and all(k in quiz for k in ["question", "options", "answer", "explanation"])
 
-        except Exception as e:
-            print(f"⚠️ 동적 퀴즈 생성 실패: {e}")
 
-    # 폴백: 하드코딩된 퀴즈 또는 기본 퀴즈
+def _parse_quiz(response_text: str) -> dict | None:
+    """LLM 응답에서 퀴즈 JSON 추출 (형식이 맞지 않으면 None)"""
+    import json
+    import re
+
+    json_match = re.search(r'\{.*\}', response_text or "", re.DOTALL)
+    if not json_match:
+        return None
+    try:
+        quiz = json.loads(json_match.group())
+    except ValueError:
+        return None
+    return quiz if _is_valid_quiz(quiz) else None
+
+
+def get_fallback_quiz(artifact: dict) -> dict:
+    """하드코딩된 퀴즈 또는 기본 퀴즈"""
     if artifact.get("quiz"):
         print(f"📝 기존 퀴즈 사용: {artifact.get('name')}")
         return artifact["quiz"]
 
     return _create_default_quiz(artifact)
+
+
+def generate_dynamic_quiz(
+    artifact: dict,
+    llm_service=None,
+    timeout: float = None,
+    seen_questions=()
+) -> dict:
+    """
+    유물 정보를 바탕으로 동적으로 퀴즈 생성
+
+    미리 만든 퀴즈 은행에 아직 보지 않은 퀴즈가 있으면 LLM 호출 없이 사용합니다.
+
+    Parameters:
+        artifact: 유물 정보 dict
+        llm_service: LLMService 인스턴스 (선택)
+        timeout: LLM 호출 타임아웃 (초, 선택)
+        seen_questions: 이미 본 질문 목록 (은행에서 제외)
+
+    Returns:
+        dict: 퀴즈 정보 (question, options, answer, explanation)
+    """
+    from data.quiz_bank import get_quiz_bank
+
+    # 퀴즈 은행 우선
+    quiz = get_quiz_bank().draw(artifact.get("id"), seen_questions)
+    if quiz:
+        return quiz
+
+    # LLM 서비스가 있으면 동적 생성 시도
+    if llm_service and llm_service.model:
+        try:
+            from config.settings import LLM_CACHE_CONFIG
+            from services.llm_scheduler import BACKGROUND
+
+            prompt = _build_quiz_prompt(artifact)
+
+            # 같은 유물은 캐시된 퀴즈 풀에서 돌려 사용 (맞춤 해설보다 낮은 우선순위)
+            response_text = llm_service.generate_text(
+                prompt,
+                variants=LLM_CACHE_CONFIG["quiz_variants"],
+                validate=lambda text: _parse_quiz(text) is not None,
+                timeout=timeout,
+                priority=BACKGROUND
+            )
+
+            # JSON 추출
+            quiz = _parse_quiz(response_text)
+            if quiz:
+                print(f"✅ 동적 퀴즈 생성: {artifact.get('name')}")
+                return quiz
+
+        except Exception as e:
+            print(f"⚠️ 동적 퀴즈 생성 실패: {e}")
+
+    # 폴백: 하드코딩된 퀴즈 또는 기본 퀴즈
+    return get_fallback_quiz(artifact)
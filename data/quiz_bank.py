@@ -0,0 +1,244 @@
+"""
+🏦 quiz_bank.py - 미리 생성한 퀴즈 은행
+========================================
+
+유물마다 검증된 퀴즈 K개를 미리 만들어 압축 파일 하나에 저장합니다.
+실행 중에는 은행에서 뽑아 쓰고, 이미 다 본 경우에만 실시간 생성합니다.
+
+빌드: python -m data.quiz_bank --per-artifact 5 [--include-catalog]
+
+파일 형식 (gzip JSON):
+{
+    "version": 1,
+    "built_at": 1700000000,
+    "index": {"유물 id": [시작 위치, 개수], ...},
+    "quizzes": [["질문", ["선택지1", ...], 정답 인덱스, "해설"], ...]
+}
+"""
+
+import gzip
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import QUIZ_BANK_CONFIG
+
+
+BANK_VERSION = 1
+
+
+def validate_quiz(quiz) -> bool:
+    """은행에 넣을 수 있는 퀴즈인지 검증"""
+    if not isinstance(quiz, dict):
+        return False
+
+    question = quiz.get("question")
+    options = quiz.get("options")
+    answer = quiz.get("answer")
+    explanation = quiz.get("explanation")
+
+    return (
+        isinstance(question, str) and question.strip() != ""
+        and isinstance(options, list) and len(options) == 4
+        and all(isinstance(o, str) and o.strip() for o in options)
+        and len(set(options)) == 4
+        and isinstance(answer, int) and 0 <= answer < 4
+        and isinstance(explanation, str) and explanation.strip() != ""
+    )
+
+
+class QuizBank:
+    """유물 id로 색인된 퀴즈 은행 (읽기 전용)"""
+
+    def __init__(self, index: dict = None, quizzes: list = None):
+        self.index = index or {}
+        self.quizzes = quizzes or []
+
+    @classmethod
+    def load(cls, path: str = None) -> "QuizBank":
+        """은행 파일 로드 (없거나 읽을 수 없으면 빈 은행)"""
+        path = path or QUIZ_BANK_CONFIG["path"]
+        if not os.path.exists(path):
+            return cls()
+
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 퀴즈 은행 로드 실패: {e}")
+            return cls()
+
+        if payload.get("version") != BANK_VERSION:
+            print("⚠️ 퀴즈 은행 버전이 달라 사용하지 않습니다.")
+            return cls()
+
+        return cls(payload["index"], payload["quizzes"])
+
+    def save(self, path: str = None) -> None:
+        """은행 파일 저장"""
+        path = path or QUIZ_BANK_CONFIG["path"]
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        payload = {
+            "version": BANK_VERSION,
+            "built_at": int(time.time()),
+            "index": self.index,
+            "quizzes": self.quizzes,
+        }
+        tmp_path = path + ".tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def from_quizzes(cls, quizzes_by_id: dict) -> "QuizBank":
+        """{유물 id: [퀴즈, ...]} 로 은행 생성"""
+        index = {}
+        rows = []
+        for artifact_id, quizzes in quizzes_by_id.items():
+            if not quizzes:
+                continue
+            index[artifact_id] = [len(rows), len(quizzes)]
+            for quiz in quizzes:
+                rows.append([quiz["question"], quiz["options"], quiz["answer"], quiz["explanation"]])
+        return cls(index, rows)
+
+    def __len__(self) -> int:
+        return len(self.quizzes)
+
+    def get_quizzes(self, artifact_id: str) -> list:
+        """유물의 퀴즈 전체"""
+        start, count = self.index.get(artifact_id, (0, 0))
+        return [
+            {"question": q, "options": list(o), "answer": a, "explanation": e}
+            for q, o, a, e in self.quizzes[start:start + count]
+        ]
+
+    def draw(self, artifact_id: str, exclude_questions=()) -> dict | None:
+        """
+        아직 보지 않은 퀴즈 하나를 무작위로 선택
+
+        Returns:
+            dict | None: 퀴즈 (은행에 없거나 모두 본 경우 None)
+        """
+        candidates = [q for q in self.get_quizzes(artifact_id) if q["question"] not in exclude_questions]
+        return random.choice(candidates) if candidates else None
+
+
+# 싱글톤 인스턴스
+_quiz_bank = None
+_bank_lock = threading.Lock()
+
+
+def get_quiz_bank() -> QuizBank:
+    """퀴즈 은행 인스턴스 반환 (프로세스당 1회 로드)"""
+    global _quiz_bank
+    if _quiz_bank is None:
+        with _bank_lock:
+            if _quiz_bank is None:
+                _quiz_bank = QuizBank.load()
+                if len(_quiz_bank):
+                    print(f"🏦 퀴즈 은행 로드: 유물 {len(_quiz_bank.index)}개, 퀴즈 {len(_quiz_bank)}개")
+    return _quiz_bank
+
+
+# ============================================================
+# 🔨 빌드
+# ============================================================
+
+def _build_for_artifact(artifact: dict, llm_service, per_artifact: int) -> list:
+    """유물 하나의 퀴즈 K개 생성 (중복 질문 제외)"""
+    from data.artifacts import _build_quiz_prompt, _parse_quiz
+    from services.llm_scheduler import BATCH
+
+    quizzes = []
+    if validate_quiz(artifact.get("quiz")):
+        quizzes.append(artifact["quiz"])
+
+    attempts = 0
+    max_attempts = per_artifact * QUIZ_BANK_CONFIG["max_attempts"]
+    while len(quizzes) < per_artifact and attempts < max_attempts:
+        attempts += 1
+
+        # 이미 만든 질문을 알려줘서 다른 관점의 문제를 받음
+        prompt = _build_quiz_prompt(artifact)
+        if quizzes:
+            asked = "\n".join(f"- {q['question']}" for q in quizzes)
+            prompt += f"\n이미 출제된 질문 (이와 겹치지 않게 출제):\n{asked}\n"
+
+        try:
+            # 같은 프롬프트로 다시 시도할 수 있으므로 캐시된 응답(무효/중복)을 재사용하지 않음
+            quiz = _parse_quiz(llm_service.generate_text(prompt, priority=BATCH, use_cache=False))
+        except Exception as e:
+            print(f"⚠️ 퀴즈 생성 실패 ({artifact.get('name')}): {e}")
+            continue
+
+        if validate_quiz(quiz) and quiz["question"] not in {q["question"] for q in quizzes}:
+            quizzes.append(quiz)
+
+    return quizzes
+
+
+def build_quiz_bank(
+    artifacts: list,
+    llm_service,
+    per_artifact: int = None,
+    path: str = None,
+    max_workers: int = None
+) -> QuizBank:
+    """
+    유물 목록으로 퀴즈 은행을 만들어 저장
+
+    Parameters:
+        artifacts: 유물 정보 dict 목록
+        llm_service: LLMService 인스턴스
+        per_artifact: 유물당 퀴즈 개수
+        path: 저장 경로
+        max_workers: 동시 생성 유물 수
+    """
+    per_artifact = per_artifact or QUIZ_BANK_CONFIG["per_artifact"]
+    max_workers = max_workers or QUIZ_BANK_CONFIG["max_workers"]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda a: _build_for_artifact(a, llm_service, per_artifact), artifacts)
+        quizzes_by_id = {artifact["id"]: quizzes for artifact, quizzes in zip(artifacts, results)}
+
+    bank = QuizBank.from_quizzes(quizzes_by_id)
+    bank.save(path)
+
+    short = [a["name"] for a in artifacts if len(quizzes_by_id[a["id"]]) < per_artifact]
+    print(f"✅ 퀴즈 은행 저장: 유물 {len(bank.index)}개, 퀴즈 {len(bank)}개")
+    if short:
+        print(f"⚠️ 목표 개수를 채우지 못한 유물 {len(short)}개: {', '.join(short[:10])}")
+    return bank
+
+
+if __name__ == "__main__":
+    import argparse
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from data.artifacts import ARTIFACTS, load_harvested_catalog
+    from services.llm_service import get_llm_service
+
+    parser = argparse.ArgumentParser(description="퀴즈 은행 빌드")
+    parser.add_argument("--per-artifact", type=int, default=None, help="유물당 퀴즈 개수")
+    parser.add_argument("--include-catalog", action="store_true", help="수집한 카탈로그 유물 포함")
+    parser.add_argument("--limit", type=int, default=None, help="카탈로그 유물 최대 개수")
+    parser.add_argument("--output", default=None, help="저장 경로")
+    args = parser.parse_args()
+
+    llm = get_llm_service()
+    if not llm.model:
+        print("⚠️ .env 파일에 GEMINI_API_KEY를 설정해주세요.")
+        exit(1)
+
+    targets = list(ARTIFACTS.values())
+    if args.include_catalog:
+        catalog = load_harvested_catalog()
+        targets += catalog[:args.limit] if args.limit else catalog
+
+    build_quiz_bank(targets, llm, per_artifact=args.per_artifact, path=args.output)
@@ -0,0 +1,320 @@
+"""
+🎯 recommender.py - 관련 유물 추천
+==================================
+
+유물마다 가까운 이웃 유물 표를 미리 계산해 두고,
+방문자의 퀴즈 결과(특히 틀린 유물)로 다음 선택 목록을 고릅니다.
+요청 시에는 LLM 호출이나 유사도 계산 없이 표만 조회합니다.
+
+- 유사도: 시대 / 재질 / 지정 구분 일치 + 설명 임베딩 코사인 유사도
+- 저장: 이웃 번호(int32)와 점수(float16) 행렬을 .npy로 저장, mmap으로 로드
+- 계산은 오프라인 단계 (python -m data.recommender), 서버는 저장된 표만 불러옴
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+
+import numpy as np
+
+from config.settings import RECOMMENDER_CONFIG
+from data.search import facet_value
+
+
+# 이웃 계산에 쓰는 필드 (retrieval.artifact_text와 같은 필드 + id)
+TABLE_FIELDS = ("id", "name", "period", "material", "designation", "gallery", "description")
+
+
+def _designation_group(value: str) -> str:
+    """지정 구분 (예: "국보 제78호" → "국보")"""
+    match = re.match(r"\s*(국보|보물|사적|중요민속문화재|등록문화재)", value or "")
+    return match.group(1) if match else facet_value(value)
+
+
+def _codes(values: list) -> np.ndarray:
+    """문자열 값을 정수 코드로 (빈 값은 -1, 서로 일치하지 않음)"""
+    table = {}
+    codes = np.empty(len(values), dtype=np.int32)
+    for i, value in enumerate(values):
+        codes[i] = table.setdefault(value, len(table)) if value else -1
+    return codes
+
+
+def _field_rows(artifacts=None):
+    """
+    TABLE_FIELDS 값 튜플 iterable
+
+    artifacts를 주지 않으면 유물 색인에서 스트리밍합니다
+    (mmap 카탈로그 레코드를 dict로 만들지 않음).
+    """
+    if artifacts is None:
+        from data.artifact_index import get_artifact_index
+        return get_artifact_index().iter_fields(TABLE_FIELDS)
+    return (tuple(a.get(field, "") or "" for field in TABLE_FIELDS) for a in artifacts)
+
+
+def _hash_update(digest, row: tuple) -> None:
+    for value in row:
+        digest.update(value.encode("utf-8"))
+        digest.update(b"\0")
+
+
+def _catalog_hash(artifacts=None) -> str:
+    """유사도에 쓰이는 필드가 바뀌면 달라지는 카탈로그 해시"""
+    digest = hashlib.sha256()
+    for row in _field_rows(artifacts):
+        _hash_update(digest, row)
+    return digest.hexdigest()[:16]
+
+
+def _save_atomic(path: str, write) -> None:
+    """임시 파일에 write(f)로 쓴 뒤 교체 (읽는 쪽은 이전 파일이나 완성된 파일만 봄)"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def _chunk_size(n: int, memory_mb: float) -> int:
+    """
+    한 번에 계산할 행 수 (메모리 예산 기준)
+
+    행 하나당 유사도(float32) + 후보 번호(int64) + 일치 마스크(bool) ≈ n × 16바이트
+    """
+    per_row = max(1, n * 16)
+    return max(1, int(memory_mb * 1024 * 1024 // per_row))
+
+
+def build_neighbor_table(artifacts=None, k: int = None, out_dir: str = None, memory_mb: float = None) -> str:
+    """
+    이웃 테이블 계산 후 저장 (오프라인 단계)
+
+    유물을 한 번만 훑으며 필드 값만 모으고, 전체 유사도 행렬을 한 번에 만들지 않고
+    memory_mb 안에 들어가는 행 수씩 계산합니다.
+
+    Parameters:
+        artifacts: 유물 dict iterable (기본: 유물 색인에서 스트리밍)
+        k: 유물당 이웃 수 (기본: RECOMMENDER_CONFIG["neighbors"])
+        out_dir: 저장 디렉터리 (기본: RECOMMENDER_CONFIG["dir"])
+        memory_mb: 유사도 계산 묶음의 메모리 예산 (기본: RECOMMENDER_CONFIG["memory_budget_mb"])
+
+    Returns:
+        str: 저장 디렉터리
+    """
+    from services.retrieval import artifact_text, local_embed
+
+    k = k or RECOMMENDER_CONFIG["neighbors"]
+    out_dir = out_dir or RECOMMENDER_CONFIG["dir"]
+    memory_mb = memory_mb or RECOMMENDER_CONFIG["memory_budget_mb"]
+    weights = RECOMMENDER_CONFIG["weights"]
+
+    ids, periods, materials, designations = [], [], [], []
+    vector_chunks, texts = [], []
+    digest = hashlib.sha256()
+
+    for row in _field_rows(artifacts):
+        _hash_update(digest, row)
+        fields = dict(zip(TABLE_FIELDS, row))
+        ids.append(fields["id"])
+        periods.append(facet_value(fields["period"]))
+        materials.append(facet_value(fields["material"]))
+        designations.append(_designation_group(fields["designation"]))
+        texts.append(artifact_text(fields))
+        if len(texts) >= 1024:
+            vector_chunks.append(local_embed(texts))
+            texts = []
+    if texts:
+        vector_chunks.append(local_embed(texts))
+
+    n = len(ids)
+    if n < 2:
+        raise ValueError("이웃 테이블을 만들려면 유물이 2개 이상 필요합니다.")
+    k = max(1, min(k, n - 1))
+
+    period = _codes(periods)
+    material = _codes(materials)
+    designation = _codes(designations)
+    vectors = np.concatenate(vector_chunks)
+    del periods, materials, designations, vector_chunks
+
+    neighbors = np.zeros((n, k), dtype=np.int32)
+    scores = np.zeros((n, k), dtype=np.float16)
+    chunk_size = _chunk_size(n, memory_mb)
+
+    for start in range(0, n, chunk_size):
+        rows = slice(start, min(start + chunk_size, n))
+
+        sim = vectors[rows] @ vectors.T
+        sim *= weights["description"]
+        for codes, weight in ((period, weights["period"]), (material, weights["material"]), (designation, weights["designation"])):
+            block = codes[rows, None]
+            np.add(sim, weight, out=sim, where=(block == codes[None, :]) & (block >= 0))
+
+        # 자기 자신 제외
+        local_rows = np.arange(sim.shape[0])
+        sim[local_rows, local_rows + start] = -np.inf
+
+        top = np.argpartition(sim, n - k, axis=1)[:, n - k:]
+        top_scores = np.take_along_axis(sim, top, axis=1)
+        del sim
+        order = np.argsort(-top_scores, axis=1)
+        neighbors[rows] = np.take_along_axis(top, order, axis=1)
+        scores[rows] = np.take_along_axis(top_scores, order, axis=1)
+
+    # 파일마다 임시 파일에 쓴 뒤 교체 (해시가 든 ids.json을 마지막에 바꿔서
+    # 중간에 멈추면 해시가 맞지 않아 다음 빌드 때 다시 계산됨)
+    os.makedirs(out_dir, exist_ok=True)
+    _save_atomic(os.path.join(out_dir, "neighbors.npy"), lambda f: np.save(f, neighbors))
+    _save_atomic(os.path.join(out_dir, "scores.npy"), lambda f: np.save(f, scores))
+    meta = json.dumps({"catalog_hash": digest.hexdigest()[:16], "ids": ids}, ensure_ascii=False)
+    _save_atomic(os.path.join(out_dir, "ids.json"), lambda f: f.write(meta.encode("utf-8")))
+
+    print(f"🎯 이웃 테이블 저장: 유물 {n}개 × 이웃 {k}개 ({out_dir})")
+    return out_dir
+
+
+class Recommender:
+    """이웃 테이블 기반 추천기"""
+
+    def __init__(self, ids: list, neighbors: np.ndarray, scores: np.ndarray, catalog_hash: str = ""):
+        self.ids = ids
+        self.catalog_hash = catalog_hash
+        self.neighbors = neighbors
+        self.scores = scores
+        self._row_of = {artifact_id: row for row, artifact_id in enumerate(ids)}
+
+    @classmethod
+    def load(cls, table_dir: str = None) -> "Recommender | None":
+        """저장된 이웃 테이블을 mmap으로 로드 (없으면 None)"""
+        table_dir = table_dir or RECOMMENDER_CONFIG["dir"]
+        try:
+            with open(os.path.join(table_dir, "ids.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            neighbors = np.load(os.path.join(table_dir, "neighbors.npy"), mmap_mode="r")
+            scores = np.load(os.path.join(table_dir, "scores.npy"), mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        return cls(meta["ids"], neighbors, scores, meta.get("catalog_hash", ""))
+
+    def neighbors_of(self, artifact_id: str) -> list:
+        """[(이웃 id, 점수), ...]"""
+        row = self._row_of.get(artifact_id)
+        if row is None:
+            return []
+        return [(self.ids[j], float(s)) for j, s in zip(self.neighbors[row], self.scores[row])]
+
+    def recommend(self, answers: list, count: int = 10, exclude_ids=()) -> list:
+        """
+        퀴즈 결과로 다음 유물 id 목록 추천
+
+        틀린 유물의 이웃에 더 큰 가중치를 주고, 이미 푼 유물은 제외합니다.
+        추천이 모자라면 나머지는 무작위로 채웁니다.
+
+        Parameters:
+            answers: st.session_state.answers 형식 ({"artifact_id", "is_correct", ...})
+            count: 추천 개수
+            exclude_ids: 제외할 유물 id
+        """
+        seen = set(exclude_ids) | {a.get("artifact_id") for a in answers}
+        totals = {}
+
+        for answer in answers:
+            weight = RECOMMENDER_CONFIG["correct_weight"] if answer.get("is_correct") else RECOMMENDER_CONFIG["wrong_weight"]
+            for neighbor_id, score in self.neighbors_of(answer.get("artifact_id")):
+                if neighbor_id not in seen:
+                    totals[neighbor_id] = totals.get(neighbor_id, 0.0) + weight * score
+
+        ranked = sorted(totals, key=totals.get, reverse=True)[:count]
+
+        if len(ranked) < count:
+            rest = [i for i in self.ids if i not in seen and i not in totals]
+            ranked += random.sample(rest, min(count - len(ranked), len(rest)))
+
+        return ranked
+
+
+# 싱글톤 인스턴스 (백그라운드 준비 작업이 채움)
+_recommender = None
+_recommender_lock = threading.Lock()
+
+
+def warm_recommender() -> None:
+    """
+    저장된 이웃 테이블 불러오기 (카탈로그 백그라운드 준비 스레드에서 호출)
+
+    서버에서는 계산하지 않습니다. 표가 없으면 추천 없이 무작위 목록을 쓰고,
+    표를 만들거나 갱신하려면 python -m data.recommender 를 실행합니다.
+    """
+    global _recommender
+    from data.artifact_index import get_artifact_index
+
+    with _recommender_lock:
+        recommender = Recommender.load()
+        if recommender is None:
+            print("⚠️ 추천 테이블 없음 - python -m data.recommender 로 생성하세요")
+        elif len(recommender.ids) != len(get_artifact_index()):
+            print("⚠️ 추천 테이블이 카탈로그와 다릅니다 - python -m data.recommender 로 갱신하세요")
+        _recommender = recommender
+
+
+def build_recommender(force: bool = False) -> str | None:
+    """
+    카탈로그가 바뀌었으면 이웃 테이블 다시 계산 (오프라인 단계)
+
+    Returns:
+        str | None: 새로 계산했으면 저장 디렉터리, 최신이면 None
+    """
+    recommender = Recommender.load()
+    if not force and recommender is not None and recommender.catalog_hash == _catalog_hash():
+        print("✅ 추천 테이블이 최신입니다")
+        return None
+    return build_neighbor_table()
+
+
+def get_recommender() -> Recommender | None:
+    """준비된 추천기 반환 (요청 스레드에서 테이블을 계산하지 않음, 준비 전이면 None)"""
+    return _recommender
+
+
+def recommend_artifact_ids(answers: list, count: int = 10) -> list:
+    """
+    퀴즈 결과로 다음 선택 목록을 골라 공유 저장소에 넣고 id 목록 반환
+
+    추천기가 아직 준비되지 않았거나 추천이 count개보다 적으면 랜덤 유물로 채웁니다.
+
+    Returns:
+        list: 유물 id 목록
+    """
+    from data.artifact_index import get_artifact_index
+    from data.artifact_store import get_artifact_store
+    from data.artifacts import get_random_artifact_ids
+
+    ids = []
+    recommender = get_recommender()
+    if recommender is not None:
+        index = get_artifact_index()
+        artifacts = [index.get(i) for i in recommender.recommend(answers, count)]
+        ids = get_artifact_store().add_many([a for a in artifacts if a])
+
+    if len(ids) < count:
+        answered = {a.get("artifact_id") for a in answers}
+        for artifact_id in get_random_artifact_ids(count + len(answered), block=False):
+            if len(ids) >= count:
+                break
+            if artifact_id not in ids and artifact_id not in answered:
+                ids.append(artifact_id)
+
+    return ids
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="추천용 이웃 테이블 계산")
+    parser.add_argument("--force", action="store_true", help="카탈로그가 같아도 다시 계산")
+    args = parser.parse_args()
+
+    build_recommender(force=args.force)
@@ -0,0 +1,226 @@
+"""
+🔍 search.py - 유물 검색 엔진
+==============================
+
+유물 카탈로그에 대한 로컬 역색인입니다. e뮤지엄 API를 거치지 않고 검색합니다.
+
+- 한글은 글자 2-gram(색인에는 한 글자도 함께), 영문/숫자는 단어 단위로 토큰화
+- 필드 가중치를 적용한 BM25 순위
+- 시대/재질/지정 구분 패싯 필터와 페이지 나누기
+"""
+
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+
+from config.settings import SEARCH_CONFIG
+
+
+FACET_FIELDS = ("period", "material", "designation")
+
+_HANGUL_RUN = re.compile(r"[가-힣]+")
+_WORD = re.compile(r"[a-z0-9]+")
+_PAREN = re.compile(r"\s*\(.*?\)")
+
+
+def tokenize(text: str, unigrams: bool = False) -> list:
+    """
+    검색용 토큰화
+
+    한글은 띄어쓰기나 조사와 관계없이 찾을 수 있도록 글자 2-gram으로,
+    영문/숫자는 소문자 단어로 나눕니다. 한 글자 한글은 그대로 토큰이 됩니다.
+    unigrams=True면 한글 글자 하나하나도 토큰으로 넣습니다 (색인용 -
+    "탑", "검" 같은 한 글자 검색어가 "석탑", "청동검"과 일치하도록).
+    """
+    if not text:
+        return []
+
+    text = text.lower()
+    tokens = []
+
+    for run in _HANGUL_RUN.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+            if unigrams:
+                tokens.extend(run)
+
+    tokens.extend(_WORD.findall(text))
+    return tokens
+
+
+def facet_value(value: str) -> str:
+    """패싯 값 정규화 (괄호 속 세부 정보 제거, 예: "고려 (12세기)" → "고려")"""
+    return _PAREN.sub("", value or "").strip()
+
+
+class SearchEngine:
+    """유물 역색인 + BM25"""
+
+    def __init__(self, artifacts=None, field_weights: dict = None, lookup=None):
+        self.field_weights = field_weights or SEARCH_CONFIG["field_weights"]
+        self.k1 = SEARCH_CONFIG["k1"]
+        self.b = SEARCH_CONFIG["b"]
+
+        self._ids = []                        # 문서 번호 → 유물 id
+        self._names = []                      # 문서 번호 → 이름 (검색어 없을 때 정렬용)
+        self._lookup = lookup
+        self._doc_lengths = []
+        self._postings = defaultdict(list)    # 토큰 → [(문서 번호, 가중 빈도)]
+        self._facets = []                     # 문서별 패싯 값
+        self._facet_counts = {}               # 필터 없는 패싯 개수 (색인할 때 한 번 계산)
+        self._avg_length = 0.0
+
+        if artifacts:
+            self.build(artifacts, lookup)
+
+    def build(self, artifacts, lookup=None) -> None:
+        """
+        색인 생성
+
+        Parameters:
+            artifacts: 유물 iterable (한 번만 훑음)
+            lookup: 유물 id → 유물 조회 함수. 주면 유물 dict를 보관하지 않고
+                    결과를 만들 때만 조회합니다 (mmap 카탈로그용).
+        """
+        self._ids = []
+        self._names = []
+        self._doc_lengths = []
+        self._postings = defaultdict(list)
+        self._facets = []
+        docs = {} if lookup is None else None
+
+        for doc_id, artifact in enumerate(artifacts):
+            self._ids.append(artifact["id"])
+            self._names.append(artifact.get("name", ""))
+            if docs is not None:
+                docs[artifact["id"]] = artifact
+
+            weighted = Counter()
+            for field, weight in self.field_weights.items():
+                for token in tokenize(artifact.get(field, ""), unigrams=True):
+                    weighted[token] += weight
+
+            for token, tf in weighted.items():
+                self._postings[token].append((doc_id, tf))
+
+            self._doc_lengths.append(sum(weighted.values()))
+            self._facets.append({field: facet_value(artifact.get(field, "")) for field in FACET_FIELDS})
+
+        self._lookup = lookup or docs.get
+        self._avg_length = (sum(self._doc_lengths) / len(self._ids)) if self._ids else 0.0
+        self._facet_counts = {
+            field: Counter(facets[field] for facets in self._facets if facets[field]).most_common()
+            for field in FACET_FIELDS
+        }
+
+    def facets(self, field: str, filters: dict = None) -> list:
+        """
+        패싯 값과 개수 (다른 필터를 적용한 상태 기준)
+
+        다른 필터가 없으면 색인할 때 계산해 둔 개수를 반환합니다 (문서를 훑지 않음).
+
+        Returns:
+            list: [(값, 개수), ...] 개수 내림차순
+        """
+        other_filters = {k: v for k, v in (filters or {}).items() if k != field and v}
+        if not other_filters and field in self._facet_counts:
+            return list(self._facet_counts[field])
+        counts = Counter(
+            facets[field]
+            for doc_id, facets in enumerate(self._facets)
+            if facets[field] and self._matches(doc_id, other_filters)
+        )
+        return counts.most_common()
+
+    def _matches(self, doc_id: int, filters: dict) -> bool:
+        """패싯 필터 통과 여부 (값이 목록이면 그중 하나와 일치)"""
+        facets = self._facets[doc_id]
+        for field, wanted in filters.items():
+            if not wanted:
+                continue
+            values = wanted if isinstance(wanted, (list, tuple, set)) else (wanted,)
+            if facets.get(field) not in {facet_value(v) for v in values}:
+                return False
+        return True
+
+    def _score(self, query: str) -> dict:
+        """BM25 점수 {문서 번호: 점수}"""
+        n_docs = len(self._ids)
+        scores = defaultdict(float)
+
+        for token in set(tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+
+            df = len(postings)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            for doc_id, tf in postings:
+                norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / (self._avg_length or 1))
+                scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return scores
+
+    def search(self, query: str = "", filters: dict = None, page: int = 1, page_size: int = None) -> dict:
+        """
+        유물 검색
+
+        Parameters:
+            query: 검색어 (비우면 필터만 적용, 이름순)
+            filters: 패싯 필터 (예: {"period": "고려", "designation": ["국보 제116호"]})
+            page: 페이지 번호 (1부터)
+            page_size: 페이지당 결과 수
+
+        Returns:
+            dict: {"total", "page", "page_size", "results": [{"artifact", "score"}, ...]}
+        """
+        filters = filters or {}
+        page_size = page_size or SEARCH_CONFIG["page_size"]
+        page = max(1, page)
+
+        if query and query.strip():
+            scores = self._score(query)
+            ranked = sorted(
+                ((doc_id, score) for doc_id, score in scores.items() if self._matches(doc_id, filters)),
+                key=lambda item: -item[1]
+            )
+        else:
+            ranked = sorted(
+                ((doc_id, 0.0) for doc_id in range(len(self._ids)) if self._matches(doc_id, filters)),
+                key=lambda item: self._names[item[0]]
+            )
+
+        start = (page - 1) * page_size
+        return {
+            "total": len(ranked),
+            "page": page,
+            "page_size": page_size,
+            "results": [
+                {"artifact": self._lookup(self._ids[doc_id]), "score": round(score, 4)}
+                for doc_id, score in ranked[start:start + page_size]
+            ],
+        }
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+# 싱글톤 인스턴스
+_search_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_search_engine() -> SearchEngine:
+    """검색 엔진 반환 (처음 호출 시 유물 색인의 전체 카탈로그로 생성)"""
+    global _search_engine
+    if _search_engine is None:
+        with _engine_lock:
+            if _search_engine is None:
+                from data.artifact_index import get_artifact_index
+
+                index = get_artifact_index()
+                _search_engine = SearchEngine(index.artifacts(), lookup=index.get)
+    return _search_engine
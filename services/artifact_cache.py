@@ -0,0 +1,215 @@
+"""
+🗄️ artifact_cache.py - 유물 응답 로컬 캐시
+==========================================
+
+e뮤지엄 API 응답을 SQLite 파일 하나에 저장하는 영구 캐시입니다.
+거의 바뀌지 않는 유물 정보를 세션/재시작과 관계없이 재사용합니다.
+
+- TTL 만료 (신선 → 오래됨 → 삭제)
+- 최대 항목 수 초과 시 LRU 제거
+- 조회 실패 ID 네거티브 캐싱
+- stale-while-revalidate: 오래된 값은 즉시 반환하고 백그라운드에서 갱신
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from config.settings import CACHE_CONFIG
+
+
+# 캐시 조회 상태
+FRESH = "fresh"
+STALE = "stale"
+NEGATIVE = "negative"
+MISSING = "missing"
+
+
+class ArtifactCache:
+    """SQLite 기반 유물 응답 캐시"""
+
+    def __init__(
+        self,
+        path: str = None,
+        ttl: int = None,
+        stale_ttl: int = None,
+        negative_ttl: int = None,
+        max_entries: int = None
+    ):
+        self.path = path or os.path.join(CACHE_CONFIG["dir"], CACHE_CONFIG["artifact_db"])
+        self.ttl = ttl if ttl is not None else CACHE_CONFIG["ttl"]
+        self.stale_ttl = stale_ttl if stale_ttl is not None else CACHE_CONFIG["stale_ttl"]
+        self.negative_ttl = negative_ttl if negative_ttl is not None else CACHE_CONFIG["negative_ttl"]
+        self.max_entries = max_entries or CACHE_CONFIG["max_entries"]
+
+        self._lock = threading.Lock()
+        self._refreshing = set()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+        with self._lock:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    value TEXT,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON entries(accessed_at)")
+            self._conn.commit()
+
+    def lookup(self, key: str) -> tuple:
+        """
+        캐시 조회
+
+        Returns:
+            tuple: (상태, 값) - 상태는 FRESH / STALE / NEGATIVE / MISSING
+        """
+        state, value, _ = self.entry(key)
+        return state, value
+
+    def entry(self, key: str) -> tuple:
+        """
+        lookup과 같지만 저장 시각도 반환 (다른 저장소로 옮길 때 나이를 유지하기 위함)
+
+        Returns:
+            tuple: (상태, 값, 저장 시각) - 없으면 저장 시각은 None
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return MISSING, None, None
+
+            value, stored_at = row
+            age = now - stored_at
+
+            # 네거티브 항목: 짧은 TTL 동안만 유효
+            if value is None:
+                if age < self.negative_ttl:
+                    return NEGATIVE, None, stored_at
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                return MISSING, None, None
+
+            if age >= self.ttl + self.stale_ttl:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                return MISSING, None, None
+
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+
+        state = FRESH if age < self.ttl else STALE
+        return state, json.loads(value), stored_at
+
+    def set(self, key: str, value, stored_at: float = None) -> None:
+        """
+        값 저장 (None이면 네거티브 항목으로 저장)
+
+        stored_at을 주면 그 시각에 저장된 것으로 기록합니다 (TTL을 새로 시작하지 않음).
+        """
+        now = time.time()
+        payload = None if value is None else json.dumps(value, ensure_ascii=False)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, payload, stored_at or now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        """항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목 제거 (lock 안에서 호출)"""
+        count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,)
+            )
+
+    def get_or_fetch(self, key: str, fetch_fn):
+        """
+        캐시 우선 조회
+
+        - FRESH: 캐시 값 반환
+        - STALE: 캐시 값을 바로 반환하고 백그라운드에서 fetch_fn으로 갱신
+        - NEGATIVE: None 반환 (API 호출 없음)
+        - MISSING: fetch_fn 호출 후 저장 (None 결과는 네거티브 캐싱)
+
+        fetch_fn에서 발생한 예외(네트워크 오류 등)는 캐싱하지 않고 그대로 전달합니다.
+        """
+        state, value = self.lookup(key)
+
+        if state == FRESH:
+            return value
+        if state == NEGATIVE:
+            return None
+        if state == STALE:
+            self._refresh_in_background(key, fetch_fn)
+            return value
+
+        value = fetch_fn()
+        self.set(key, value)
+        return value
+
+    def _refresh_in_background(self, key: str, fetch_fn) -> None:
+        """오래된 항목을 백그라운드 스레드에서 갱신 (키당 하나만 실행)"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                value = fetch_fn()
+                # 갱신 실패(None)로 기존 값을 덮어쓰지 않음
+                if value is not None:
+                    self.set(key, value)
+            except Exception as e:
+                print(f"⚠️ 캐시 갱신 실패 ({key}): {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+
+# 싱글톤 인스턴스
+_artifact_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_artifact_cache() -> ArtifactCache:
+    """유물 캐시 인스턴스 반환"""
+    global _artifact_cache
+    if _artifact_cache is None:
+        with _cache_lock:
+            if _artifact_cache is None:
+                _artifact_cache = ArtifactCache()
+    return _artifact_cache
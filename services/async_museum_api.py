@@ -0,0 +1,390 @@
+"""
+⚡ async_museum_api.py - 국립중앙박물관 API 비동기 클라이언트
+=============================================================
+
+MuseumAPIService와 같은 조회 메서드를 asyncio 코루틴으로 제공합니다.
+수집/배치 작업이 스레드 없이 이벤트 루프 하나에서 수천 개 ID를 조회할 때 사용합니다.
+
+- aiohttp 연결 풀 (keep-alive) 하나를 모든 요청이 공유
+- 세마포어로 동시 요청 수 제한
+- 응답 파싱/표준 형식 변환은 MuseumAPIService 코드를 그대로 재사용
+- 유물 응답 캐시, museum_api 차단기도 동기 클라이언트와 공유
+
+사용 예:
+    async with AsyncMuseumAPIService() as api:
+        artifacts = await api.fetch_artifacts_by_ids(ids)
+"""
+
+import asyncio
+import os
+import time
+
+import aiohttp
+
+from config.settings import MUSEUM_API_CONFIG
+from services.artifact_cache import FRESH, NEGATIVE, STALE, ArtifactCache, get_artifact_cache
+from services.circuit_breaker import CircuitOpenError, get_breaker
+from services.museum_api import MuseumAPIError, MuseumAPIService
+
+
+# 재시도할 HTTP 상태 (동기 세션의 Retry 설정과 같음)
+RETRY_STATUSES = (500, 502, 503, 504)
+
+
+class AsyncMuseumAPIService:
+    """국립중앙박물관 e뮤지엄 API 비동기 서비스"""
+
+    BASE_URL = MuseumAPIService.BASE_URL
+    NATIONAL_MUSEUM_CODE = MuseumAPIService.NATIONAL_MUSEUM_CODE
+
+    def __init__(
+        self,
+        service_key: str = None,
+        cache: ArtifactCache = None,
+        use_cache: bool = True,
+        breaker=None,
+        concurrency: int = None
+    ):
+        self.service_key = service_key or os.getenv("MUSEUM_API_KEY", "")
+        self.cache = (cache or get_artifact_cache()) if use_cache else None
+        self.breaker = breaker or get_breaker("museum_api")
+        self.concurrency = concurrency or MUSEUM_API_CONFIG["async_concurrency"]
+
+        # 파싱/변환 전용 (HTTP 요청에는 쓰지 않음)
+        self._parser = MuseumAPIService(self.service_key, cache=self.cache, use_cache=use_cache, breaker=self.breaker)
+
+        self._session = None
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._refreshing = {}
+
+    # ============================================================
+    # 🔌 세션
+    # ============================================================
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """연결 풀 세션 반환 (실행 중인 이벤트 루프 안에서 처음 호출할 때 생성)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.concurrency)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Connection": "keep-alive"}
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """연결 풀 닫기 (진행 중인 백그라운드 갱신은 취소)"""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _get(self, url: str, params: dict, timeout: float = None) -> tuple:
+        """
+        세마포어 안에서 GET 요청 후 본문까지 읽기
+
+        5xx/연결 오류는 지수 백오프로 재시도하며, 차단기가 열려 있으면
+        요청 없이 바로 aiohttp.ClientConnectionError를 던집니다.
+        차단기 자리와 응답 시간 측정은 세마포어를 얻은 뒤 시작하고(대기열 시간 제외),
+        재시도를 포함한 호출 하나당 결과를 한 번만 기록합니다 (예상하지 못한 예외는 실패).
+
+        Returns:
+            tuple: (HTTP 상태 코드, 본문 문자열, 요청 URL)
+        """
+        client_timeout = aiohttp.ClientTimeout(
+            connect=MUSEUM_API_CONFIG["connect_timeout"],
+            sock_read=timeout or MUSEUM_API_CONFIG["timeout"]
+        )
+        max_retries = MUSEUM_API_CONFIG["max_retries"]
+        allowed = False
+
+        try:
+            for attempt in range(max_retries + 1):
+                status = None
+                async with self._semaphore:
+                    if not allowed:
+                        try:
+                            self.breaker.allow()
+                        except CircuitOpenError as e:
+                            raise aiohttp.ClientConnectionError(str(e)) from e
+                        allowed = True
+
+                    started = time.monotonic()
+                    try:
+                        async with self._get_session().get(url, params=params, timeout=client_timeout) as response:
+                            status, text, request_url = response.status, await response.text(), str(response.url)
+                    except (aiohttp.ClientError, asyncio.TimeoutError):
+                        if attempt == max_retries:
+                            allowed = False
+                            self.breaker.record_failure()
+                            raise
+                    elapsed = time.monotonic() - started
+
+                if status is not None:
+                    if status < 500:
+                        allowed = False
+                        self.breaker.record_success(elapsed)
+                        return status, text, request_url
+                    if status not in RETRY_STATUSES or attempt == max_retries:
+                        allowed = False
+                        self.breaker.record_failure()
+                        return status, text, request_url
+
+                await asyncio.sleep(MUSEUM_API_CONFIG["backoff_factor"] * (2 ** attempt))
+        except asyncio.CancelledError:
+            # 결과를 기록하기 전에 취소되면 차단기 자리만 돌려줌
+            if allowed:
+                self.breaker.release()
+            raise
+        except Exception:
+            # 그 밖의 오류(본문 디코딩 실패, 닫힌 세션 등)도 실패로 기록해
+            # 시험 호출 자리가 잡힌 채로 남지 않게 함
+            if allowed:
+                self.breaker.record_failure()
+            raise
+
+    # ============================================================
+    # 🗄️ 캐시
+    # ============================================================
+
+    async def _cached(self, key: str, fetch_fn):
+        """
+        ArtifactCache.get_or_fetch의 비동기 버전 (fetch_fn: 코루틴 함수)
+
+        SQLite 조회/저장은 스레드로 넘겨 이벤트 루프를 막지 않고,
+        오래된 항목은 바로 반환한 뒤 같은 루프의 태스크로 갱신합니다.
+        """
+        if self.cache is None:
+            return await fetch_fn()
+
+        state, value = await asyncio.to_thread(self.cache.lookup, key)
+
+        if state == FRESH:
+            return value
+        if state == NEGATIVE:
+            return None
+        if state == STALE:
+            self._refresh_in_background(key, fetch_fn)
+            return value
+
+        value = await fetch_fn()
+        await asyncio.to_thread(self.cache.set, key, value)
+        return value
+
+    def _refresh_in_background(self, key: str, fetch_fn) -> None:
+        """오래된 항목을 백그라운드 태스크로 갱신 (키당 하나만 실행)"""
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                value = await fetch_fn()
+                # 갱신 실패(None)로 기존 값을 덮어쓰지 않음
+                if value is not None:
+                    await asyncio.to_thread(self.cache.set, key, value)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ 캐시 갱신 실패 ({key}): {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.get_running_loop().create_task(refresh())
+
+    # ============================================================
+    # 🏛️ 조회
+    # ============================================================
+
+    async def get_relic_list(
+        self,
+        page: int = 1,
+        rows: int = 10,
+        name: str = "",
+        museum_code: str = "",
+        nationality_code: str = "",
+        material_code: str = "",
+        designation_code: str = "",
+        timeout: float = None
+    ) -> dict:
+        """소장품 목록 조회 (MuseumAPIService.get_relic_list와 같은 매개변수/반환값)"""
+        url = f"{self.BASE_URL}/relic/list"
+        params = {
+            "serviceKey": self.service_key,
+            "pageNo": str(page),
+            "numOfRows": str(rows),
+        }
+
+        if name:
+            params["name"] = name
+        if museum_code:
+            params["museumCode"] = museum_code
+        if nationality_code:
+            params["nationalityCode"] = nationality_code
+        if material_code:
+            params["materialCode"] = material_code
+        if designation_code:
+            params["designationCode"] = designation_code
+
+        try:
+            status, text, _ = await self._get(url, params, timeout=timeout)
+        except (aiohttp.ClientError, asyncio.TimeoutError, MuseumAPIError) as e:
+            print(f"API 요청 오류: {e}")
+            return {"error": str(e) or type(e).__name__}
+
+        if status != 200:
+            return {"error": f"HTTP {status}", "body": text[:200]}
+
+        return self._parser._parse_response(text)
+
+    async def fetch_artifacts(
+        self,
+        page: int = 1,
+        rows: int = 50,
+        museum_code: str = None,
+        timeout: float = None
+    ) -> list:
+        """소장품 목록을 리스트로 가져오기 (MuseumAPIService.fetch_artifacts와 같음)"""
+        if not self.service_key:
+            print("⚠️ MUSEUM_API_KEY가 설정되지 않았습니다.")
+            return []
+
+        url = f"{self.BASE_URL}/relic/list"
+        params = {
+            "serviceKey": self.service_key,
+            "pageNo": str(page),
+            "numOfRows": str(rows),
+            "museumCode": museum_code or self.NATIONAL_MUSEUM_CODE,
+        }
+
+        try:
+            status, text, _ = await self._get(url, params, timeout=timeout)
+        except (aiohttp.ClientError, asyncio.TimeoutError, MuseumAPIError) as e:
+            print(f"API 요청 오류: {e}")
+            return []
+
+        if status != 200:
+            print(f"API 오류: HTTP {status}")
+            return []
+
+        return self._parser._parse_list_response(text)
+
+    async def fetch_artifact_by_id(self, artifact_id: str, timeout: float = None) -> dict | None:
+        """ID로 소장품 상세 조회 (캐시 공유, 실패 시 None)"""
+        try:
+            return await self._cached(
+                f"artifact:{artifact_id}",
+                lambda: self._request_artifact_by_id(artifact_id, timeout)
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError, MuseumAPIError) as e:
+            print(f"API 요청 오류: {e}")
+
+        return None
+
+    async def _request_artifact_by_id(self, artifact_id: str, timeout: float = None) -> dict | None:
+        """API에서 ID로 소장품 조회 (캐시 미사용, 오류는 예외로 전달)"""
+        url = f"{self.BASE_URL}/relic/list"
+        params = {
+            "serviceKey": self.service_key,
+            "pageNo": "1",
+            "numOfRows": "1",
+            "id": artifact_id
+        }
+
+        status, text, _ = await self._get(url, params, timeout=timeout)
+
+        if status != 200:
+            raise aiohttp.ClientError(f"HTTP {status}")
+
+        artifacts = self._parser._parse_list_response(text)
+        if artifacts:
+            return self._parser._convert_to_standard_format(artifacts[0])
+
+        return None
+
+    async def fetch_artifacts_by_ids(self, artifact_ids: list) -> list:
+        """
+        여러 ID의 소장품을 한 이벤트 루프에서 동시에 조회
+
+        동시 요청 수는 세마포어(concurrency)로 제한됩니다.
+        입력 순서를 유지하며, 실패한 항목만 결과에서 빠집니다.
+        """
+        if not artifact_ids:
+            return []
+
+        results = await asyncio.gather(
+            *(self.fetch_artifact_by_id(artifact_id) for artifact_id in artifact_ids),
+            return_exceptions=True
+        )
+
+        artifacts = []
+        for artifact_id, result in zip(artifact_ids, results):
+            if isinstance(result, BaseException):
+                print(f"⚠️ 유물 조회 실패 ({artifact_id}): {result}")
+                continue
+            if result:
+                artifacts.append(result)
+
+        return artifacts
+
+    async def get_relic_detail(self, relic_id: str, timeout: float = None) -> dict:
+        """소장품 상세 정보 조회 (MuseumAPIService.get_relic_detail과 같은 반환값)"""
+        try:
+            detail = await self._cached(
+                f"detail:{relic_id}",
+                lambda: self._request_relic_detail(relic_id, timeout)
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError, MuseumAPIError) as e:
+            print(f"API 요청 오류: {e}")
+            return {"error": str(e) or type(e).__name__}
+
+        if detail is None:
+            return {"error": "조회 실패 (캐시됨)"}
+        return detail
+
+    async def _request_relic_detail(self, relic_id: str, timeout: float = None) -> dict | None:
+        """API에서 소장품 상세 정보 조회 (캐시 미사용, 결과 없음은 None, 오류는 예외로 전달)"""
+        url = f"{self.BASE_URL}/relic/detail"
+        params = {
+            "serviceKey": self.service_key,
+            "id": relic_id
+        }
+
+        status, text, _ = await self._get(url, params, timeout=timeout)
+
+        if status != 200:
+            raise aiohttp.ClientError(f"HTTP {status}")
+
+        return self._parser._parse_detail_response(text)
+
+
+def fetch_artifacts_by_ids(artifact_ids: list, concurrency: int = None) -> list:
+    """동기 코드에서 쓰는 진입점 (새 이벤트 루프에서 한 번에 조회)"""
+
+    async def run():
+        async with AsyncMuseumAPIService(concurrency=concurrency) as api:
+            return await api.fetch_artifacts_by_ids(artifact_ids)
+
+    return asyncio.run(run())
+
+
+# 테스트용 코드
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    if not os.getenv("MUSEUM_API_KEY"):
+        print("⚠️ .env 파일에 MUSEUM_API_KEY를 설정해주세요.")
+        exit(1)
+
+    started = time.perf_counter()
+    artifacts = fetch_artifacts_by_ids(MuseumAPIService.ARTIFACT_IDS)
+    print(f"✅ {len(artifacts)}개 유물 조회 ({time.perf_counter() - started:.2f}초)")
+
+    for i, artifact in enumerate(artifacts, 1):
+        print(f"{i}. {artifact['name']} ({artifact['period']})")
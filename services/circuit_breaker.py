@@ -0,0 +1,196 @@
+"""
+⚡ circuit_breaker.py - 백엔드 차단기
+=====================================
+
+e뮤지엄 API나 Gemini가 느리거나 멈췄을 때 호출마다 타임아웃을 기다리지 않도록
+최근 실패 비율을 보고 호출을 바로 실패시킵니다. 호출한 쪽은 곧바로
+로컬 대체 데이터(ARTIFACTS, 기본 퀴즈/해설)를 사용합니다.
+
+- CLOSED: 정상 호출, 최근 window초의 성공/실패(느린 호출 포함) 기록
+- OPEN: 실패 비율이 기준을 넘으면 open_seconds 동안 호출 없이 바로 실패
+- HALF_OPEN: 이후 시험 호출 몇 개만 허용 → 성공하면 CLOSED, 실패하면 다시 OPEN
+"""
+
+import threading
+import time
+from collections import deque
+
+from config.settings import CIRCUIT_BREAKER_CONFIG
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """차단 중이라 호출하지 않음"""
+
+
+class CircuitBreaker:
+    """실패 비율 기반 차단기"""
+
+    def __init__(
+        self,
+        name: str,
+        window: float = 60,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_call: float = None,
+        open_seconds: float = 30,
+        half_open_calls: int = 1
+    ):
+        self.name = name
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call = slow_call
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._calls = deque()  # (시각, 실패 여부)
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    def _trim(self, now: float) -> None:
+        while self._calls and self._calls[0][0] < now - self.window:
+            self._calls.popleft()
+
+    def _failure_ratio(self) -> float:
+        if not self._calls:
+            return 0.0
+        return sum(1 for _, failed in self._calls if failed) / len(self._calls)
+
+    def _open(self, now: float) -> None:
+        self._state = OPEN
+        self._opened_at = now
+        self._probes = 0
+        self._stats["opened"] += 1
+        print(f"⚡ {self.name} 차단 ({self.open_seconds:.0f}초 동안 대체 데이터 사용)")
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        """OPEN 유지 시간이 지났으면 HALF_OPEN으로 (lock 안에서 호출)"""
+        if self._state == OPEN and now - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    def allow(self) -> None:
+        """
+        호출 허용 여부 확인 (허용되지 않으면 CircuitOpenError)
+
+        허용된 호출은 반드시 record_success / record_failure / release 중 하나로 끝내야 합니다.
+        """
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == OPEN or (state == HALF_OPEN and self._probes >= self.half_open_calls):
+                self._stats["rejected"] += 1
+                raise CircuitOpenError(f"{self.name} 차단 중")
+            if state == HALF_OPEN:
+                self._probes += 1
+
+    def record_success(self, elapsed: float = 0.0) -> None:
+        if self.slow_call is not None and elapsed >= self.slow_call:
+            self.record_failure()
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._stats["calls"] += 1
+            if self._state == HALF_OPEN:
+                # 시험 호출 성공 → 정상화
+                self._state = CLOSED
+                self._calls.clear()
+                print(f"✅ {self.name} 차단 해제")
+            self._calls.append((now, False))
+            self._trim(now)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._stats["calls"] += 1
+            self._stats["failures"] += 1
+            if self._state == HALF_OPEN:
+                self._open(now)
+                return
+            if self._state == OPEN:
+                return
+
+            self._calls.append((now, True))
+            self._trim(now)
+            if len(self._calls) >= self.min_calls and self._failure_ratio() >= self.failure_rate:
+                self._open(now)
+
+    def release(self) -> None:
+        """결과를 기록하지 않고 끝난 호출 (예: 로컬 대기열 초과) - 시험 호출 자리 반환"""
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def call(self, fn, is_failure=None):
+        """
+        차단기를 거쳐 fn() 실행
+
+        Parameters:
+            fn: 호출 함수 (예외는 실패로 기록 후 그대로 전달)
+            is_failure: 결과를 보고 실패 여부를 판단하는 함수 (예: HTTP 5xx)
+        """
+        self.allow()
+        started = time.monotonic()
+        try:
+            result = fn()
+        except Exception:
+            self.record_failure()
+            raise
+
+        if is_failure is not None and is_failure(result):
+            self.record_failure()
+        else:
+            self.record_success(time.monotonic() - started)
+        return result
+
+    def snapshot(self) -> dict:
+        """현재 상태 (모니터링/화면 표시용)"""
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            self._trim(now)
+            return {
+                "state": state,
+                "failure_rate": round(self._failure_ratio(), 3),
+                "recent_calls": len(self._calls),
+                "retry_in": round(max(0.0, self.open_seconds - (now - self._opened_at)), 1) if state == OPEN else 0.0,
+                **self._stats,
+            }
+
+
+# 백엔드별 공유 인스턴스
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """이름별 차단기 반환 (설정: CIRCUIT_BREAKER_CONFIG[name])"""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(name, **CIRCUIT_BREAKER_CONFIG.get(name, {}))
+                _breakers[name] = breaker
+    return breaker
+
+
+def breaker_states() -> dict:
+    """모든 차단기 상태 {이름: snapshot}"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
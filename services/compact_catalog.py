@@ -0,0 +1,215 @@
+"""
+🗜️ compact_catalog.py - mmap 바이너리 카탈로그
+==============================================
+
+수집한 JSONL 카탈로그를 고정 폭 오프셋 테이블 + UTF-8 문자열 힙 형식의
+바이너리 파일로 바꿔 두고 mmap으로 엽니다.
+
+- 시작할 때 파싱이 없음 (헤더만 읽음)
+- 레코드는 접근할 때 하나씩 표준 형식 dict로 만들어짐
+- 여러 Streamlit 워커 프로세스가 같은 파일의 페이지 캐시를 공유
+
+파일 구조 (리틀 엔디언):
+    헤더     magic "ACAT" | version u16 | 필드 수 u16 | 레코드 수 u32 | 힙 크기 u64
+    오프셋   u64 × (레코드 수 × 필드 수 + 1)   힙 안의 필드 시작 위치
+    id 정렬  u32 × 레코드 수                   id 순으로 정렬된 레코드 번호
+    힙       UTF-8 문자열
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+
+import numpy as np
+
+
+MAGIC = b"ACAT"
+VERSION = 2
+HEADER = struct.Struct("<4sHHIQ")
+
+# 표준 형식(_convert_to_standard_format)의 문자열 필드
+FIELDS = (
+    "id", "name", "name_kr", "name_cn", "name_en",
+    "period", "material", "location", "designation",
+    "description", "image_url", "thumbnail_url",
+)
+
+
+def get_compact_path(catalog_path: str) -> str:
+    """JSONL 카탈로그에 대응하는 바이너리 카탈로그 경로"""
+    return os.path.splitext(catalog_path)[0] + ".acat"
+
+
+def write_compact_catalog(artifacts, path: str) -> str:
+    """
+    유물 목록을 바이너리 카탈로그로 저장 (임시 파일에 쓴 뒤 교체)
+
+    Returns:
+        str: 저장 경로
+    """
+    heap = bytearray()
+    offsets = [0]
+    ids = []
+
+    for artifact in artifacts:
+        for field in FIELDS:
+            heap += (artifact.get(field) or "").encode("utf-8")
+            offsets.append(len(heap))
+        ids.append(artifact["id"])
+
+    count = len(ids)
+    order = sorted(range(count), key=lambda row: ids[row].encode("utf-8"))
+
+    tmp_path = path + ".tmp"
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(FIELDS), count, len(heap)))
+        f.write(np.asarray(offsets, dtype="<u8").tobytes())
+        f.write(np.asarray(order, dtype="<u4").tobytes())
+        f.write(heap)
+    os.replace(tmp_path, path)
+
+    print(f"🗜️ 바이너리 카탈로그 저장: {count}건 ({path})")
+    return path
+
+
+class CompactCatalog(Sequence):
+    """mmap 바이너리 카탈로그 리더 (읽기 전용 시퀀스)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, field_count, count, heap_size = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION or field_count != len(FIELDS):
+            self._mm.close()
+            raise ValueError(f"지원하지 않는 카탈로그 형식: {path}")
+
+        self._count = count
+        offsets_at = HEADER.size
+        order_at = offsets_at + 8 * (count * field_count + 1)
+        self._heap_at = order_at + 4 * count
+
+        self._offsets = np.frombuffer(self._mm, dtype="<u8", count=count * field_count + 1, offset=offsets_at)
+        self._order = np.frombuffer(self._mm, dtype="<u4", count=count, offset=order_at)
+
+    def _field(self, row: int, column: int) -> str:
+        i = row * len(FIELDS) + column
+        start, end = int(self._offsets[i]), int(self._offsets[i + 1])
+        return self._mm[self._heap_at + start:self._heap_at + end].decode("utf-8")
+
+    def value(self, row: int, field: str) -> str:
+        """row 번 레코드의 필드 하나만 읽기 (dict를 만들지 않음)"""
+        return self._field(row, FIELDS.index(field))
+
+    def record(self, row: int) -> dict:
+        """row 번 레코드를 표준 형식 dict로 (퀴즈는 나중에 생성)"""
+        start = self._heap_at + int(self._offsets[row * len(FIELDS)])
+        end = self._heap_at + int(self._offsets[(row + 1) * len(FIELDS)])
+        data = self._mm[start:end]
+        base = int(self._offsets[row * len(FIELDS)])
+
+        artifact = {}
+        for column, field in enumerate(FIELDS):
+            i = row * len(FIELDS) + column
+            a, b = int(self._offsets[i]) - base, int(self._offsets[i + 1]) - base
+            artifact[field] = data[a:b].decode("utf-8")
+        artifact["quiz"] = None
+        return artifact
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.record(row) for row in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self.record(index)
+
+    def find_row(self, artifact_id: str) -> int | None:
+        """id 정렬 테이블에서 이진 탐색 (레코드 번호, 없으면 None)"""
+        target = artifact_id.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            row = int(self._order[mid])
+            if self._field(row, 0).encode("utf-8") < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count:
+            row = int(self._order[lo])
+            if self._field(row, 0) == artifact_id:
+                return row
+        return None
+
+    def get(self, artifact_id: str) -> dict | None:
+        """id로 레코드 조회 (O(log n))"""
+        row = self.find_row(artifact_id)
+        return None if row is None else self.record(row)
+
+    def ids(self) -> list:
+        return [self._field(row, 0) for row in range(self._count)]
+
+    def close(self) -> None:
+        self._offsets = self._order = None
+        self._mm.close()
+
+
+def open_catalog(catalog_path: str) -> CompactCatalog | None:
+    """
+    JSONL 카탈로그에 대응하는 바이너리 카탈로그 열기
+
+    바이너리 파일이 없거나 JSONL보다 오래됐으면 한 번 변환합니다.
+
+    Returns:
+        CompactCatalog | None: JSONL도 바이너리도 없으면 None
+    """
+    compact_path = get_compact_path(catalog_path)
+    has_jsonl = os.path.exists(catalog_path)
+
+    if has_jsonl and (
+        not os.path.exists(compact_path)
+        or os.path.getmtime(compact_path) < os.path.getmtime(catalog_path)
+    ):
+        _convert(catalog_path, compact_path)
+
+    if not os.path.exists(compact_path):
+        return None
+
+    try:
+        return CompactCatalog(compact_path)
+    except (OSError, ValueError, struct.error) as e:
+        if not has_jsonl:
+            print(f"⚠️ 바이너리 카탈로그 열기 실패: {e}")
+            return None
+
+    # 형식 버전이 바뀌었으면 JSONL에서 다시 변환
+    _convert(catalog_path, compact_path)
+    try:
+        return CompactCatalog(compact_path)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"⚠️ 바이너리 카탈로그 열기 실패: {e}")
+        return None
+
+
+def _convert(catalog_path: str, compact_path: str) -> None:
+    from services.harvester import load_catalog
+    write_compact_catalog(load_catalog(catalog_path), compact_path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="JSONL 카탈로그를 바이너리 카탈로그로 변환")
+    parser.add_argument("catalog", help="JSONL 카탈로그 경로")
+    parser.add_argument("--output", default=None, help="저장 경로 (기본: 같은 이름의 .acat)")
+    args = parser.parse_args()
+
+    from services.harvester import load_catalog
+    write_compact_catalog(load_catalog(args.catalog), args.output or get_compact_path(args.catalog))
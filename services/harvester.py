@@ -0,0 +1,209 @@
+"""
+🧺 harvester.py - 소장품 카탈로그 수집기
+========================================
+
+박물관 하나의 /relic/list 전체 페이지를 병렬로 내려받아
+앱 표준 형식(_convert_to_standard_format)의 JSONL 파일로 저장합니다.
+중단되어도 체크포인트에서 이어서 수집할 수 있습니다.
+
+실행: python -m services.harvester --museum-code PS01001001
+"""
+
+import json
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from config.settings import HARVEST_CONFIG
+
+
+def get_catalog_path(museum_code: str) -> str:
+    """박물관 코드에 해당하는 카탈로그(JSONL) 경로"""
+    return os.path.join(HARVEST_CONFIG["dir"], f"{museum_code}.jsonl")
+
+
+def _checkpoint_path(output_path: str) -> str:
+    return output_path + ".checkpoint.json"
+
+
+def _load_checkpoint(path: str, museum_code: str, rows: int) -> dict:
+    """체크포인트 로드 (조건이 다르면 새로 시작)"""
+    if os.path.exists(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            if checkpoint.get("museum_code") == museum_code and checkpoint.get("rows") == rows:
+                return checkpoint
+            print("⚠️ 체크포인트 조건이 달라 처음부터 수집합니다.")
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 체크포인트 읽기 실패: {e}")
+
+    return {"museum_code": museum_code, "rows": rows, "total_count": None, "done_pages": []}
+
+
+def _save_checkpoint(path: str, checkpoint: dict) -> None:
+    """체크포인트 원자적 저장"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _strip(record: dict) -> dict | None:
+    """저장용 레코드 정리 (_raw 제외, ID 없는 레코드는 버림)"""
+    if not record.get("_raw", {}).get("id"):
+        return None
+    record.pop("_raw", None)
+    return record
+
+
+def harvest_catalog(
+    museum_code: str = None,
+    output_path: str = None,
+    rows: int = None,
+    max_workers: int = None,
+    service=None
+) -> str:
+    """
+    박물관 소장품 전체를 로컬 JSONL 카탈로그로 수집
+
+    Parameters:
+        museum_code: 박물관 코드 (기본: 국립중앙박물관)
+        output_path: 저장 경로 (기본: HARVEST_CONFIG["dir"]/{museum_code}.jsonl)
+        rows: 페이지당 결과 수
+        max_workers: 동시 페이지 요청 수
+        service: MuseumAPIService 인스턴스 (기본: 공유 싱글톤)
+
+    Returns:
+        str: 카탈로그 파일 경로
+    """
+    if service is None:
+        from services.museum_api import get_museum_service
+        service = get_museum_service()
+
+    museum_code = museum_code or service.NATIONAL_MUSEUM_CODE
+    output_path = output_path or get_catalog_path(museum_code)
+    rows = rows or HARVEST_CONFIG["rows"]
+    max_workers = max_workers or HARVEST_CONFIG["max_workers"]
+
+    if not service.service_key:
+        raise ValueError("MUSEUM_API_KEY가 설정되지 않았습니다.")
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    checkpoint_path = _checkpoint_path(output_path)
+    checkpoint = _load_checkpoint(checkpoint_path, museum_code, rows)
+
+    # 처음 시작이면 이전 결과 파일 정리
+    if not checkpoint["done_pages"] and os.path.exists(output_path):
+        os.remove(output_path)
+
+    write_lock = threading.Lock()
+    done_pages = set(checkpoint["done_pages"])
+
+    def harvest_page(out, page: int, meta: dict = None) -> int:
+        """
+        한 페이지를 스트리밍으로 파싱하며 바로 파일에 기록
+
+        API 오류 응답/파싱 오류는 예외로 전달되어 체크포인트에 남지 않으므로
+        다시 실행하면 그 페이지를 다시 수집합니다.
+        """
+        count = 0
+        for record in service.iter_relic_page(page, rows, museum_code, meta=meta):
+            record = _strip(record)
+            if record is None:
+                continue
+            line = json.dumps(record, ensure_ascii=False) + "\n"
+            with write_lock:
+                out.write(line)
+            count += 1
+
+        if meta is not None and meta.get("total_count") is None:
+            raise ValueError(f"{page}페이지 응답에 totalCount가 없습니다.")
+
+        # 기록한 내용을 먼저 내보낸 뒤 체크포인트 갱신
+        with write_lock:
+            out.flush()
+            done_pages.add(page)
+            checkpoint["done_pages"] = sorted(done_pages)
+            _save_checkpoint(checkpoint_path, checkpoint)
+        return count
+
+    failed = []
+    with open(output_path, "a", encoding="utf-8") as out:
+        # 1페이지로 전체 개수 확인
+        if checkpoint["total_count"] is None:
+            meta = {}
+            harvest_page(out, 1, meta)
+            checkpoint["total_count"] = meta["total_count"]
+            _save_checkpoint(checkpoint_path, checkpoint)
+
+        total_pages = max(1, math.ceil(checkpoint["total_count"] / rows))
+        pending = [page for page in range(1, total_pages + 1) if page not in done_pages]
+        print(f"🧺 {museum_code}: 총 {checkpoint['total_count']}건, {total_pages}페이지 (남은 페이지 {len(pending)})")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(harvest_page, out, page): page for page in pending}
+            for future in as_completed(futures):
+                page = futures[future]
+                try:
+                    count = future.result()
+                except Exception as e:
+                    print(f"⚠️ {page}페이지 수집 실패: {e}")
+                    failed.append(page)
+                    continue
+                print(f"  ✅ {page}/{total_pages} 페이지 ({count}건)")
+
+    if failed:
+        print(f"⚠️ {len(failed)}개 페이지 실패 - 다시 실행하면 이어서 수집합니다: {sorted(failed)}")
+    else:
+        print(f"✅ 수집 완료: {output_path}")
+        from services.compact_catalog import get_compact_path, write_compact_catalog
+        write_compact_catalog(load_catalog(output_path), get_compact_path(output_path))
+
+    return output_path
+
+
+def load_catalog(path: str) -> list:
+    """
+    JSONL 카탈로그 로드 (ID 기준 중복 제거)
+
+    Returns:
+        list: 표준 형식 유물 목록 (파일이 없으면 빈 리스트)
+    """
+    if not path or not os.path.exists(path):
+        return []
+
+    records = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            records[record["id"]] = record
+
+    return list(records.values())
+
+
+if __name__ == "__main__":
+    import argparse
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="e뮤지엄 소장품 카탈로그 수집")
+    parser.add_argument("--museum-code", default=None, help="박물관 코드 (기본: 국립중앙박물관)")
+    parser.add_argument("--output", default=None, help="저장 경로 (JSONL)")
+    parser.add_argument("--rows", type=int, default=None, help="페이지당 결과 수")
+    parser.add_argument("--workers", type=int, default=None, help="동시 페이지 요청 수")
+    args = parser.parse_args()
+
+    harvest_catalog(
+        museum_code=args.museum_code,
+        output_path=args.output,
+        rows=args.rows,
+        max_workers=args.workers
+    )
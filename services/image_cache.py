@@ -0,0 +1,215 @@
+"""
+🖼️ image_cache.py - 유물 이미지 썸네일 캐시
+============================================
+
+박물관 원본 이미지(수 MB)를 한 번만 내려받아 크기별 변형(썸네일/상세)으로
+줄여 로컬에 저장하고, 화면에는 로컬 파일을 보여줍니다.
+
+- 내용 주소 저장: 이미지 바이트의 해시로 파일 이름 결정 (같은 이미지는 한 벌만)
+- URL → 해시 색인은 SQLite (다운로드 실패 URL 네거티브 캐싱)
+- 카탈로그를 불러올 때 백그라운드에서 미리 받아 둠
+- Pillow가 없으면 원격 URL을 그대로 사용
+"""
+
+import hashlib
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import IMAGE_CONFIG
+from services.artifact_cache import ArtifactCache, FRESH, STALE
+
+
+def _resize_variants(data: bytes, variants: dict, quality: int) -> dict:
+    """원본 바이트를 변형별 JPEG 바이트로 (Pillow 필요)"""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as image:
+        image.load()
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        resized = {}
+        for name, size in variants.items():
+            variant = image.copy()
+            variant.thumbnail(size)
+            out = io.BytesIO()
+            variant.save(out, format="JPEG", quality=quality, optimize=True)
+            resized[name] = out.getvalue()
+    return resized
+
+
+class ImageCache:
+    """URL별 이미지 변형 캐시"""
+
+    def __init__(self, cache_dir: str = None, index: ArtifactCache = None, session=None):
+        self.cache_dir = cache_dir or IMAGE_CONFIG["dir"]
+        self.index = index or ArtifactCache(
+            path=os.path.join(self.cache_dir, IMAGE_CONFIG["index_db"]),
+            ttl=IMAGE_CONFIG["ttl"],
+            stale_ttl=0,
+            negative_ttl=IMAGE_CONFIG["negative_ttl"],
+        )
+        self._session = session
+        self._executor = ThreadPoolExecutor(max_workers=IMAGE_CONFIG["max_workers"])
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            from services.museum_api import get_shared_session
+            self._session = get_shared_session()
+        return self._session
+
+    def _path(self, digest: str, variant: str) -> str:
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}_{variant}.jpg")
+
+    def lookup(self, url: str, variant: str = "thumb") -> str | None:
+        """
+        이미 저장된 변형 파일 경로 (네트워크 호출 없음)
+
+        Returns:
+            str | None: 로컬 파일 경로 (아직 없으면 None)
+        """
+        if not url:
+            return None
+        state, entry = self.index.lookup(url)
+        if state not in (FRESH, STALE) or not entry:
+            return None
+        path = self._path(entry["sha256"], variant)
+        return path if os.path.exists(path) else None
+
+    def _download(self, url: str) -> dict | None:
+        """원본을 받아 변형 저장 후 색인 값 반환 (이미지가 없거나 이미지가 아니면 None)"""
+        with self.session.get(url, timeout=IMAGE_CONFIG["timeout"], stream=True) as response:
+            # 없는 이미지(4xx)는 네거티브 캐싱, 일시적인 오류(408/429/5xx)는 예외로 전달해 다시 시도
+            if 400 <= response.status_code < 500 and response.status_code not in (408, 429):
+                print(f"⚠️ 이미지 없음 (HTTP {response.status_code}): {url}")
+                return None
+            response.raise_for_status()
+            data = response.raw.read(IMAGE_CONFIG["max_bytes"] + 1, decode_content=True)
+
+        if len(data) > IMAGE_CONFIG["max_bytes"]:
+            print(f"⚠️ 이미지가 너무 큼: {url}")
+            return None
+
+        digest = hashlib.sha256(data).hexdigest()
+        variants = IMAGE_CONFIG["variants"]
+
+        # 같은 내용의 이미지를 이미 저장했으면 다시 줄이지 않음
+        if not all(os.path.exists(self._path(digest, name)) for name in variants):
+            try:
+                resized = _resize_variants(data, variants, IMAGE_CONFIG["quality"])
+            except ImportError:
+                raise  # Pillow 없음은 이미지 문제가 아니므로 네거티브 캐싱하지 않음
+            except Exception as e:
+                print(f"⚠️ 이미지 변환 실패 ({url}): {e}")
+                return None
+
+            os.makedirs(os.path.dirname(self._path(digest, "thumb")), exist_ok=True)
+            for name, payload in resized.items():
+                path = self._path(digest, name)
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+
+        return {"sha256": digest, "bytes": len(data)}
+
+    def get(self, url: str, variant: str = "thumb") -> str | None:
+        """
+        변형 파일 경로 (없으면 내려받아 생성, 블로킹)
+
+        Returns:
+            str | None: 로컬 파일 경로 (실패 시 None)
+        """
+        if not url:
+            return None
+        try:
+            entry = self.index.get_or_fetch(url, lambda: self._download(url))
+        except ImportError:
+            print("⚠️ 썸네일을 만들려면 Pillow를 설치해주세요: pip install Pillow")
+            return None
+        except Exception as e:
+            print(f"⚠️ 이미지 다운로드 실패 ({url}): {e}")
+            return None
+
+        if not entry:
+            return None
+        path = self._path(entry["sha256"], variant)
+        if not os.path.exists(path):
+            # 파일이 지워졌으면 색인을 지우고 다음 요청 때 다시 받음
+            self.index.delete(url)
+            return None
+        return path
+
+    def prefetch(self, urls) -> None:
+        """아직 없는 이미지를 백그라운드에서 내려받기 (중복 요청 없음)"""
+        for url in urls:
+            if not url or self.lookup(url) is not None:
+                continue
+            with self._pending_lock:
+                if url in self._pending:
+                    continue
+                self._pending.add(url)
+            self._executor.submit(self._prefetch_one, url)
+
+    def _prefetch_one(self, url: str) -> None:
+        try:
+            self.get(url)
+        finally:
+            with self._pending_lock:
+                self._pending.discard(url)
+
+
+def artifact_image_urls(artifact) -> list:
+    """유물의 이미지 URL (썸네일 원본 우선, 중복 제거)"""
+    urls = [artifact.get("thumbnail_url"), artifact.get("image_url")]
+    return list(dict.fromkeys(url for url in urls if url))
+
+
+def get_thumbnail(artifact, variant: str = "thumb") -> str:
+    """
+    화면에 보여줄 이미지 (로컬 변형 파일 우선, 없으면 원격 URL)
+
+    로컬에 없으면 백그라운드로 내려받기를 예약하고 이번에는 내려받는 것과 같은
+    원격 URL(썸네일이면 작은 원본)을 반환합니다.
+    """
+    urls = artifact_image_urls(artifact)
+    if not urls:
+        return ""
+
+    # 썸네일은 작은 원본(imgThumUriL)에서, 상세는 원본 이미지에서
+    source = urls[0] if variant == "thumb" else urls[-1]
+    cache = get_image_cache()
+    path = cache.lookup(source, variant)
+    if path:
+        return path
+
+    cache.prefetch([source])
+    return source
+
+
+def warm_image_cache(artifacts) -> None:
+    """유물 목록의 이미지를 백그라운드에서 미리 받아 둠"""
+    urls = []
+    for artifact in artifacts:
+        urls.extend(artifact_image_urls(artifact))
+    get_image_cache().prefetch(urls)
+
+
+# 싱글톤 인스턴스
+_image_cache = None
+_image_lock = threading.Lock()
+
+
+def get_image_cache() -> ImageCache:
+    """이미지 캐시 인스턴스 반환"""
+    global _image_cache
+    if _image_cache is None:
+        with _image_lock:
+            if _image_cache is None:
+                _image_cache = ImageCache()
+    return _image_cache
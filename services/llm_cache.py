@@ -0,0 +1,164 @@
+"""
+🧠 llm_cache.py - LLM 응답 캐시
+================================
+
+(모델, 프롬프트, generation_config)의 해시를 키로 LLM 응답을 저장합니다.
+같은 유물에 대한 거의 같은 요청이 방문자마다 Gemini로 가지 않도록 합니다.
+
+- 저장소는 교체 가능: 프로세스 내 LRU + SQLite 디스크 캐시 (기본)
+- TTL 만료 (계층 간 복사나 풀에 응답을 추가해도 처음 저장한 시각 기준)
+- 키당 N개 응답 풀: 풀이 찰 때까지는 새로 생성, 이후에는 무작위로 하나 반환
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+
+from config.settings import CACHE_CONFIG, LLM_CACHE_CONFIG
+from services.artifact_cache import ArtifactCache, FRESH
+
+
+def make_cache_key(model: str, prompt: str, generation_config: dict = None) -> str:
+    """(모델, 프롬프트, 설정) 내용 해시"""
+    payload = json.dumps(
+        {"model": model, "prompt": prompt, "config": generation_config or {}},
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ============================================================
+# 🗃️ 저장소 (get_entry / set 만 구현하면 교체 가능)
+# ============================================================
+
+class MemoryBackend:
+    """프로세스 내 LRU 저장소"""
+
+    def __init__(self, max_entries: int = None, ttl: int = None):
+        self.max_entries = max_entries or LLM_CACHE_CONFIG["memory_entries"]
+        self.ttl = ttl or LLM_CACHE_CONFIG["ttl"]
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_entry(self, key: str) -> tuple | None:
+        """(값, 저장 시각) - 없거나 만료되면 None"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, stored_at = item
+            if time.time() - stored_at >= self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return item
+
+    def get(self, key: str):
+        item = self.get_entry(key)
+        return None if item is None else item[0]
+
+    def set(self, key: str, value, stored_at: float = None) -> None:
+        """값 저장 (stored_at을 주면 그 시각 기준으로 만료)"""
+        with self._lock:
+            self._data[key] = (value, stored_at or time.time())
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+
+class SQLiteBackend:
+    """SQLite 디스크 저장소 (유물 캐시와 같은 구현 사용, stale 구간 없음)"""
+
+    def __init__(self, path: str = None, max_entries: int = None, ttl: int = None):
+        self._store = ArtifactCache(
+            path=path or os.path.join(CACHE_CONFIG["dir"], LLM_CACHE_CONFIG["db"]),
+            ttl=ttl or LLM_CACHE_CONFIG["ttl"],
+            stale_ttl=0,
+            max_entries=max_entries or LLM_CACHE_CONFIG["disk_entries"]
+        )
+
+    def get_entry(self, key: str) -> tuple | None:
+        """(값, 저장 시각) - 없거나 만료되면 None"""
+        state, value, stored_at = self._store.entry(key)
+        return (value, stored_at) if state == FRESH else None
+
+    def get(self, key: str):
+        item = self.get_entry(key)
+        return None if item is None else item[0]
+
+    def set(self, key: str, value, stored_at: float = None) -> None:
+        """값 저장 (stored_at을 주면 그 시각 기준으로 만료)"""
+        self._store.set(key, value, stored_at=stored_at)
+
+
+# ============================================================
+# 🧠 계층형 캐시
+# ============================================================
+
+class LLMCache:
+    """앞 저장소부터 조회하는 계층형 LLM 응답 캐시"""
+
+    def __init__(self, backends: list = None):
+        self.backends = backends if backends is not None else [MemoryBackend(), SQLiteBackend()]
+        self._lock = threading.Lock()
+
+    def _load(self, key: str) -> tuple:
+        """(응답 풀, 처음 저장한 시각) - 없으면 ([], None)"""
+        for i, backend in enumerate(self.backends):
+            item = backend.get_entry(key)
+            if item and item[0]:
+                texts, stored_at = item
+                # 하위 계층에서 찾으면 상위 계층에 채워 둠 (저장 시각은 그대로 - 자주 읽혀도 만료됨)
+                for upper in self.backends[:i]:
+                    upper.set(key, texts, stored_at=stored_at)
+                return texts, stored_at
+        return [], None
+
+    def get(self, key: str, variants: int = 1) -> str | None:
+        """
+        캐시된 응답 반환
+
+        풀에 variants개가 모이기 전에는 None을 반환해 새로 생성하게 합니다.
+        """
+        texts, _ = self._load(key)
+        if len(texts) >= max(1, variants):
+            return random.choice(texts)
+        return None
+
+    def add(self, key: str, text: str, variants: int = 1) -> None:
+        """
+        응답을 풀에 추가 (최대 variants개 유지)
+
+        이미 있는 풀에 추가할 때는 처음 저장한 시각을 유지해
+        응답을 추가할 때마다 풀 전체의 TTL이 늘어나지 않게 합니다.
+        """
+        with self._lock:
+            texts, stored_at = self._load(key)
+            if text in texts:
+                return
+            texts = (texts + [text])[-max(1, variants):]
+            for backend in self.backends:
+                backend.set(key, texts, stored_at=stored_at)
+
+
+# 싱글톤 인스턴스
+_llm_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMCache | None:
+    """LLM 캐시 인스턴스 반환 (비활성화 시 None)"""
+    global _llm_cache
+    if not LLM_CACHE_CONFIG["enabled"]:
+        return None
+    if _llm_cache is None:
+        with _cache_lock:
+            if _llm_cache is None:
+                _llm_cache = LLMCache()
+    return _llm_cache
@@ -0,0 +1,318 @@
+"""
+🚦 llm_scheduler.py - Gemini 요청 스케줄러
+==========================================
+
+모든 세션의 Gemini 호출을 프로세스 하나의 대기열로 모아
+분당 요청 수/토큰 수 한도 안에서 순서대로 보냅니다.
+
+- 토큰 버킷 두 개 (요청 수, 토큰 수)
+- 우선순위: 맞춤 해설/대화(interactive) > 퀴즈 미리 생성(background) > 퀴즈 은행 빌드(batch)
+- 대기열 길이 제한 + 요청별 마감 시간 (넘으면 바로 실패 → 호출한 쪽에서 기본 응답)
+- 429 응답은 지터를 준 지수 백오프로 재시도하고, 그동안 다른 요청도 잠시 멈춤
+- 스레드(run)와 asyncio 코루틴(run_async)이 같은 대기열과 한도를 공유
+"""
+
+import asyncio
+import heapq
+import itertools
+import random
+import threading
+import time
+
+from config.settings import LLM_SCHEDULER_CONFIG
+
+
+# 우선순위 (숫자가 작을수록 먼저)
+INTERACTIVE = 0
+BACKGROUND = 1
+BATCH = 2
+
+PRIORITY_NAMES = {INTERACTIVE: "interactive", BACKGROUND: "background", BATCH: "batch"}
+
+
+class SchedulerBusy(RuntimeError):
+    """대기열이 가득 참"""
+
+
+class DeadlineExceeded(TimeoutError):
+    """마감 시간 안에 보낼 차례가 오지 않음"""
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """429 (ResourceExhausted) 오류 여부"""
+    code = getattr(error, "code", None)
+    if code == 429 or getattr(code, "value", None) == 429:
+        return True
+    return type(error).__name__ in ("ResourceExhausted", "TooManyRequests") or "429" in str(error)
+
+
+def estimate_tokens(prompt: str, generation_config: dict = None) -> int:
+    """요청 토큰 추정 (입력은 글자 수 기준, 출력은 max_output_tokens)"""
+    max_output = (generation_config or {}).get("max_output_tokens", 0)
+    return len(prompt) // 2 + max_output
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지는 토큰 버킷 (lock은 호출하는 쪽에서 관리)"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount만큼 쓸 수 있을 때까지 남은 시간 (초)"""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, amount: float) -> None:
+        """추정치와 실제 사용량 차이 반영 (음수면 돌려받음)"""
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+    def drain(self) -> None:
+        """429를 받으면 남은 토큰을 비워 다른 요청도 잠시 멈추게 함"""
+        self.tokens = min(self.tokens, 0.0)
+
+
+class _Ticket:
+    __slots__ = ("priority", "seq", "tokens", "deadline", "done")
+
+    def __init__(self, priority: int, seq: int, tokens: int, deadline: float):
+        self.priority = priority
+        self.seq = seq
+        self.tokens = tokens
+        self.deadline = deadline
+        self.done = False
+
+    def __lt__(self, other: "_Ticket") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class LLMScheduler:
+    """프로세스 공유 Gemini 요청 스케줄러"""
+
+    def __init__(
+        self,
+        requests_per_minute: float = None,
+        tokens_per_minute: float = None,
+        burst: int = None,
+        max_queue: int = None
+    ):
+        rpm = requests_per_minute or LLM_SCHEDULER_CONFIG["requests_per_minute"]
+        tpm = tokens_per_minute or LLM_SCHEDULER_CONFIG["tokens_per_minute"]
+        self.requests = TokenBucket(rpm / 60, burst or LLM_SCHEDULER_CONFIG["burst"])
+        self.tokens = TokenBucket(tpm / 60, tpm)
+        self.max_queue = max_queue or LLM_SCHEDULER_CONFIG["max_queue"]
+
+        self._queue = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stats = {"sent": 0, "rate_limited": 0, "rejected": 0, "expired": 0}
+
+    def _enqueue(self, priority: int, tokens: int, deadline: float) -> _Ticket:
+        with self._cond:
+            # 마감이 지난 항목 정리 후 길이 확인
+            self._queue = [t for t in self._queue if not t.done]
+            heapq.heapify(self._queue)
+            if len(self._queue) >= self.max_queue:
+                self._stats["rejected"] += 1
+                raise SchedulerBusy("LLM 요청 대기열이 가득 찼습니다.")
+
+            ticket = _Ticket(priority, next(self._seq), tokens, deadline)
+            heapq.heappush(self._queue, ticket)
+            return ticket
+
+    def _head(self) -> _Ticket | None:
+        """대기열 맨 앞 (마감된 항목은 버림, lock 안에서 호출)"""
+        while self._queue and self._queue[0].done:
+            heapq.heappop(self._queue)
+        return self._queue[0] if self._queue else None
+
+    def _try_acquire(self, ticket: _Ticket, now: float) -> float:
+        """
+        차례이고 두 버킷에 여유가 있으면 차감 후 0, 아니면 더 기다릴 시간 (lock 안에서 호출)
+
+        마감이 지났으면 DeadlineExceeded를 던집니다.
+        """
+        remaining = ticket.deadline - now
+        if remaining <= 0:
+            ticket.done = True
+            self._stats["expired"] += 1
+            self._cond.notify_all()
+            raise DeadlineExceeded(f"LLM 요청 대기 시간 초과 ({PRIORITY_NAMES[ticket.priority]})")
+
+        if self._head() is not ticket:
+            return remaining
+
+        wait = max(self.requests.wait_time(1, now), self.tokens.wait_time(ticket.tokens, now))
+        if wait == 0:
+            self.requests.consume(1)
+            self.tokens.consume(ticket.tokens)
+            heapq.heappop(self._queue)
+            ticket.done = True
+            self._stats["sent"] += 1
+            self._cond.notify_all()
+            return 0.0
+        return min(wait, remaining)
+
+    def _wait_turn(self, ticket: _Ticket) -> None:
+        """차례가 오고 두 버킷에 여유가 생길 때까지 대기 (마감 시 DeadlineExceeded)"""
+        with self._cond:
+            while True:
+                wait = self._try_acquire(ticket, time.monotonic())
+                if wait == 0:
+                    return
+                self._cond.wait(wait)
+
+    async def _wait_turn_async(self, ticket: _Ticket) -> None:
+        """
+        _wait_turn의 asyncio 버전 (이벤트 루프를 막지 않도록 짧게 나눠 대기)
+
+        스레드 호출과 같은 대기열을 쓰며, 기다리는 중에 취소되면 대기열에서 빠집니다.
+        """
+        poll = LLM_SCHEDULER_CONFIG["async_poll"]
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_acquire(ticket, time.monotonic())
+                if wait == 0:
+                    return
+                await asyncio.sleep(min(wait, poll))
+        except asyncio.CancelledError:
+            with self._cond:
+                if not ticket.done:
+                    ticket.done = True
+                    self._cond.notify_all()
+            raise
+
+    def run(
+        self,
+        fn,
+        priority: int = INTERACTIVE,
+        tokens: int = 0,
+        timeout: float = None,
+        count_tokens=None
+    ):
+        """
+        차례가 오면 fn() 실행 (호출한 스레드에서 실행)
+
+        Parameters:
+            fn: API 호출 함수
+            priority: INTERACTIVE / BACKGROUND / BATCH
+            tokens: 추정 토큰 수
+            timeout: 대기 마감 (초, 기본: 우선순위별 설정값), 재시도 대기도 포함
+            count_tokens: 응답에서 실제 토큰 수를 꺼내는 함수 (추정치 보정)
+
+        Raises:
+            SchedulerBusy: 대기열이 가득 참
+            DeadlineExceeded: 마감 안에 보내지 못함
+            그 밖의 API 오류는 그대로 전달 (429는 재시도 후)
+        """
+        timeout = timeout or LLM_SCHEDULER_CONFIG["deadlines"][PRIORITY_NAMES[priority]]
+        deadline = time.monotonic() + timeout
+
+        for attempt in range(LLM_SCHEDULER_CONFIG["max_retries"] + 1):
+            ticket = self._enqueue(priority, tokens, deadline)
+            self._wait_turn(ticket)
+
+            try:
+                result = fn()
+            except Exception as e:
+                if not is_rate_limited(e) or attempt == LLM_SCHEDULER_CONFIG["max_retries"]:
+                    raise
+                backoff = self._on_rate_limited(attempt)
+                if time.monotonic() + backoff >= deadline:
+                    raise
+                print(f"⚠️ Gemini 429 - {backoff:.1f}초 후 재시도 ({attempt + 1}회)")
+                time.sleep(backoff)
+                continue
+
+            if count_tokens is not None:
+                self._settle(tokens, result, count_tokens)
+            return result
+
+    async def run_async(
+        self,
+        fn,
+        priority: int = INTERACTIVE,
+        tokens: int = 0,
+        timeout: float = None,
+        count_tokens=None
+    ):
+        """
+        run의 asyncio 버전: 차례가 오면 await fn() 실행
+
+        fn은 코루틴 함수이며, 매개변수와 예외는 run과 같습니다.
+        """
+        timeout = timeout or LLM_SCHEDULER_CONFIG["deadlines"][PRIORITY_NAMES[priority]]
+        deadline = time.monotonic() + timeout
+
+        for attempt in range(LLM_SCHEDULER_CONFIG["max_retries"] + 1):
+            ticket = self._enqueue(priority, tokens, deadline)
+            await self._wait_turn_async(ticket)
+
+            try:
+                result = await fn()
+            except Exception as e:
+                if not is_rate_limited(e) or attempt == LLM_SCHEDULER_CONFIG["max_retries"]:
+                    raise
+                backoff = self._on_rate_limited(attempt)
+                if time.monotonic() + backoff >= deadline:
+                    raise
+                print(f"⚠️ Gemini 429 - {backoff:.1f}초 후 재시도 ({attempt + 1}회)")
+                await asyncio.sleep(backoff)
+                continue
+
+            if count_tokens is not None:
+                self._settle(tokens, result, count_tokens)
+            return result
+
+    def _on_rate_limited(self, attempt: int) -> float:
+        """429 처리: 버킷을 비우고 지터를 준 백오프 시간 반환"""
+        with self._cond:
+            self._stats["rate_limited"] += 1
+            self.requests.drain()
+        cap = min(LLM_SCHEDULER_CONFIG["backoff_max"], LLM_SCHEDULER_CONFIG["backoff_base"] * 2 ** attempt)
+        return random.uniform(cap / 2, cap)
+
+    def _settle(self, estimated: int, result, count_tokens) -> None:
+        try:
+            actual = count_tokens(result)
+        except Exception:
+            return
+        if actual:
+            with self._cond:
+                self.tokens.adjust(actual - estimated)
+                self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """대기열 길이와 누적 통계"""
+        with self._cond:
+            waiting = sum(1 for t in self._queue if not t.done)
+            return {"waiting": waiting, **self._stats}
+
+
+# 싱글톤 인스턴스
+_llm_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """프로세스 공유 스케줄러 반환"""
+    global _llm_scheduler
+    if _llm_scheduler is None:
+        with _scheduler_lock:
+            if _llm_scheduler is None:
+                _llm_scheduler = LLMScheduler()
+    return _llm_scheduler
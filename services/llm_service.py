@@ -5,40 +5,385 @@
 Google Gemini API 연동 로직입니다.
 """
 
+import asyncio
 import json
 import re
 import os
+import threading
+import time
 from config.prompts import (
     SYSTEM_PROMPT,
     ARTIFACT_CONTEXT,
+    RELATED_ARTIFACTS_CONTEXT,
+    RELATED_ARTIFACT_LINE,
     QUIZ_PROMPT,
     MESSAGES
 )
-from config.settings import AI_CONFIG
+from config.settings import AI_CONFIG, LLM_CACHE_CONFIG
+from services.llm_cache import get_llm_cache, make_cache_key
+from services.circuit_breaker import OPEN, CircuitOpenError, get_breaker
+from services.llm_scheduler import (
+    INTERACTIVE,
+    DeadlineExceeded,
+    SchedulerBusy,
+    estimate_tokens,
+    get_llm_scheduler
+)
 
 
 class LLMService:
     """Google Gemini API 연동 서비스"""
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, cache=None, scheduler=None, breaker=None):
         self.api_key = api_key
         self.client = None
-        self.model = None
-
-        if api_key:
+        self.cache = cache or get_llm_cache()
+        self.scheduler = scheduler or get_llm_scheduler()
+        self.breaker = breaker or get_breaker("gemini")
+        self.created_at = time.time()
+        self.last_error = None
+        self.failed_at = None  # 초기화 실패 시각 (time.monotonic)
+
+        # google.generativeai는 import만 1초 가까이 걸리므로 처음 모델을 쓸 때 불러옴
+        self._model = None
+        self._model_failed = False
+        self._model_lock = threading.Lock()
+
+    @property
+    def model(self):
+        """Gemini 모델 핸들 (처음 접근할 때 SDK import 및 설정, 실패 시 None)"""
+        if self._model is None and self.api_key and not self._model_failed:
+            with self._model_lock:
+                if self._model is None and not self._model_failed:
+                    self._init_model()
+        return self._model
+
+    @property
+    def available(self) -> bool:
+        """SDK를 불러오지 않고 판단한 사용 가능 여부 (API 키가 있고 초기화에 실패하지 않음)"""
+        return self._model is not None or (bool(self.api_key) and not self._model_failed)
+
+    def _init_model(self) -> None:
+        try:
+            import google.generativeai as genai
+            genai.configure(api_key=self.api_key)
+            self._model = genai.GenerativeModel(AI_CONFIG["model"])
+            self.client = True  # 클라이언트 활성화 표시
+            print("✅ Gemini API 연결됨")
+        except ImportError:
+            self._model_failed = True
+            self.failed_at = time.monotonic()
+            self.last_error = "google-generativeai 패키지 없음"
+            print("⚠️ google-generativeai 패키지를 설치해주세요: pip install google-generativeai")
+        except Exception as e:
+            self._model_failed = True
+            self.failed_at = time.monotonic()
+            self.last_error = str(e)
+            print(f"⚠️ Gemini 초기화 오류: {e}")
+
+    def health_check(self, probe: bool = False) -> dict:
+        """
+        클라이언트 상태 확인
+
+        Parameters:
+            probe: True면 토큰 수 계산 요청으로 실제 연결까지 확인 (생성 비용 없음)
+
+        Returns:
+            dict: {"ok", "model", "last_error", "uptime", "scheduler", "circuit"}
+        """
+        circuit = self.breaker.snapshot()
+        ok = self.available and circuit["state"] != OPEN
+
+        if ok and probe:
             try:
-                import google.generativeai as genai
-                genai.configure(api_key=api_key)
-                self.model = genai.GenerativeModel(AI_CONFIG["model"])
-                self.client = True  # 클라이언트 활성화 표시
-                print("✅ Gemini API 연결됨")
-            except ImportError:
-                print("⚠️ google-generativeai 패키지를 설치해주세요: pip install google-generativeai")
+                self.model.count_tokens("ping")
+                self.last_error = None
             except Exception as e:
-                print(f"⚠️ Gemini 초기화 오류: {e}")
+                self.last_error = str(e)
+                ok = False
+
+        return {
+            "ok": ok,
+            "model": AI_CONFIG["model"] if self.available else None,
+            "last_error": self.last_error,
+            "uptime": round(time.time() - self.created_at, 1),
+            "scheduler": self.scheduler.stats(),
+            "circuit": circuit,
+        }
+
+    def generate_text(
+        self,
+        prompt: str,
+        generation_config: dict = None,
+        variants: int = 1,
+        validate=None,
+        timeout: float = None,
+        priority: int = INTERACTIVE,
+        use_cache: bool = True,
+        deadline: float = None
+    ) -> str:
+        """
+        캐시를 거쳐 텍스트 생성
+
+        Parameters:
+            prompt: 프롬프트
+            generation_config: Gemini generation_config
+            variants: 키당 모아 둘 응답 개수 (퀴즈처럼 매번 달라야 하는 경우 > 1)
+            validate: 응답 검증 함수 - 통과한 응답만 캐시에 저장
+            timeout: API 요청 타임아웃 (초, 보낸 뒤 응답을 기다리는 시간)
+            priority: 스케줄러 우선순위 (INTERACTIVE / BACKGROUND / BATCH)
+            use_cache: False면 캐시를 읽지도 쓰지도 않음 (매번 새 응답이 필요한 빌드 작업)
+            deadline: 스케줄러 대기 마감 (초, 기본: 우선순위별 설정값)
+
+        API 호출은 프로세스 공유 스케줄러를 거칩니다.
+        API 오류(대기열 초과, 대기 시간 초과 포함)는 예외로 전달합니다.
+        """
+        key = None
+        if self.cache is not None and use_cache:
+            key = make_cache_key(AI_CONFIG["model"], prompt, generation_config)
+            cached = self.cache.get(key, variants)
+            if cached is not None:
+                return cached
+
+        kwargs = {"request_options": {"timeout": timeout}} if timeout else {}
+        if generation_config:
+            kwargs["generation_config"] = generation_config
+        response = self._call_model(
+            lambda: self.model.generate_content(prompt, **kwargs),
+            priority=priority,
+            tokens=estimate_tokens(prompt, generation_config),
+            deadline=deadline,
+            count_tokens=lambda r: r.usage_metadata.total_token_count
+        )
+        text = response.text
+
+        if key is not None and (validate is None or validate(text)):
+            self.cache.add(key, text, variants)
+
+        return text
+
+    def generate_text_stream(
+        self,
+        prompt: str,
+        generation_config: dict = None,
+        timeout: float = None,
+        priority: int = INTERACTIVE,
+        deadline: float = None
+    ):
+        """
+        캐시를 거쳐 텍스트를 조각 단위로 생성 (제너레이터)
+
+        캐시에 있으면 전체 응답을 한 번에 내보내고,
+        없으면 스케줄러에서 차례를 받아 도착하는 대로 내보낸 뒤
+        완성된 응답을 캐시에 저장합니다.
+        API 오류는 예외로 전달합니다.
+        """
+        key = None
+        if self.cache is not None:
+            key = make_cache_key(AI_CONFIG["model"], prompt, generation_config)
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        kwargs = {"stream": True}
+        if timeout:
+            kwargs["request_options"] = {"timeout": timeout}
+        if generation_config:
+            kwargs["generation_config"] = generation_config
+        opened = {}
+
+        def open_stream():
+            opened["at"] = time.monotonic()
+            return self.model.generate_content(prompt, **kwargs)
+
+        # 성공 여부는 스트림을 끝까지 받은 뒤에 기록
+        response = self._call_model(
+            open_stream,
+            priority=priority,
+            tokens=estimate_tokens(prompt, generation_config),
+            deadline=deadline,
+            record_success=False
+        )
+
+        chunks = []
+        try:
+            for chunk in response:
+                text = chunk.text
+                if text:
+                    chunks.append(text)
+                    yield text
+        except GeneratorExit:
+            # 소비하는 쪽이 중간에 멈춤 - 장애가 아니므로 자리만 돌려줌
+            self.breaker.release()
+            raise
+        except Exception:
+            # 스트림 도중 끊긴 경우도 장애로 기록
+            self.breaker.record_failure()
+            raise
+
+        self.breaker.record_success(time.monotonic() - opened["at"])
+
+        if key is not None and chunks:
+            self.cache.add(key, "".join(chunks))
+
+    async def generate_text_async(
+        self,
+        prompt: str,
+        generation_config: dict = None,
+        variants: int = 1,
+        validate=None,
+        timeout: float = None,
+        priority: int = INTERACTIVE,
+        deadline: float = None
+    ) -> str:
+        """
+        generate_text의 asyncio 버전 (SDK의 generate_content_async 사용)
+
+        매개변수, 캐시, 스케줄러/차단기 처리는 generate_text와 같습니다.
+        한 스레드의 이벤트 루프에서 여러 생성을 동시에 기다릴 수 있습니다.
+        """
+        key = None
+        if self.cache is not None:
+            key = make_cache_key(AI_CONFIG["model"], prompt, generation_config)
+            cached = self.cache.get(key, variants)
+            if cached is not None:
+                return cached
+
+        kwargs = {"request_options": {"timeout": timeout}} if timeout else {}
+        if generation_config:
+            kwargs["generation_config"] = generation_config
+        response = await self._call_model_async(
+            lambda: self.model.generate_content_async(prompt, **kwargs),
+            priority=priority,
+            tokens=estimate_tokens(prompt, generation_config),
+            deadline=deadline,
+            count_tokens=lambda r: r.usage_metadata.total_token_count
+        )
+        text = response.text
+
+        if key is not None and (validate is None or validate(text)):
+            self.cache.add(key, text, variants)
+
+        return text
+
+    def embed_content(
+        self,
+        content,
+        task_type: str,
+        model: str,
+        timeout: float = None,
+        priority: int = INTERACTIVE
+    ) -> dict:
+        """
+        Gemini 임베딩 API 호출 (생성과 같은 스케줄러/차단기를 거침)
+
+        Parameters:
+            content: 문자열 또는 문자열 목록
+            task_type: "retrieval_document" / "retrieval_query"
+            model: 임베딩 모델 이름
+            timeout: 요청 타임아웃 (초)
+            priority: 스케줄러 우선순위
+
+        API 오류(차단 중, 대기열 초과 포함)는 예외로 전달합니다.
+        """
+        if self.model is None:
+            raise RuntimeError(self.last_error or "Gemini API를 사용할 수 없습니다.")
+
+        import google.generativeai as genai
+
+        texts = content if isinstance(content, list) else [content]
+        kwargs = {"request_options": {"timeout": timeout}} if timeout else {}
+        return self._call_model(
+            lambda: genai.embed_content(model=model, content=content, task_type=task_type, **kwargs),
+            priority=priority,
+            tokens=sum(len(text) // 2 for text in texts)
+        )
+
+    def _call_model(
+        self,
+        fn,
+        priority: int,
+        tokens: int,
+        deadline: float = None,
+        count_tokens=None,
+        record_success: bool = True
+    ):
+        """
+        차단기 → 스케줄러 순서로 거쳐 API 호출
+
+        차단 중이면 대기열에 들어가지 않고 바로 CircuitOpenError를 던집니다.
+        대기열 초과/대기 시간 초과는 로컬 문제이므로 장애로 기록하지 않습니다.
+        deadline은 스케줄러 대기 마감이며, API 요청 타임아웃은 fn 안에서 따로 정합니다.
+        record_success=False면 성공 기록은 호출한 쪽이 맡습니다 (스트리밍).
+        """
+        self.breaker.allow()
+
+        elapsed = {}
+
+        def timed():
+            started = time.monotonic()
+            try:
+                return fn()
+            finally:
+                elapsed["api"] = time.monotonic() - started
+
+        try:
+            response = self.scheduler.run(
+                timed,
+                priority=priority,
+                tokens=tokens,
+                timeout=deadline,
+                count_tokens=count_tokens
+            )
+        except (SchedulerBusy, DeadlineExceeded):
+            self.breaker.release()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+
+        if record_success:
+            self.breaker.record_success(elapsed.get("api", 0.0))
+        return response
+
+    async def _call_model_async(self, fn, priority: int, tokens: int, deadline: float = None, count_tokens=None):
+        """
+        _call_model의 asyncio 버전 (fn: 코루틴 함수)
+
+        취소된 호출은 장애로 기록하지 않고 차단기 자리만 돌려줍니다.
+        """
+        self.breaker.allow()
 
-    def build_system_prompt(self, artifact: dict = None) -> str:
-        """시스템 프롬프트 생성"""
+        elapsed = {}
+
+        async def timed():
+            started = time.monotonic()
+            try:
+                return await fn()
+            finally:
+                elapsed["api"] = time.monotonic() - started
+
+        try:
+            response = await self.scheduler.run_async(
+                timed,
+                priority=priority,
+                tokens=tokens,
+                timeout=deadline,
+                count_tokens=count_tokens
+            )
+        except (SchedulerBusy, DeadlineExceeded, asyncio.CancelledError):
+            self.breaker.release()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+
+        self.breaker.record_success(elapsed.get("api", 0.0))
+        return response
+
+    def build_system_prompt(self, artifact: dict = None, query: str = None) -> str:
+        """시스템 프롬프트 생성 (query가 있으면 전체 소장품에서 관련 유물 추가)"""
 
         # 기본 프롬프트
         system_prompt = SYSTEM_PROMPT
@@ -56,29 +401,121 @@ class LLMService:
             )
             system_prompt += artifact_context
 
+        # 관련 유물 추가 (임베딩 검색)
+        if query:
+            system_prompt += self._build_related_context(query, artifact)
+
         return system_prompt
 
+    def _build_related_context(self, query: str, artifact: dict = None) -> str:
+        """질문과 관련된 유물 목록 컨텍스트 (검색 실패 시 빈 문자열)"""
+        try:
+            from services.retrieval import get_retriever
+
+            retriever = get_retriever()
+            if retriever is None:
+                # 검색 색인을 아직 준비하는 중
+                return ""
+
+            exclude_ids = [artifact["id"]] if artifact and artifact.get("id") else []
+            hits = retriever.retrieve(query, exclude_ids=exclude_ids)
+        except Exception as e:
+            print(f"⚠️ 관련 유물 검색 실패: {e}")
+            return ""
+
+        if not hits:
+            return ""
+
+        lines = [
+            RELATED_ARTIFACT_LINE.format(
+                name=hit.get("name", ""),
+                period=hit.get("period", ""),
+                material=hit.get("material", ""),
+                designation=hit.get("designation", ""),
+                summary=(hit.get("description", "") or "")[:120]
+            )
+            for hit, _ in hits
+        ]
+        return RELATED_ARTIFACTS_CONTEXT.format(related="\n".join(lines))
+
+    def _text_generation_config(self) -> dict:
+        """일반 텍스트 응답용 generation_config"""
+        return {
+            "temperature": AI_CONFIG["temperature"],
+            "max_output_tokens": AI_CONFIG["max_tokens"]
+        }
+
     def chat(self, user_message: str, artifact: dict = None) -> str:
         """LLM과 대화"""
 
-        system_prompt = self.build_system_prompt(artifact)
+        system_prompt = self.build_system_prompt(artifact, query=user_message)
 
         # Gemini API 호출
         if self.model:
             try:
                 full_prompt = f"{system_prompt}\n\n사용자: {user_message}"
-                generation_config = {
-                    "temperature": AI_CONFIG["temperature"],
-                    "max_output_tokens": AI_CONFIG["max_tokens"]
-                }
-                response = self.model.generate_content(full_prompt, generation_config=generation_config)
-                return response.text
+                return self.generate_text(full_prompt, self._text_generation_config())
+            except CircuitOpenError:
+                # Gemini 장애로 차단 중이면 로컬 기본 응답
+                return self._fallback_response(user_message, artifact)
+            except Exception as e:
+                return f"API 오류: {str(e)}"
+
+        # API 없으면 기본 응답
+        return self._fallback_response(user_message, artifact)
+
+    def chat_stream(self, user_message: str, artifact: dict = None):
+        """LLM과 대화 (응답을 조각 단위로 내보내는 제너레이터)"""
+
+        system_prompt = self.build_system_prompt(artifact, query=user_message)
+
+        if self.model:
+            full_prompt = f"{system_prompt}\n\n사용자: {user_message}"
+            try:
+                yield from self.generate_text_stream(full_prompt, self._text_generation_config())
+            except CircuitOpenError:
+                # Gemini 장애로 차단 중이면 로컬 기본 응답
+                yield self._fallback_response(user_message, artifact)
+            except Exception as e:
+                yield f"API 오류: {str(e)}"
+            return
+
+        # API 없으면 기본 응답
+        yield self._fallback_response(user_message, artifact)
+
+    async def chat_async(self, user_message: str, artifact: dict = None) -> str:
+        """LLM과 대화 (asyncio 버전)"""
+
+        # 관련 유물 검색(임베딩 요청 포함)은 동기 코드이므로 스레드에서 실행
+        system_prompt = await asyncio.to_thread(self.build_system_prompt, artifact, user_message)
+
+        if self.model:
+            try:
+                full_prompt = f"{system_prompt}\n\n사용자: {user_message}"
+                return await self.generate_text_async(full_prompt, self._text_generation_config())
+            except CircuitOpenError:
+                return self._fallback_response(user_message, artifact)
             except Exception as e:
                 return f"API 오류: {str(e)}"
 
         # API 없으면 기본 응답
         return self._fallback_response(user_message, artifact)
 
+    def _quiz_generation_config(self) -> dict:
+        """퀴즈(JSON 응답)용 generation_config"""
+        return {
+            "temperature": AI_CONFIG["temperature"],
+            "max_output_tokens": AI_CONFIG["max_tokens"],
+            "response_mime_type": "application/json"
+        }
+
+    def _parse_quiz(self, response_text: str) -> dict | None:
+        """응답에서 퀴즈 JSON 추출 (없으면 None)"""
+        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+        if json_match:
+            return json.loads(json_match.group())
+        return None
+
     def generate_quiz(self, artifact: dict) -> dict:
         """퀴즈 생성"""
 
@@ -88,19 +525,42 @@ class LLMService:
                     artifact_name=artifact["name"]
                 )
 
-                generation_config = {
-                    "temperature": AI_CONFIG["temperature"],
-                    "max_output_tokens": AI_CONFIG["max_tokens"],
-                    "response_mime_type": "application/json"
-                }
+                response_text = self.generate_text(
+                    prompt,
+                    self._quiz_generation_config(),
+                    variants=LLM_CACHE_CONFIG["quiz_variants"],
+                    validate=lambda text: re.search(r'\{.*\}', text, re.DOTALL) is not None
+                )
+
+                quiz = self._parse_quiz(response_text)
+                if quiz:
+                    return quiz
+            except Exception as e:
+                print(f"퀴즈 생성 오류: {e}")
+
+        # 폴백: 기본 퀴즈
+        return self._fallback_quiz(artifact)
+
+    async def generate_quiz_async(self, artifact: dict, priority: int = INTERACTIVE) -> dict:
+        """퀴즈 생성 (asyncio 버전, 배치/미리 생성은 priority를 낮춰서 호출)"""
+
+        if self.model:
+            try:
+                prompt = QUIZ_PROMPT.format(
+                    artifact_name=artifact["name"]
+                )
 
-                response = self.model.generate_content(prompt, generation_config=generation_config)
+                response_text = await self.generate_text_async(
+                    prompt,
+                    self._quiz_generation_config(),
+                    variants=LLM_CACHE_CONFIG["quiz_variants"],
+                    validate=lambda text: re.search(r'\{.*\}', text, re.DOTALL) is not None,
+                    priority=priority
+                )
 
-                # JSON 파싱
-                response_text = response.text
-                json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                if json_match:
-                    return json.loads(json_match.group())
+                quiz = self._parse_quiz(response_text)
+                if quiz:
+                    return quiz
             except Exception as e:
                 print(f"퀴즈 생성 오류: {e}")
 
@@ -136,25 +596,15 @@ class LLMService:
             "explanation": f"이 유물은 {artifact['period']}에 만들어졌습니다."
         }
 
-    def generate_enhanced_explanation(
+    def _build_explanation_prompt(
         self,
         artifact: dict,
         quiz: dict,
         is_correct: bool,
-        user_question: str = None
+        user_question: str
     ) -> str:
-        """사용자 질문을 반영한 맞춤 해설 생성"""
-
-        base_explanation = quiz.get("explanation", "")
-
-        # 사용자 질문이 없으면 기본 해설 반환
-        if not user_question or not user_question.strip():
-            return base_explanation
-
-        # Gemini API로 맞춤 해설 생성
-        if self.model:
-            try:
-                prompt = f"""당신은 박물관 큐레이터입니다.
+        """맞춤 해설 프롬프트"""
+        return f"""당신은 박물관 큐레이터입니다.
 사용자가 유물 퀴즈를 풀면서 궁금한 점을 질문했습니다.
 
 **유물 정보:**
@@ -165,7 +615,7 @@ class LLMService:
 
 **퀴즈 문제:** {quiz.get('question', '')}
 **정답 여부:** {'정답' if is_correct else '오답'}
-**기본 해설:** {base_explanation}
+**기본 해설:** {quiz.get("explanation", "")}
 
 **사용자의 궁금한 점:** {user_question}
 
@@ -176,17 +626,178 @@ class LLMService:
 
 응답은 300자 이내로 간결하게 작성해주세요."""
 
-                generation_config = {
-                    "temperature": AI_CONFIG["temperature"],
-                    "max_output_tokens": AI_CONFIG["max_tokens"]
-                }
-                response = self.model.generate_content(prompt, generation_config=generation_config)
-                return response.text
+    def _fallback_explanation(self, base_explanation: str, user_question: str) -> str:
+        """API 없을 때 기본 해설 + 안내 메시지"""
+        return f"""{base_explanation}
+
+💬 **질문하신 내용:** {user_question}
+→ API 키를 설정하면 궁금한 점에 대한 맞춤 답변을 받을 수 있어요!"""
+
+    def generate_enhanced_explanation(
+        self,
+        artifact: dict,
+        quiz: dict,
+        is_correct: bool,
+        user_question: str = None
+    ) -> str:
+        """사용자 질문을 반영한 맞춤 해설 생성"""
+
+        base_explanation = quiz.get("explanation", "")
+
+        # 사용자 질문이 없으면 기본 해설 반환
+        if not user_question or not user_question.strip():
+            return base_explanation
+
+        # Gemini API로 맞춤 해설 생성
+        if self.model:
+            try:
+                prompt = self._build_explanation_prompt(artifact, quiz, is_correct, user_question)
+                return self.generate_text(prompt, self._text_generation_config())
             except Exception as e:
                 print(f"맞춤 해설 생성 오류: {e}")
 
         # API 없으면 기본 해설 + 안내 메시지
-        return f"""{base_explanation}
+        return self._fallback_explanation(base_explanation, user_question)
 
-💬 **질문하신 내용:** {user_question}
-→ API 키를 설정하면 궁금한 점에 대한 맞춤 답변을 받을 수 있어요!"""
+    async def generate_enhanced_explanation_async(
+        self,
+        artifact: dict,
+        quiz: dict,
+        is_correct: bool,
+        user_question: str = None
+    ) -> str:
+        """사용자 질문을 반영한 맞춤 해설 생성 (asyncio 버전)"""
+
+        base_explanation = quiz.get("explanation", "")
+
+        # 사용자 질문이 없으면 기본 해설 반환
+        if not user_question or not user_question.strip():
+            return base_explanation
+
+        if self.model:
+            try:
+                prompt = self._build_explanation_prompt(artifact, quiz, is_correct, user_question)
+                return await self.generate_text_async(prompt, self._text_generation_config())
+            except Exception as e:
+                print(f"맞춤 해설 생성 오류: {e}")
+
+        # API 없으면 기본 해설 + 안내 메시지
+        return self._fallback_explanation(base_explanation, user_question)
+
+    def generate_enhanced_explanation_stream(
+        self,
+        artifact: dict,
+        quiz: dict,
+        is_correct: bool,
+        user_question: str = None
+    ):
+        """맞춤 해설 생성 (응답을 조각 단위로 내보내는 제너레이터)"""
+
+        base_explanation = quiz.get("explanation", "")
+
+        # 사용자 질문이 없으면 기본 해설 반환
+        if not user_question or not user_question.strip():
+            yield base_explanation
+            return
+
+        # Gemini API로 맞춤 해설 스트리밍
+        if self.model:
+            streamed = False
+            try:
+                prompt = self._build_explanation_prompt(artifact, quiz, is_correct, user_question)
+                for chunk in self.generate_text_stream(prompt, self._text_generation_config()):
+                    streamed = True
+                    yield chunk
+                return
+            except Exception as e:
+                print(f"맞춤 해설 생성 오류: {e}")
+                # 이미 일부를 보냈으면 그대로 마무리
+                if streamed:
+                    return
+
+        # API 없으면 기본 해설 + 안내 메시지
+        yield self._fallback_explanation(base_explanation, user_question)
+
+
+# ============================================================
+# ⚡ 동시 생성
+# ============================================================
+
+async def gather_with_deadline(calls, timeout: float = None, return_exceptions: bool = True) -> list:
+    """
+    여러 생성 코루틴을 동시에 실행하고 입력 순서대로 결과 반환 (asyncio.gather 형태)
+
+    Parameters:
+        calls: 코루틴 목록 (예: [service.generate_quiz_async(a) for a in artifacts])
+        timeout: 호출별 마감 (초) - 넘은 호출만 취소되고 결과 자리에 TimeoutError
+        return_exceptions: False면 첫 예외에서 나머지를 모두 취소하고 예외를 전달
+
+    이 코루틴 자체가 취소되면 아직 끝나지 않은 호출도 모두 취소됩니다.
+    동시에 보내는 수는 공유 스케줄러의 한도를 따릅니다.
+    """
+    tasks = [
+        asyncio.ensure_future(asyncio.wait_for(call, timeout) if timeout else call)
+        for call in calls
+    ]
+    if not tasks:
+        return []
+
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+# ============================================================
+# 🔗 프로세스 공유 인스턴스
+# ============================================================
+
+_llm_services = {}
+_llm_lock = threading.Lock()
+
+
+def get_llm_service(api_key: str = None) -> LLMService:
+    """
+    프로세스 전체에서 공유하는 LLMService 반환
+
+    모든 세션/스레드가 같은 모델 핸들을 사용합니다.
+    API 키가 있는데 초기화에 실패한 인스턴스는 실패 후
+    AI_CONFIG["init_retry_seconds"]초가 지나야 다시 만들고, 그 전에는
+    실패한 인스턴스(기본 응답 사용)를 그대로 돌려줍니다.
+    바로 다시 시도하려면 reset_llm_service를 호출합니다.
+
+    Parameters:
+        api_key: Gemini API 키 (기본: GEMINI_API_KEY 환경변수)
+    """
+    api_key = os.getenv("GEMINI_API_KEY", "") if api_key is None else api_key
+
+    service = _llm_services.get(api_key)
+    if service is not None and not _should_reinit(service):
+        return service
+
+    with _llm_lock:
+        service = _llm_services.get(api_key)
+        if service is None or _should_reinit(service):
+            if service is not None:
+                print("🔄 LLM 서비스 재초기화")
+            service = LLMService(api_key)
+            _llm_services[api_key] = service
+    return service
+
+
+def _should_reinit(service: LLMService) -> bool:
+    """초기화에 실패했고 재시도 간격이 지났는지 여부"""
+    if not service.api_key or service.available or service.failed_at is None:
+        return False
+    return time.monotonic() - service.failed_at >= AI_CONFIG["init_retry_seconds"]
+
+
+def reset_llm_service(api_key: str = None) -> None:
+    """공유 LLMService 제거 (다음 get_llm_service 호출 때 새로 생성, None이면 전체)"""
+    with _llm_lock:
+        if api_key is None:
+            _llm_services.clear()
+        else:
+            _llm_services.pop(api_key, None)
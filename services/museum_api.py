@@ -6,10 +6,138 @@
 API 문서: https://www.emuseum.go.kr/openapi
 """
 
+import codecs
+import io
+import json
 import os
 import random
+import re
+import threading
 import requests
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import MUSEUM_API_CONFIG
+from services.artifact_cache import ArtifactCache, get_artifact_cache
+from services.circuit_breaker import CircuitOpenError, get_breaker
+
+
+class MuseumAPIError(requests.RequestException):
+    """HTTP 200이지만 resultCode가 0000이 아닌 API 오류 응답"""
+
+    def __init__(self, *args, result_code: str = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.result_code = result_code
+
+
+# ============================================================
+# 🧾 XML 입력 (선언된 인코딩 처리)
+# ============================================================
+
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
+_DECLARED_ENCODING = re.compile(rb"^\s*<\?xml[^>]*?encoding\s*=\s*[\"']([A-Za-z0-9._-]+)[\"']")
+
+# expat이 바이트를 직접 읽을 수 있는 인코딩 (그 밖의 EUC-KR 등은 먼저 디코딩)
+_EXPAT_ENCODINGS = {"utf-8", "utf-16", "iso8859-1", "ascii"}
+
+
+class _PrefixedStream(io.RawIOBase):
+    """먼저 읽어 둔 앞부분(head)과 나머지 스트림을 이어 붙인 바이너리 스트림"""
+
+    def __init__(self, head: bytes, rest):
+        self._head = head
+        self._rest = rest
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._head:
+            n = min(len(buffer), len(self._head))
+            buffer[:n] = self._head[:n]
+            self._head = self._head[n:]
+            return n
+        data = self._rest.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def _xml_source(body):
+    """
+    iterparse에 넣을 스트림
+
+    - str: requests/aiohttp가 이미 디코딩한 본문 - XML 선언을 떼고 UTF-8로 (선언과 실제 인코딩이 달라지지 않게)
+    - bytes / 바이너리 스트림: 원본 바이트 그대로, 단 선언된 인코딩을 expat이 못 읽으면
+      (예: EUC-KR) 그 인코딩으로 디코딩하는 텍스트 스트림으로 감쌈
+    """
+    if isinstance(body, str):
+        return io.BytesIO(_XML_DECLARATION.sub("", body, count=1).encode("utf-8"))
+    if isinstance(body, (bytes, bytearray)):
+        body = io.BytesIO(body)
+
+    head = body.read(256)
+    stream = io.BufferedReader(_PrefixedStream(head, body))
+
+    match = _DECLARED_ENCODING.match(head)
+    if match:
+        try:
+            encoding = codecs.lookup(match.group(1).decode("ascii")).name
+        except LookupError:
+            raise MuseumAPIError(f"지원하지 않는 XML 인코딩: {match.group(1).decode('ascii')}")
+        if encoding not in _EXPAT_ENCODINGS:
+            return io.TextIOWrapper(stream, encoding=encoding)
+    return stream
+
+
+# ============================================================
+# 🔌 공유 HTTP 세션 (keep-alive 연결 풀)
+# ============================================================
+
+_shared_session = None
+_session_lock = threading.Lock()
+
+
+def create_session(
+    pool_size: int = None,
+    max_retries: int = None,
+    backoff_factor: float = None
+) -> requests.Session:
+    """
+    연결 풀과 재시도 정책이 설정된 HTTP 세션 생성
+
+    Parameters:
+    - pool_size: 호스트당 유지할 keep-alive 연결 수
+    - max_retries: 5xx 응답/연결 오류 재시도 횟수
+    - backoff_factor: 재시도 간 지수 백오프 계수
+    """
+    pool_size = pool_size or MUSEUM_API_CONFIG["pool_size"]
+    retry = Retry(
+        total=MUSEUM_API_CONFIG["max_retries"] if max_retries is None else max_retries,
+        connect=MUSEUM_API_CONFIG["max_retries"] if max_retries is None else max_retries,
+        backoff_factor=MUSEUM_API_CONFIG["backoff_factor"] if backoff_factor is None else backoff_factor,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """프로세스 전체에서 공유하는 HTTP 세션 반환"""
+    global _shared_session
+    if _shared_session is None:
+        with _session_lock:
+            if _shared_session is None:
+                _shared_session = create_session()
+    return _shared_session
 
 
 class MuseumAPIService:
@@ -39,27 +167,65 @@ class MuseumAPIService:
         "PS0100100100100031200000",  # 고구려 벽화
     ]
 
-    def __init__(self, service_key: str = None):
+    def __init__(
+        self,
+        service_key: str = None,
+        session: requests.Session = None,
+        cache: ArtifactCache = None,
+        use_cache: bool = True,
+        breaker=None
+    ):
         self.service_key = service_key or os.getenv("MUSEUM_API_KEY", "")
+        self.session = session or get_shared_session()
+        self.cache = (cache or get_artifact_cache()) if use_cache else None
+        self.breaker = breaker or get_breaker("museum_api")
+
+    def _cached(self, key: str, fetch_fn):
+        """캐시가 있으면 캐시 우선 조회, 없으면 바로 호출"""
+        if self.cache is None:
+            return fetch_fn()
+        return self.cache.get_or_fetch(key, fetch_fn)
+
+    def _get(self, url: str, params: dict, timeout: float = None, stream: bool = False) -> requests.Response:
+        """
+        공유 세션으로 GET 요청 (timeout: 호출별 읽기 타임아웃, stream: 본문 스트리밍)
+
+        차단기를 거치며, 차단 중이면 요청 없이 바로 requests.ConnectionError를 던져
+        호출한 쪽의 기존 오류 처리(캐시/기본 데이터)로 넘어갑니다.
+        """
+        read_timeout = timeout or MUSEUM_API_CONFIG["timeout"]
+        try:
+            return self.breaker.call(
+                lambda: self.session.get(
+                    url,
+                    params=params,
+                    timeout=(MUSEUM_API_CONFIG["connect_timeout"], read_timeout),
+                    stream=stream
+                ),
+                is_failure=lambda response: response.status_code >= 500
+            )
+        except CircuitOpenError as e:
+            raise requests.ConnectionError(str(e)) from e
 
     def _parse_response(self, response_text: str) -> dict:
         """XML 또는 JSON 응답 파싱"""
         if not response_text or not response_text.strip():
             return {"error": "빈 응답"}
 
-        # JSON 시도
-        try:
-            import json
-            return json.loads(response_text)
-        except:
-            pass
-
-        # XML 파싱 시도
-        try:
-            root = ET.fromstring(response_text)
-            return self._xml_to_dict(root)
-        except Exception as e:
-            pass
+        # 첫 글자로 형식을 판단해 한 번만 파싱
+        head = response_text.lstrip()[:1]
+
+        if head in ("{", "["):
+            try:
+                return json.loads(response_text)
+            except ValueError:
+                pass
+        elif head == "<":
+            try:
+                root = ET.fromstring(response_text)
+                return self._xml_to_dict(root)
+            except ET.ParseError:
+                pass
 
         return {"raw": response_text[:500]}
 
@@ -83,41 +249,94 @@ class MuseumAPIService:
 
         return result
 
-    def _parse_list_response(self, response_text: str) -> list:
-        """XML 응답에서 소장품 목록 파싱"""
+    def _parse_list_response(self, body) -> list:
+        """XML 응답(원본 bytes 또는 디코딩된 str)에서 소장품 목록 파싱"""
+        artifacts, total_count = self._parse_list_page(body)
+        if total_count is not None:
+            print(f"총 소장품 수: {total_count}")
+        return artifacts
+
+    def _parse_list_page(self, body) -> tuple:
+        """
+        XML 응답(원본 bytes 또는 디코딩된 str)에서 소장품 목록과 전체 개수 파싱
+
+        가능하면 response.content(원본 바이트)를 넘겨 XML 선언의 인코딩대로 읽게 합니다.
+
+        Returns:
+            tuple: (소장품 목록, 전체 개수 또는 None)
+            API 오류 응답(resultCode≠0000)과 XML 파싱 실패는 MuseumAPIError로 전달합니다.
+        """
+        meta = {}
         artifacts = []
 
         try:
-            root = ET.fromstring(response_text)
+            artifacts = list(self._iter_list_items(body, meta))
+        except (ET.ParseError, UnicodeDecodeError) as e:
+            # 빈 결과로 처리하면 "없는 유물"로 캐시되므로 오류로 전달
+            raise MuseumAPIError(f"XML 파싱 오류: {e}") from e
 
-            # 결과 코드 확인
-            result_code = root.find(".//resultCode")
-            if result_code is not None and result_code.text != "0000":
-                result_msg = root.find(".//resultMsg")
-                print(f"API 오류: {result_msg.text if result_msg is not None else 'Unknown'}")
-                return []
+        return artifacts, meta.get("total_count")
 
-            total_count = root.find(".//totalCount")
-            if total_count is not None:
-                print(f"총 소장품 수: {total_count.text}")
+    def _iter_list_items(self, source, meta: dict = None):
+        """
+        /relic/list XML을 스트림에서 점진적으로 파싱
 
-            # data 요소들 순회
-            for data in root.findall(".//data"):
-                artifact = {}
+        <data> 요소가 닫힐 때마다 원본 소장품 dict 하나를 내보내고
+        처리한 요소는 바로 비워서, 페이지 크기와 관계없이 메모리 사용량이 일정합니다.
+
+        Parameters:
+        - source: 바이너리 파일 객체 (응답 스트림 등), bytes 또는 디코딩된 str (_xml_source 참고)
+        - meta: 전달하면 result_code / result_msg / total_count 를 채워 줌
 
-                for item in data.findall("item"):
+        resultCode가 0000이 아니면 MuseumAPIError를 던집니다.
+        """
+        meta = meta if meta is not None else {}
+        # 열려 있는 요소 경로 (처리한 <data>를 부모에서 떼어 내는 데 사용)
+        path = []
+
+        for event, elem in ET.iterparse(_xml_source(source), events=("start", "end")):
+            if event == "start":
+                path.append(elem)
+                continue
+            path.pop()
+
+            tag = elem.tag
+            if tag == "data":
+                artifact = {}
+                for item in elem.iter("item"):
                     key = item.get("key")
                     value = item.get("value", "")
                     if key and value:
                         artifact[key] = value
 
-                if artifact and artifact.get("name"):
-                    artifacts.append(artifact)
-
-        except ET.ParseError as e:
-            print(f"XML 파싱 오류: {e}")
-
-        return artifacts
+                # 처리한 요소를 부모에서 분리해 트리에 쌓이지 않게 함
+                elem.clear()
+                if path:
+                    path[-1].remove(elem)
+
+                if artifact.get("name"):
+                    yield artifact
+            elif tag == "resultCode":
+                meta["result_code"] = (elem.text or "").strip()
+            elif tag == "resultMsg":
+                meta["result_msg"] = elem.text or ""
+                self._check_result(meta)
+            elif tag == "totalCount":
+                try:
+                    meta["total_count"] = int(elem.text)
+                except (TypeError, ValueError):
+                    pass
+
+        self._check_result(meta)
+
+    def _check_result(self, meta: dict) -> None:
+        """resultCode가 0000이 아니면 MuseumAPIError (할당량 초과 등 HTTP 200 오류 응답)"""
+        result_code = meta.get("result_code", "0000")
+        if result_code != "0000":
+            raise MuseumAPIError(
+                f"API 오류 {result_code}: {meta.get('result_msg') or 'Unknown'}",
+                result_code=result_code
+            )
 
     def get_relic_list(
         self,
@@ -127,7 +346,8 @@ class MuseumAPIService:
         museum_code: str = "",
         nationality_code: str = "",
         material_code: str = "",
-        designation_code: str = ""
+        designation_code: str = "",
+        timeout: float = None
     ) -> dict:
         """
         소장품 목록 조회
@@ -140,6 +360,7 @@ class MuseumAPIService:
         - nationality_code: 국적/시대 코드
         - material_code: 재질 코드
         - designation_code: 지정구분 코드 (국보: PS12001, 보물: PS12002)
+        - timeout: 요청 타임아웃 (초)
         """
         url = f"{self.BASE_URL}/relic/list"
         params = {
@@ -160,7 +381,7 @@ class MuseumAPIService:
             params["designationCode"] = designation_code
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self._get(url, params, timeout=timeout)
             print(f"[DEBUG] Status: {response.status_code}")
             print(f"[DEBUG] URL: {response.url}")
 
@@ -176,7 +397,8 @@ class MuseumAPIService:
         self,
         page: int = 1,
         rows: int = 50,
-        museum_code: str = None
+        museum_code: str = None,
+        timeout: float = None
     ) -> list:
         """
         소장품 목록을 리스트로 가져오기
@@ -185,6 +407,7 @@ class MuseumAPIService:
         - page: 페이지 번호
         - rows: 가져올 개수
         - museum_code: 박물관 코드 (기본: 국립중앙박물관)
+        - timeout: 요청 타임아웃 (초)
         """
         if not self.service_key:
             print("⚠️ MUSEUM_API_KEY가 설정되지 않았습니다.")
@@ -199,18 +422,92 @@ class MuseumAPIService:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self._get(url, params, timeout=timeout)
 
             if response.status_code != 200:
                 print(f"API 오류: HTTP {response.status_code}")
                 return []
 
-            return self._parse_list_response(response.text)
+            return self._parse_list_response(response.content)
 
         except requests.RequestException as e:
             print(f"API 요청 오류: {e}")
             return []
 
+    def fetch_relic_page(
+        self,
+        page: int,
+        rows: int = 100,
+        museum_code: str = None,
+        timeout: float = None
+    ) -> tuple:
+        """
+        /relic/list 한 페이지를 원본 형식으로 조회 (카탈로그 수집용)
+
+        Parameters:
+        - page: 페이지 번호
+        - rows: 한 페이지 결과 수
+        - museum_code: 박물관 코드 (기본: 국립중앙박물관)
+        - timeout: 요청 타임아웃 (초)
+
+        Returns:
+            tuple: (원본 소장품 목록, 전체 개수 또는 None)
+            네트워크/HTTP 오류는 예외로 전달합니다.
+        """
+        url = f"{self.BASE_URL}/relic/list"
+        params = {
+            "serviceKey": self.service_key,
+            "pageNo": str(page),
+            "numOfRows": str(rows),
+            "museumCode": museum_code or self.NATIONAL_MUSEUM_CODE,
+        }
+
+        response = self._get(url, params, timeout=timeout)
+
+        if response.status_code != 200:
+            raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+
+        return self._parse_list_page(response.content)
+
+    def iter_relic_page(
+        self,
+        page: int,
+        rows: int = 100,
+        museum_code: str = None,
+        meta: dict = None,
+        timeout: float = None
+    ):
+        """
+        /relic/list 한 페이지를 응답 스트림에서 바로 파싱하며 표준 형식으로 하나씩 반환
+
+        응답 본문 전체를 메모리에 올리지 않으므로 numOfRows가 큰 수집 작업에 사용합니다.
+
+        Parameters:
+        - page: 페이지 번호
+        - rows: 한 페이지 결과 수
+        - museum_code: 박물관 코드 (기본: 국립중앙박물관)
+        - meta: 전달하면 total_count 등 응답 헤더 정보를 채워 줌
+        - timeout: 요청 타임아웃 (초)
+
+        네트워크/HTTP 오류와 API 오류 응답(MuseumAPIError)은 예외로 전달합니다.
+        """
+        url = f"{self.BASE_URL}/relic/list"
+        params = {
+            "serviceKey": self.service_key,
+            "pageNo": str(page),
+            "numOfRows": str(rows),
+            "museumCode": museum_code or self.NATIONAL_MUSEUM_CODE,
+        }
+
+        with self._get(url, params, timeout=timeout, stream=True) as response:
+            if response.status_code != 200:
+                raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
+
+            # gzip 등 전송 인코딩을 풀면서 읽기
+            response.raw.decode_content = True
+            for api_artifact in self._iter_list_items(response.raw, meta):
+                yield self._convert_to_standard_format(api_artifact)
+
     def get_random_artifacts(self, count: int = 10) -> list:
         """
         랜덤으로 소장품 가져오기
@@ -227,11 +524,7 @@ class MuseumAPIService:
             min(count, len(self.ARTIFACT_IDS))
         )
 
-        artifacts = []
-        for artifact_id in selected_ids:
-            artifact = self.fetch_artifact_by_id(artifact_id)
-            if artifact:
-                artifacts.append(artifact)
+        artifacts = self.fetch_artifacts_by_ids(selected_ids)
 
         if not artifacts:
             print("⚠️ API에서 소장품을 가져오지 못했습니다.")
@@ -240,12 +533,61 @@ class MuseumAPIService:
         print(f"✅ API에서 {len(artifacts)}개 유물 로드 완료")
         return artifacts
 
-    def fetch_artifact_by_id(self, artifact_id: str) -> dict | None:
+    def fetch_artifacts_by_ids(self, artifact_ids: list, max_workers: int = None) -> list:
+        """
+        여러 ID의 소장품을 동시에 조회
+
+        전체 대기 시간이 요청 수의 합이 아니라 가장 느린 요청 하나에 맞춰집니다.
+        입력 순서를 유지하며, 실패한 항목만 결과에서 빠집니다.
+
+        Parameters:
+        - artifact_ids: 소장품 고유 ID 목록
+        - max_workers: 최대 동시 요청 수 (기본: MUSEUM_API_CONFIG["max_workers"])
+        """
+        if not artifact_ids:
+            return []
+
+        workers = max_workers or MUSEUM_API_CONFIG["max_workers"]
+        workers = max(1, min(workers, len(artifact_ids)))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.fetch_artifact_by_id, artifact_id) for artifact_id in artifact_ids]
+
+            artifacts = []
+            for artifact_id, future in zip(artifact_ids, futures):
+                try:
+                    artifact = future.result()
+                except Exception as e:
+                    print(f"⚠️ 유물 조회 실패 ({artifact_id}): {e}")
+                    continue
+                if artifact:
+                    artifacts.append(artifact)
+
+        return artifacts
+
+    def fetch_artifact_by_id(self, artifact_id: str, timeout: float = None) -> dict | None:
         """
         ID로 소장품 상세 조회
 
         Parameters:
         - artifact_id: 소장품 고유 ID
+        - timeout: 요청 타임아웃 (초)
+        """
+        try:
+            return self._cached(
+                f"artifact:{artifact_id}",
+                lambda: self._request_artifact_by_id(artifact_id, timeout)
+            )
+        except requests.RequestException as e:
+            print(f"API 요청 오류: {e}")
+
+        return None
+
+    def _request_artifact_by_id(self, artifact_id: str, timeout: float = None) -> dict | None:
+        """
+        API에서 ID로 소장품 조회 (캐시 미사용)
+
+        조회 결과가 없으면 None, 네트워크/HTTP 오류는 예외로 전달합니다.
         """
         url = f"{self.BASE_URL}/relic/list"
         params = {
@@ -255,20 +597,15 @@ class MuseumAPIService:
             "id": artifact_id
         }
 
-        try:
-            response = requests.get(url, params=params, timeout=10)
-
-            if response.status_code != 200:
-                print(f"API 오류: HTTP {response.status_code}")
-                return None
+        response = self._get(url, params, timeout=timeout)
 
-            # XML 파싱
-            artifacts = self._parse_list_response(response.text)
-            if artifacts:
-                return self._convert_to_standard_format(artifacts[0])
+        if response.status_code != 200:
+            raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
 
-        except requests.RequestException as e:
-            print(f"API 요청 오류: {e}")
+        # XML 파싱
+        artifacts = self._parse_list_response(response.content)
+        if artifacts:
+            return self._convert_to_standard_format(artifacts[0])
 
         return None
 
@@ -307,18 +644,41 @@ class MuseumAPIService:
             "designation": purpose,  # 용도를 지정구분 대신 사용
             "description": description,
             "image_url": image_url,
+            "thumbnail_url": api_artifact.get("imgThumUriL", ""),
             # 퀴즈는 나중에 Gemini로 생성
             "quiz": None,
             # 원본 API 데이터 보관
             "_raw": api_artifact
         }
 
-    def get_relic_detail(self, relic_id: str) -> dict:
+    def get_relic_detail(self, relic_id: str, timeout: float = None) -> dict:
         """
         소장품 상세 정보 조회
 
         Parameters:
         - relic_id: 소장품 고유 키 (예: PS0100100100100240600000)
+        - timeout: 요청 타임아웃 (초)
+        """
+        try:
+            detail = self._cached(
+                f"detail:{relic_id}",
+                lambda: self._request_relic_detail(relic_id, timeout)
+            )
+        except requests.HTTPError as e:
+            return {"error": str(e)}
+        except requests.RequestException as e:
+            print(f"API 요청 오류: {e}")
+            return {"error": str(e)}
+
+        if detail is None:
+            return {"error": "조회 결과 없음 (캐시됨)"}
+        return detail
+
+    def _request_relic_detail(self, relic_id: str, timeout: float = None) -> dict | None:
+        """
+        API에서 소장품 상세 정보 조회 (캐시 미사용)
+
+        조회 결과가 없으면 None, 네트워크/HTTP/API 오류와 파싱 실패는 예외로 전달합니다.
         """
         url = f"{self.BASE_URL}/relic/detail"
         params = {
@@ -326,30 +686,51 @@ class MuseumAPIService:
             "id": relic_id
         }
 
-        try:
-            response = requests.get(url, params=params, timeout=10)
-            print(f"[DEBUG] Status: {response.status_code}")
-            print(f"[DEBUG] URL: {response.url}")
+        response = self._get(url, params, timeout=timeout)
+        print(f"[DEBUG] Status: {response.status_code}")
+        print(f"[DEBUG] URL: {response.url}")
 
-            if response.status_code != 200:
-                return {"error": f"HTTP {response.status_code}"}
+        if response.status_code != 200:
+            raise requests.HTTPError(f"HTTP {response.status_code}", response=response)
 
-            return self._parse_response(response.text)
-        except requests.RequestException as e:
-            print(f"API 요청 오류: {e}")
-            return {"error": str(e)}
+        return self._parse_detail_response(response.text)
+
+    def _parse_detail_response(self, response_text: str) -> dict | None:
+        """
+        /relic/detail 응답 파싱 (동기/비동기 클라이언트 공용)
+
+        정상 응답인데 내용이 없을 때만 None(조회 결과 없음 → 네거티브 캐싱)을 반환하고,
+        파싱 실패나 API 오류 응답은 캐시되지 않도록 MuseumAPIError를 던집니다.
+        """
+        detail = self._parse_response(response_text)
+        if not isinstance(detail, dict):
+            raise MuseumAPIError(f"상세 응답 형식 오류: {type(detail).__name__}")
+        if "error" in detail or "raw" in detail:
+            raise MuseumAPIError(f"상세 응답 파싱 실패: {detail.get('error') or detail.get('raw', '')[:100]}")
+
+        header = detail.get("header")
+        if isinstance(header, dict):
+            self._check_result({"result_code": header.get("resultCode", "0000"), "result_msg": header.get("resultMsg")})
+
+        body = {key: value for key, value in detail.items() if key != "header"}
+        if not any(body.values()):
+            return None
+        return detail
 
 
 # 싱글톤 인스턴스
 _museum_service = None
+_service_lock = threading.Lock()
 
 
 def get_museum_service() -> MuseumAPIService:
-    """Museum API 서비스 인스턴스 반환"""
+    """Museum API 서비스 인스턴스 반환 (공유 HTTP 세션 사용)"""
     global _museum_service
     if _museum_service is None:
-        api_key = os.getenv("MUSEUM_API_KEY", "")
-        _museum_service = MuseumAPIService(api_key)
+        with _service_lock:
+            if _museum_service is None:
+                api_key = os.getenv("MUSEUM_API_KEY", "")
+                _museum_service = MuseumAPIService(api_key, session=get_shared_session())
     return _museum_service
 
 
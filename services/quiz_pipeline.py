@@ -0,0 +1,118 @@
+"""
+⏩ quiz_pipeline.py - 백그라운드 퀴즈 생성 파이프라인
+====================================================
+
+선택한 유물들의 퀴즈를 워커 스레드에서 미리 생성합니다.
+화면은 첫 문제가 준비되는 즉시 퀴즈를 시작하고,
+나머지는 풀이하는 동안 뒤에서 채워집니다.
+
+다음에 풀 문제(focus)부터 우선 생성합니다.
+"""
+
+import threading
+
+from config.settings import QUIZ_CONFIG
+from data.artifacts import generate_dynamic_quiz, get_fallback_quiz
+
+
+class QuizPipeline:
+    """유물 퀴즈 백그라운드 생성기"""
+
+    def __init__(
+        self,
+        artifacts: list,
+        llm_service=None,
+        max_workers: int = None,
+        timeout: float = None,
+        seen_questions=()
+    ):
+        self.artifacts = list(artifacts)
+        self.llm_service = llm_service
+        self.seen_questions = frozenset(seen_questions)
+        self.max_workers = max(1, min(max_workers or QUIZ_CONFIG["max_workers"], len(self.artifacts) or 1))
+        self.timeout = timeout or QUIZ_CONFIG["timeout"]
+
+        self._results = {}
+        self._pending = set(range(len(self.artifacts)))
+        self._focus = 0
+        self._cancelled = False
+        self._cond = threading.Condition()
+        self._threads = []
+
+    def start(self) -> "QuizPipeline":
+        """워커 스레드 시작"""
+        for _ in range(self.max_workers):
+            thread = threading.Thread(target=self._worker, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def _next_index(self) -> int | None:
+        """다음 생성할 문제 번호 (focus 이후 문제 우선, lock 안에서 호출)"""
+        if self._cancelled or not self._pending:
+            return None
+        return min(self._pending, key=lambda i: (i < self._focus, i))
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                index = self._next_index()
+                if index is None:
+                    return
+                self._pending.discard(index)
+
+            artifact = self.artifacts[index]
+            try:
+                quiz = generate_dynamic_quiz(artifact, self.llm_service, self.timeout, self.seen_questions)
+            except Exception as e:
+                print(f"⚠️ 백그라운드 퀴즈 생성 실패: {e}")
+                quiz = get_fallback_quiz(artifact)
+
+            with self._cond:
+                # wait_for가 시간 초과로 이미 기본 퀴즈를 내보냈으면 그대로 둠
+                self._results.setdefault(artifact["id"], quiz)
+                self._cond.notify_all()
+
+    def prioritize(self, index: int) -> None:
+        """index 번 문제부터 먼저 생성하도록 우선순위 변경"""
+        with self._cond:
+            self._focus = index
+
+    def wait_for(self, index: int, timeout: float = None) -> dict:
+        """
+        index 번 문제의 퀴즈가 준비될 때까지 대기
+
+        시간 안에 준비되지 않으면 기본 퀴즈를 반환하고 결과로 기록해 두어,
+        나중에 생성이 끝나도 화면에 나간 문제가 바뀌지 않게 합니다.
+        """
+        self.prioritize(index)
+        artifact = self.artifacts[index]
+        timeout = timeout or self.timeout
+
+        with self._cond:
+            ready = self._cond.wait_for(lambda: artifact["id"] in self._results, timeout=timeout)
+            if ready:
+                return self._results[artifact["id"]]
+
+            print(f"⚠️ 퀴즈 대기 시간 초과: {artifact.get('name')}")
+            quiz = self._results.setdefault(artifact["id"], get_fallback_quiz(artifact))
+            self._pending.discard(index)
+            self._cond.notify_all()
+            return quiz
+
+    def results(self) -> dict:
+        """지금까지 생성된 퀴즈 {유물 id: 퀴즈}"""
+        with self._cond:
+            return dict(self._results)
+
+    def is_done(self) -> bool:
+        """모든 퀴즈 생성 완료 여부"""
+        with self._cond:
+            return len(self._results) >= len(self.artifacts)
+
+    def cancel(self) -> None:
+        """아직 시작하지 않은 생성 작업 취소"""
+        with self._cond:
+            self._cancelled = True
+            self._pending.clear()
+            self._cond.notify_all()
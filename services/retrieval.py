@@ -0,0 +1,274 @@
+"""
+🧭 retrieval.py - 임베딩 기반 유물 검색
+========================================
+
+카탈로그 전체 유물 설명의 임베딩을 미리 계산해 NumPy 행렬 하나에 저장하고,
+질문과의 코사인 유사도 상위 k개를 행렬 곱 한 번으로 찾습니다.
+
+- Gemini 임베딩 API (키가 있을 때)
+- 오프라인에서도 동작하는 로컬 해시 임베딩 (키가 없거나 API 실패 시)
+- 카탈로그가 바뀌지 않으면 디스크에 저장한 행렬 재사용
+- 색인은 백그라운드 준비 작업(또는 python -m services.retrieval)에서 만들고,
+  Gemini 색인이 준비되기 전에는 로컬 색인으로 검색
+"""
+
+import hashlib
+import os
+import threading
+import zlib
+
+import numpy as np
+
+from config.settings import CACHE_CONFIG, RETRIEVAL_CONFIG
+from data.search import tokenize
+
+
+def artifact_text(artifact) -> str:
+    """임베딩할 유물 텍스트"""
+    return " ".join(
+        artifact.get(field, "") or ""
+        for field in ("name", "period", "material", "designation", "gallery", "description")
+    )
+
+
+# ============================================================
+# 🧮 임베딩
+# ============================================================
+
+def local_embed(texts: list, dim: int = None) -> np.ndarray:
+    """
+    로컬 해시 임베딩 (feature hashing, 외부 호출 없음)
+
+    검색 토큰(한글 2-gram, 영문 단어)을 부호 있는 해시로 dim 차원에 누적한 뒤
+    L2 정규화합니다. 같은 입력은 항상 같은 벡터가 됩니다.
+    """
+    dim = dim or RETRIEVAL_CONFIG["local_dim"]
+    matrix = np.zeros((len(texts), dim), dtype=np.float32)
+
+    for row, text in enumerate(texts):
+        for token in tokenize(text):
+            h = zlib.crc32(token.encode("utf-8"))
+            matrix[row, h % dim] += 1.0 if (h >> 31) & 1 else -1.0
+
+    return _normalize(matrix)
+
+
+def gemini_embed(texts: list, task_type: str = "retrieval_document", priority: int = None) -> np.ndarray:
+    """
+    Gemini 임베딩 API (배치 요청, 실패 시 예외)
+
+    공유 LLM 서비스의 스케줄러/차단기를 거치므로 Gemini 장애 중에는 바로 실패합니다.
+    priority 기본값: 질문은 INTERACTIVE, 문서(카탈로그)는 BATCH
+    """
+    from services.llm_scheduler import BATCH, INTERACTIVE
+    from services.llm_service import get_llm_service
+
+    if priority is None:
+        priority = INTERACTIVE if task_type == "retrieval_query" else BATCH
+
+    service = get_llm_service()
+    batch_size = RETRIEVAL_CONFIG["batch_size"]
+    vectors = []
+    for start in range(0, len(texts), batch_size):
+        result = service.embed_content(
+            texts[start:start + batch_size],
+            task_type=task_type,
+            model=RETRIEVAL_CONFIG["embedding_model"],
+            timeout=RETRIEVAL_CONFIG["embed_timeout"],
+            priority=priority
+        )
+        vectors.extend(result["embedding"])
+
+    return _normalize(np.asarray(vectors, dtype=np.float32))
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+# ============================================================
+# 📐 벡터 색인
+# ============================================================
+
+class VectorIndex:
+    """정규화된 임베딩 행렬 + 유물 id 목록"""
+
+    def __init__(self, ids: list, matrix: np.ndarray, backend: str):
+        self.ids = list(ids)
+        self.matrix = matrix
+        self.backend = backend
+        self._row_of = {artifact_id: row for row, artifact_id in enumerate(self.ids)}
+
+    def embed_query(self, text: str) -> np.ndarray:
+        """색인과 같은 방식으로 질문 임베딩"""
+        if self.backend == "gemini":
+            return gemini_embed([text], task_type="retrieval_query")[0]
+        return local_embed([text], dim=self.matrix.shape[1])[0]
+
+    def vector_of(self, artifact_id: str) -> np.ndarray | None:
+        row = self._row_of.get(artifact_id)
+        return None if row is None else self.matrix[row]
+
+    def top_k(self, vector: np.ndarray, k: int = None, exclude_ids=(), min_score: float = None) -> list:
+        """
+        코사인 유사도 상위 k개
+
+        Returns:
+            list: [(유물 id, 유사도), ...] 유사도 내림차순
+        """
+        k = k or RETRIEVAL_CONFIG["top_k"]
+        min_score = RETRIEVAL_CONFIG["min_score"] if min_score is None else min_score
+        if not self.ids:
+            return []
+
+        scores = self.matrix @ vector
+        for artifact_id in exclude_ids:
+            row = self._row_of.get(artifact_id)
+            if row is not None:
+                scores[row] = -np.inf
+
+        # 전체 정렬 없이 상위 k개만 고른 뒤 정렬
+        k = min(k, len(self.ids))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [(self.ids[row], float(scores[row])) for row in top if scores[row] >= min_score]
+
+
+def _catalog_hash(ids: list, texts: list, backend: str) -> str:
+    digest = hashlib.sha256(backend.encode("utf-8"))
+    for artifact_id, text in zip(ids, texts):
+        digest.update(artifact_id.encode("utf-8"))
+        digest.update(text.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def resolve_backend(backend: str = None) -> str:
+    """설정의 "auto"를 실제 백엔드("gemini" / "local")로"""
+    backend = backend or RETRIEVAL_CONFIG["backend"]
+    if backend == "auto":
+        backend = "gemini" if os.getenv("GEMINI_API_KEY") else "local"
+    return backend
+
+
+def build_vector_index(artifacts: list, backend: str = None, cache_dir: str = None) -> VectorIndex:
+    """
+    유물 목록으로 벡터 색인 생성 (같은 카탈로그면 디스크에 저장된 행렬 재사용)
+
+    Parameters:
+        artifacts: 유물 iterable
+        backend: "gemini" / "local" / "auto" (기본: RETRIEVAL_CONFIG["backend"])
+        cache_dir: 행렬 저장 위치 (기본: CACHE_CONFIG["dir"])
+    """
+    backend = resolve_backend(backend)
+
+    # 카탈로그 제너레이터도 받을 수 있도록 한 번만 훑음
+    ids, texts = [], []
+    for artifact in artifacts:
+        ids.append(artifact["id"])
+        texts.append(artifact_text(artifact))
+
+    return _build_index(ids, texts, backend, cache_dir or CACHE_CONFIG["dir"])
+
+
+def _build_index(ids: list, texts: list, backend: str, cache_dir: str) -> VectorIndex:
+    path = os.path.join(cache_dir, f"embeddings_{backend}_{_catalog_hash(ids, texts, backend)}.npy")
+
+    if os.path.exists(path):
+        try:
+            return VectorIndex(ids, np.load(path), backend)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 임베딩 캐시 읽기 실패: {e}")
+
+    matrix = None
+    if backend == "gemini":
+        try:
+            matrix = gemini_embed(texts)
+        except Exception as e:
+            print(f"⚠️ Gemini 임베딩 실패, 로컬 임베딩 사용: {e}")
+            return _build_index(ids, texts, "local", cache_dir)
+    else:
+        matrix = local_embed(texts)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        np.save(path, matrix)
+    except OSError as e:
+        print(f"⚠️ 임베딩 캐시 저장 실패: {e}")
+
+    print(f"🧭 임베딩 색인 생성: 유물 {len(ids)}개 ({backend})")
+    return VectorIndex(ids, matrix, backend)
+
+
+# ============================================================
+# 🔗 유물 검색기
+# ============================================================
+
+class ArtifactRetriever:
+    """질문과 관련된 유물을 전체 카탈로그에서 찾는 검색기"""
+
+    def __init__(self, vector_index: VectorIndex, lookup):
+        self.vector_index = vector_index
+        self.lookup = lookup
+
+    def retrieve(self, query: str, k: int = None, exclude_ids=()) -> list:
+        """
+        질문과 가까운 유물 상위 k개
+
+        Returns:
+            list: [(유물, 유사도), ...] (질문 임베딩 실패 시 빈 리스트)
+        """
+        if not query or not query.strip():
+            return []
+
+        try:
+            vector = self.vector_index.embed_query(query)
+        except Exception as e:
+            print(f"⚠️ 질문 임베딩 실패: {e}")
+            return []
+
+        hits = self.vector_index.top_k(vector, k=k, exclude_ids=exclude_ids)
+        return [(self.lookup(artifact_id), score) for artifact_id, score in hits if self.lookup(artifact_id)]
+
+
+# 백엔드별 검색기 (백그라운드 준비 작업이 채움)
+_retrievers = {}
+_retriever_lock = threading.Lock()
+
+
+def warm_retriever() -> None:
+    """
+    검색 색인을 미리 만들어 둠 (카탈로그 백그라운드 준비 스레드에서 호출)
+
+    로컬 색인을 먼저 만들어 바로 쓸 수 있게 하고,
+    Gemini 백엔드면 카탈로그 전체 임베딩은 그다음에 만듭니다.
+    """
+    from data.artifact_index import get_artifact_index
+
+    index = get_artifact_index()
+
+    for backend in dict.fromkeys(("local", resolve_backend())):
+        if backend in _retrievers:
+            continue
+        vector_index = build_vector_index(index.artifacts(), backend=backend)
+        with _retriever_lock:
+            _retrievers.setdefault(backend, ArtifactRetriever(vector_index, index.get))
+            # Gemini 임베딩이 실패해 로컬로 대체된 경우도 로컬 색인으로 기록
+            _retrievers.setdefault(vector_index.backend, _retrievers[backend])
+
+
+def get_retriever() -> ArtifactRetriever | None:
+    """
+    준비된 유물 검색기 반환 (요청 스레드에서 색인을 만들지 않음)
+
+    설정한 백엔드 색인이 준비되기 전에는 로컬 색인을, 그것도 없으면 None을 반환합니다.
+    """
+    with _retriever_lock:
+        return _retrievers.get(resolve_backend()) or _retrievers.get("local")
+
+
+if __name__ == "__main__":
+    # 오프라인에서 임베딩 행렬을 미리 만들어 캐시 디렉터리에 저장
+    warm_retriever()
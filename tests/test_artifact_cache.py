@@ -0,0 +1,164 @@
+"""
+🗄️ 유물 캐시 테스트 - TTL, LRU 제거, 네거티브 캐싱, stale-while-revalidate (메모리 SQLite)
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from services import artifact_cache
+from services.artifact_cache import FRESH, MISSING, NEGATIVE, STALE, ArtifactCache
+
+
+class SyncThread:
+    """백그라운드 갱신을 바로 실행하는 Thread 대체"""
+
+    def __init__(self, target, daemon=None):
+        self.target = target
+
+    def start(self):
+        self.target()
+
+
+@pytest.fixture
+def fake_time(monkeypatch, clock):
+    monkeypatch.setattr(artifact_cache, "time", SimpleNamespace(time=clock.monotonic))
+    monkeypatch.setattr(artifact_cache, "threading", SimpleNamespace(Lock=threading.Lock, Thread=SyncThread))
+    return clock
+
+
+def make_cache(**kwargs) -> ArtifactCache:
+    options = {"path": ":memory:", "ttl": 100, "stale_ttl": 50, "negative_ttl": 10, "max_entries": 3}
+    options.update(kwargs)
+    return ArtifactCache(**options)
+
+
+class Fetcher:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+# ============================================================
+# ⏳ TTL
+# ============================================================
+
+def test_fresh_then_stale_then_missing(fake_time):
+    cache = make_cache()
+    cache.set("a", {"name": "석탑"})
+    assert cache.lookup("a") == (FRESH, {"name": "석탑"})
+
+    fake_time.advance(100)
+    assert cache.lookup("a") == (STALE, {"name": "석탑"})
+
+    fake_time.advance(50)
+    assert cache.lookup("a") == (MISSING, None)
+
+
+def test_negative_entry_expires_after_negative_ttl(fake_time):
+    cache = make_cache()
+    cache.set("gone", None)
+    assert cache.lookup("gone") == (NEGATIVE, None)
+
+    fake_time.advance(10)
+    assert cache.lookup("gone") == (MISSING, None)
+
+
+# ============================================================
+# 🧹 LRU
+# ============================================================
+
+def test_evicts_least_recently_used(fake_time):
+    cache = make_cache()
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+        fake_time.advance(1)
+
+    cache.lookup("a")  # a를 최근 사용으로
+    fake_time.advance(1)
+    cache.set("d", "d")
+
+    assert cache.lookup("b") == (MISSING, None)
+    assert [cache.lookup(key)[0] for key in ("a", "c", "d")] == [FRESH, FRESH, FRESH]
+
+
+# ============================================================
+# 🔄 get_or_fetch
+# ============================================================
+
+def test_get_or_fetch_caches_values(fake_time):
+    cache = make_cache()
+    fetch = Fetcher({"id": "1"})
+
+    assert cache.get_or_fetch("1", fetch) == {"id": "1"}
+    assert cache.get_or_fetch("1", fetch) == {"id": "1"}
+    assert fetch.calls == 1
+
+
+def test_get_or_fetch_negatively_caches_none(fake_time):
+    cache = make_cache()
+    fetch = Fetcher(None, {"id": "1"})
+
+    assert cache.get_or_fetch("1", fetch) is None
+    assert cache.get_or_fetch("1", fetch) is None
+    assert fetch.calls == 1
+
+    fake_time.advance(10)
+    assert cache.get_or_fetch("1", fetch) == {"id": "1"}
+
+
+def test_get_or_fetch_does_not_cache_errors(fake_time):
+    cache = make_cache()
+    fetch = Fetcher(ConnectionError("down"), {"id": "1"})
+
+    with pytest.raises(ConnectionError):
+        cache.get_or_fetch("1", fetch)
+    assert cache.lookup("1") == (MISSING, None)
+    assert cache.get_or_fetch("1", fetch) == {"id": "1"}
+
+
+def test_stale_value_is_returned_and_refreshed(fake_time):
+    cache = make_cache()
+    cache.set("1", "old")
+    fake_time.advance(100)
+
+    assert cache.get_or_fetch("1", Fetcher("new")) == "old"
+    assert cache.lookup("1") == (FRESH, "new")
+
+
+def test_failed_refresh_keeps_stale_value(fake_time):
+    cache = make_cache()
+    cache.set("1", "old")
+    fake_time.advance(100)
+
+    assert cache.get_or_fetch("1", Fetcher(None)) == "old"
+    assert cache.get_or_fetch("1", Fetcher(ConnectionError("down"))) == "old"
+    assert cache.lookup("1") == (STALE, "old")
+
+
+def test_only_one_refresh_per_key(fake_time, monkeypatch):
+    started = []
+    monkeypatch.setattr(
+        artifact_cache, "threading",
+        SimpleNamespace(Lock=threading.Lock, Thread=lambda target, daemon=None: SimpleNamespace(start=lambda: started.append(target)))
+    )
+    cache = make_cache()
+    cache.set("1", "old")
+    fake_time.advance(100)
+
+    cache.get_or_fetch("1", Fetcher("new"))
+    cache.get_or_fetch("1", Fetcher("new"))
+    assert len(started) == 1
+
+    started[0]()
+    cache.get_or_fetch("1", Fetcher("newer"))
+    assert len(started) == 1
+    assert cache.lookup("1") == (FRESH, "new")
@@ -0,0 +1,79 @@
+"""
+🔎 유물 색인 테스트 - Aho–Corasick 다중 매칭, 대소문자 무시, 카탈로그 지연 조회
+"""
+
+from data.artifact_index import AhoCorasick, ArtifactIndex
+from services.compact_catalog import CompactCatalog, write_compact_catalog
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    matcher = AhoCorasick()
+    for pattern in ("he", "she", "his", "hers"):
+        matcher.add(pattern, pattern)
+
+    found = sorted(matcher.find_all("ushers"))
+    assert found == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_aho_corasick_rebuilds_after_add():
+    matcher = AhoCorasick()
+    matcher.add("석탑", 1)
+    assert matcher.find_all("십층석탑") == [(2, 4, 1)]
+
+    matcher.add("층석", 2)
+    assert sorted(matcher.find_all("십층석탑")) == [(1, 3, 2), (2, 4, 1)]
+
+
+def test_find_all_returns_every_mentioned_artifact_in_order():
+    index = ArtifactIndex()
+    index.add({"id": "a", "name": "청자 매병"})
+    index.add({"id": "b", "name": "백자 달항아리"})
+    index.add({"id": "c", "name": "금관"})
+
+    found = index.find_all("백자 달항아리와 청자 매병을 비교해 주세요. 다시 백자 달항아리!")
+    assert [a["id"] for a in found] == ["b", "a"]
+
+
+def test_find_all_ignores_case_of_english_names():
+    index = ArtifactIndex()
+    index.add({"id": "a", "name": "금동미륵보살반가사유상", "name_en": "Pensive Bodhisattva"})
+
+    assert [a["id"] for a in index.find_all("Tell me about the PENSIVE bodhisattva")] == ["a"]
+
+
+def test_longer_name_wins_at_same_position():
+    index = ArtifactIndex()
+    index.add({"id": "short", "name": "청자"})
+    index.add({"id": "long", "name": "청자 상감운학문 매병"})
+
+    assert [a["id"] for a in index.find_all("청자 상감운학문 매병")] == ["long", "short"]
+
+
+def test_aliases_and_short_names():
+    index = ArtifactIndex()
+    index.add({"id": "a", "name": "탑"}, aliases=("경천사지 십층석탑",))
+
+    # 한 글자 이름은 오탐이 많아 패턴으로 쓰지 않음
+    assert index.find_all("탑이 멋지네요") == []
+    assert [a["id"] for a in index.find_all("경천사지 십층석탑")] == ["a"]
+
+
+def test_catalog_records_are_looked_up_lazily(tmp_path):
+    path = write_compact_catalog(
+        [{"id": "c1", "name": "청동 거울"}, {"id": "c2", "name": "Bronze Bell", "name_en": "Bronze Bell"}],
+        str(tmp_path / "catalog.acat")
+    )
+    catalog = CompactCatalog(path)
+    try:
+        index = ArtifactIndex()
+        index.add_catalog(catalog)
+        index.add({"id": "base", "name": "금관"})
+
+        assert index.get("c1")["name"] == "청동 거울"
+        assert index.get("missing") is None
+        assert [a["id"] for a in index.find_all("금관 옆 bronze bell")] == ["base", "c2"]
+        assert len(index) == 3
+        assert [a["id"] for a in index.artifacts()] == ["c1", "c2", "base"]
+        assert list(index.iter_fields(("id", "gallery"))) == [("c1", ""), ("c2", ""), ("base", "")]
+    finally:
+        catalog.close()
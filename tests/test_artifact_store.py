@@ -0,0 +1,58 @@
+"""
+🗂️ 유물 저장소 테스트 - 카탈로그 유물은 복사하지 않고, API 유물만 LRU로 보관
+"""
+
+import pytest
+
+from data.artifact_store import ArtifactRecord, ArtifactStore
+
+
+BASE = {"base1": {"id": "base1", "name": "금관", "quiz": None}}
+CATALOG = {"cat1": {"id": "cat1", "name": "청동 거울", "quiz": None}}
+
+
+def make_store(max_records: int = 2) -> ArtifactStore:
+    return ArtifactStore(base=BASE, resolve=CATALOG.get, max_records=max_records)
+
+
+def test_base_and_catalog_artifacts_are_not_copied():
+    store = make_store()
+    assert store.add_many([dict(BASE["base1"]), dict(CATALOG["cat1"])]) == ["base1", "cat1"]
+
+    assert len(store) == 0
+    assert store.get("base1") is BASE["base1"]
+    assert store.get("cat1") is CATALOG["cat1"]
+
+
+def test_api_artifacts_are_kept_in_a_bounded_lru():
+    store = make_store(max_records=2)
+    store.add({"id": "api1", "name": "A"})
+    store.add({"id": "api2", "name": "B"})
+    store.get("api1")
+    store.add({"id": "api3", "name": "C"})
+
+    assert len(store) == 2
+    assert "api2" not in store
+    assert [a["id"] for a in store.get_many(["api1", "api2", "api3", "cat1"])] == ["api1", "api3", "cat1"]
+
+
+def test_api_records_drop_raw_data_and_are_read_only():
+    store = make_store()
+    store.add({"id": "api1", "name": "A", "_raw": {"big": "payload"}})
+    record = store.get("api1")
+
+    assert isinstance(record, ArtifactRecord)
+    assert "_raw" not in record.to_dict()
+    with pytest.raises(AttributeError):
+        record.name = "B"
+
+
+def test_record_behaves_like_a_dict_for_none_fields():
+    record = ArtifactRecord({"id": "api1", "name": "A"})
+
+    assert record["quiz"] is None
+    assert record["designation"] is None
+    assert record.get("designation", "") == ""
+    assert "designation" in record
+    with pytest.raises(KeyError):
+        record["_raw"]
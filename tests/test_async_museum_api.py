@@ -0,0 +1,74 @@
+"""
+⚡ 비동기 e뮤지엄 클라이언트 테스트 - 예외가 나도 차단기 자리를 돌려주는지 (네트워크 없음)
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from services import circuit_breaker
+from services.async_museum_api import AsyncMuseumAPIService
+from services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class BrokenResponse:
+    status = 200
+    url = "https://example.com/relic/list"
+
+    async def text(self):
+        raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class StubSession:
+    closed = False
+
+    def get(self, url, params=None, timeout=None):
+        return BrokenResponse()
+
+
+@pytest.fixture
+def fake_time(monkeypatch, clock):
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    return clock
+
+
+def make_api(breaker: CircuitBreaker) -> AsyncMuseumAPIService:
+    api = AsyncMuseumAPIService("key", use_cache=False, breaker=breaker)
+    api._get_session = StubSession
+    return api
+
+
+def test_unexpected_error_is_recorded_as_failure(fake_time):
+    breaker = CircuitBreaker("test", min_calls=10)
+    api = make_api(breaker)
+
+    with pytest.raises(UnicodeDecodeError):
+        asyncio.run(api._get("https://example.com/relic/list", {}))
+    snapshot = breaker.snapshot()
+    assert snapshot["failures"] == 1
+    assert snapshot["state"] == CLOSED
+
+
+def test_unexpected_error_frees_the_half_open_probe(fake_time):
+    breaker = CircuitBreaker("test", min_calls=1, open_seconds=30)
+    breaker.allow()
+    breaker.record_failure()
+    fake_time.advance(30)
+    assert breaker.state == HALF_OPEN
+
+    api = make_api(breaker)
+    with pytest.raises(UnicodeDecodeError):
+        asyncio.run(api._get("https://example.com/relic/list", {}))
+
+    # 시험 호출 실패 → 다시 OPEN, 유지 시간이 지나면 새 시험 호출 허용
+    assert breaker.state == OPEN
+    fake_time.advance(30)
+    breaker.allow()
@@ -0,0 +1,289 @@
+"""
+⚡ 차단기 테스트 - CLOSED → OPEN → HALF_OPEN 전환 (가짜 시계, 호출은 스텁 함수)
+"""
+
+import pytest
+
+from services import circuit_breaker
+from services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+@pytest.fixture
+def fake_time(monkeypatch, clock):
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    return clock
+
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    options = {"window": 60, "min_calls": 4, "failure_rate": 0.5, "open_seconds": 30, "half_open_calls": 1}
+    options.update(kwargs)
+    return CircuitBreaker("test", **options)
+
+
+def fail(breaker: CircuitBreaker, times: int = 1) -> None:
+    for _ in range(times):
+        breaker.allow()
+        breaker.record_failure()
+
+
+def succeed(breaker: CircuitBreaker, times: int = 1, elapsed: float = 0.0) -> None:
+    for _ in range(times):
+        breaker.allow()
+        breaker.record_success(elapsed)
+
+
+def trip(breaker: CircuitBreaker) -> None:
+    fail(breaker, breaker.min_calls)
+    assert breaker.state == OPEN
+
+
+# ============================================================
+# 🟢 CLOSED
+# ============================================================
+
+def test_stays_closed_below_min_calls(fake_time):
+    breaker = make_breaker()
+    fail(breaker, 3)
+    assert breaker.state == CLOSED
+
+
+def test_stays_closed_below_failure_rate(fake_time):
+    breaker = make_breaker()
+    succeed(breaker, 3)
+    fail(breaker, 2)
+    assert breaker.state == CLOSED
+
+
+def test_opens_at_failure_rate(fake_time):
+    breaker = make_breaker()
+    succeed(breaker, 2)
+    fail(breaker, 2)
+    assert breaker.state == OPEN
+    assert breaker.snapshot()["opened"] == 1
+
+
+def test_slow_success_counts_as_failure(fake_time):
+    breaker = make_breaker(slow_call=5.0)
+    succeed(breaker, 4, elapsed=5.0)
+    assert breaker.state == OPEN
+
+
+def test_old_failures_leave_the_window(fake_time):
+    breaker = make_breaker()
+    fail(breaker, 3)
+    fake_time.advance(61)
+    fail(breaker, 1)
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["recent_calls"] == 1
+
+
+# ============================================================
+# 🔴 OPEN
+# ============================================================
+
+def test_open_rejects_without_calling(fake_time):
+    breaker = make_breaker()
+    trip(breaker)
+    calls = []
+
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: calls.append(1))
+    assert calls == []
+    assert breaker.snapshot()["rejected"] == 1
+    assert breaker.snapshot()["retry_in"] == 30
+
+
+def test_open_moves_to_half_open_after_open_seconds(fake_time):
+    breaker = make_breaker()
+    trip(breaker)
+
+    fake_time.advance(29.9)
+    assert breaker.state == OPEN
+    fake_time.advance(0.1)
+    assert breaker.state == HALF_OPEN
+
+
+# ============================================================
+# 🟡 HALF_OPEN
+# ============================================================
+
+def test_half_open_limits_probes(fake_time):
+    breaker = make_breaker(half_open_calls=2)
+    trip(breaker)
+    fake_time.advance(30)
+
+    breaker.allow()
+    breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+
+def test_half_open_success_closes(fake_time):
+    breaker = make_breaker()
+    trip(breaker)
+    fake_time.advance(30)
+
+    succeed(breaker)
+    assert breaker.state == CLOSED
+    # 차단 전 실패 기록은 지워져 바로 다시 차단되지 않음
+    fail(breaker, 1)
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["recent_calls"] == 2
+
+
+def test_half_open_failure_reopens(fake_time):
+    breaker = make_breaker()
+    trip(breaker)
+    fake_time.advance(30)
+
+    fail(breaker)
+    assert breaker.state == OPEN
+    assert breaker.snapshot()["opened"] == 2
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    fake_time.advance(30)
+    assert breaker.state == HALF_OPEN
+
+
+def test_half_open_slow_probe_reopens(fake_time):
+    breaker = make_breaker(slow_call=5.0)
+    trip(breaker)
+    fake_time.advance(30)
+
+    succeed(breaker, elapsed=6.0)
+    assert breaker.state == OPEN
+
+
+def test_release_returns_the_probe_slot(fake_time):
+    breaker = make_breaker()
+    trip(breaker)
+    fake_time.advance(30)
+
+    breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    breaker.release()
+    breaker.allow()
+    assert breaker.state == HALF_OPEN
+
+
+# ============================================================
+# 📞 call()
+# ============================================================
+
+def test_call_records_exceptions_and_reraises(fake_time):
+    breaker = make_breaker()
+
+    def broken():
+        raise ConnectionError("down")
+
+    for _ in range(4):
+        with pytest.raises(ConnectionError):
+            breaker.call(broken)
+    assert breaker.state == OPEN
+
+
+def test_call_uses_is_failure_and_elapsed(fake_time):
+    breaker = make_breaker(slow_call=5.0)
+
+    def slow():
+        fake_time.advance(5.0)
+        return 200
+
+    assert breaker.call(lambda: 500, is_failure=lambda status: status >= 500) == 500
+    assert breaker.call(slow) == 200
+    snapshot = breaker.snapshot()
+    assert snapshot["failures"] == 2
+    assert snapshot["calls"] == 2
+
+
+# ============================================================
+# 🤖 LLMService 연동
+# ============================================================
+
+class NoCache:
+    def get(self, key, variants=1):
+        return None
+
+    def add(self, key, value, variants=1):
+        pass
+
+
+class Chunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class StubModel:
+    def __init__(self, chunks=("안녕", "하세요"), fail_after=None):
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.calls = 0
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls += 1
+        return self._stream()
+
+    def _stream(self):
+        for i, text in enumerate(self.chunks):
+            if self.fail_after is not None and i == self.fail_after:
+                raise ConnectionError("stream dropped")
+            yield Chunk(text)
+
+
+def make_service(breaker: CircuitBreaker, model: StubModel):
+    from services.llm_scheduler import LLMScheduler
+    from services.llm_service import LLMService
+
+    service = LLMService("key", cache=NoCache(), scheduler=LLMScheduler(requests_per_minute=6000, burst=100), breaker=breaker)
+    service._model = model
+    return service
+
+
+def test_chat_uses_local_fallback_when_open(fake_time):
+    breaker = make_breaker()
+    trip(breaker)
+    model = StubModel()
+    service = make_service(breaker, model)
+
+    assert "API 오류" not in service.chat("안녕")
+    assert "API 오류" not in "".join(service.chat_stream("안녕"))
+    assert model.calls == 0
+
+
+def test_stream_records_one_success_after_the_last_chunk(fake_time):
+    breaker = make_breaker()
+    service = make_service(breaker, StubModel())
+
+    stream = service.generate_text_stream("prompt")
+    assert next(stream) == "안녕"
+    assert breaker.snapshot()["calls"] == 0
+
+    assert list(stream) == ["하세요"]
+    assert breaker.snapshot()["calls"] == 1
+    assert breaker.snapshot()["failures"] == 0
+
+
+def test_stream_dropped_midway_is_a_failure(fake_time):
+    breaker = make_breaker()
+    service = make_service(breaker, StubModel(fail_after=1))
+
+    with pytest.raises(ConnectionError):
+        list(service.generate_text_stream("prompt"))
+    assert breaker.snapshot()["calls"] == 1
+    assert breaker.snapshot()["failures"] == 1
+
+
+def test_stream_closed_by_consumer_releases_the_probe(fake_time):
+    breaker = make_breaker()
+    trip(breaker)
+    fake_time.advance(30)
+    service = make_service(breaker, StubModel())
+
+    stream = service.generate_text_stream("prompt")
+    next(stream)
+    stream.close()
+    assert breaker.state == HALF_OPEN
+    breaker.allow()
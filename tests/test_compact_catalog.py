@@ -0,0 +1,128 @@
+"""
+🗜️ 바이너리 카탈로그 테스트 - 저장/읽기 왕복, 형식 버전 변경 시 재변환, id 이진 탐색
+"""
+
+import json
+import os
+import struct
+
+import pytest
+
+from services.compact_catalog import (
+    FIELDS,
+    HEADER,
+    MAGIC,
+    CompactCatalog,
+    get_compact_path,
+    open_catalog,
+    write_compact_catalog,
+)
+
+
+ARTIFACTS = [
+    {"id": "PS0100100100300123", "name": "청자 상감운학문 매병", "period": "고려", "description": "학과 구름 무늬"},
+    {"id": "PS0100100100100001", "name": "금동미륵보살반가사유상", "name_en": "Pensive Bodhisattva", "period": "삼국"},
+    {"id": "PS0100100100200045", "name": "백자 달항아리", "material": "", "image_url": "https://example.com/a.jpg"},
+]
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    path = write_compact_catalog(ARTIFACTS, str(tmp_path / "catalog.acat"))
+    catalog = CompactCatalog(path)
+    yield catalog
+    catalog.close()
+
+
+def write_jsonl(path: str, artifacts: list) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for artifact in artifacts:
+            f.write(json.dumps(artifact, ensure_ascii=False) + "\n")
+
+
+def test_round_trip_keeps_every_field(catalog):
+    assert len(catalog) == 3
+    for row, artifact in enumerate(ARTIFACTS):
+        record = catalog[row]
+        assert record == {**{field: artifact.get(field, "") for field in FIELDS}, "quiz": None}
+
+
+def test_value_reads_one_field(catalog):
+    assert catalog.value(1, "name_en") == "Pensive Bodhisattva"
+    assert catalog.value(2, "material") == ""
+
+
+def test_negative_index_and_slice(catalog):
+    assert catalog[-1]["id"] == ARTIFACTS[-1]["id"]
+    assert [r["id"] for r in catalog[0:2]] == [a["id"] for a in ARTIFACTS[:2]]
+    with pytest.raises(IndexError):
+        catalog[3]
+
+
+def test_get_uses_binary_search_over_sorted_ids(catalog):
+    for row, artifact in enumerate(ARTIFACTS):
+        assert catalog.find_row(artifact["id"]) == row
+        assert catalog.get(artifact["id"])["name"] == artifact["name"]
+
+    assert catalog.get("PS0100100100000000") is None    # 맨 앞보다 작음
+    assert catalog.get("PS0100100100200046") is None    # 중간 빈자리
+    assert catalog.get("PS9999") is None                # 맨 뒤보다 큼
+
+
+def test_binary_search_on_many_rows(tmp_path):
+    artifacts = [{"id": f"ID{i:05d}", "name": f"유물 {i}"} for i in range(999, -1, -1)]
+    catalog = CompactCatalog(write_compact_catalog(artifacts, str(tmp_path / "many.acat")))
+    try:
+        for i in (0, 1, 500, 998, 999):
+            assert catalog.get(f"ID{i:05d}")["name"] == f"유물 {i}"
+        assert catalog.get("ID01000") is None
+    finally:
+        catalog.close()
+
+
+def test_rejects_other_versions(tmp_path):
+    path = write_compact_catalog(ARTIFACTS, str(tmp_path / "old.acat"))
+    with open(path, "r+b") as f:
+        f.write(HEADER.pack(MAGIC, 1, len(FIELDS), len(ARTIFACTS), 0)[:HEADER.size])
+
+    with pytest.raises(ValueError):
+        CompactCatalog(path)
+
+
+def test_open_catalog_rebuilds_old_version_from_jsonl(tmp_path):
+    jsonl = str(tmp_path / "PS01001001.jsonl")
+    write_jsonl(jsonl, ARTIFACTS)
+    compact = get_compact_path(jsonl)
+
+    # JSONL보다 새 파일이지만 형식 버전이 이전 것
+    write_compact_catalog(ARTIFACTS, compact)
+    with open(compact, "r+b") as f:
+        magic, _, field_count, count, heap_size = HEADER.unpack_from(f.read(HEADER.size))
+        f.seek(0)
+        f.write(struct.pack("<4sHHIQ", magic, 1, field_count, count, heap_size))
+    os.utime(jsonl, (1, 1))
+
+    catalog = open_catalog(jsonl)
+    try:
+        assert catalog is not None
+        assert catalog.get(ARTIFACTS[1]["id"])["name_en"] == "Pensive Bodhisattva"
+    finally:
+        catalog.close()
+
+
+def test_open_catalog_converts_newer_jsonl(tmp_path):
+    jsonl = str(tmp_path / "PS01001001.jsonl")
+    write_jsonl(jsonl, ARTIFACTS[:1])
+    open_catalog(jsonl).close()
+
+    write_jsonl(jsonl, ARTIFACTS)
+    os.utime(get_compact_path(jsonl), (1, 1))
+    catalog = open_catalog(jsonl)
+    try:
+        assert len(catalog) == 3
+    finally:
+        catalog.close()
+
+
+def test_open_catalog_without_files(tmp_path):
+    assert open_catalog(str(tmp_path / "missing.jsonl")) is None
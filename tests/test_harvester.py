@@ -0,0 +1,96 @@
+"""
+🧺 수집기 테스트 - 체크포인트 이어받기, 실패한 페이지 재수집 (가짜 API)
+"""
+
+import json
+import os
+
+import pytest
+
+from services.harvester import _checkpoint_path, harvest_catalog, load_catalog
+
+
+class StubService:
+    """iter_relic_page만 흉내 내는 MuseumAPIService 대체 (페이지당 rows건)"""
+
+    service_key = "key"
+    NATIONAL_MUSEUM_CODE = "PS01001001"
+
+    def __init__(self, total: int, failing=(), total_count=True):
+        self.total = total
+        self.failing = set(failing)
+        self.total_count = total_count
+        self.requested = []
+
+    def iter_relic_page(self, page, rows, museum_code, meta=None):
+        self.requested.append(page)
+        if meta is not None and self.total_count:
+            meta["total_count"] = self.total
+        if page in self.failing:
+            raise ConnectionError(f"page {page} failed")
+
+        start = (page - 1) * rows
+        for i in range(start, min(start + rows, self.total)):
+            yield {"id": f"r{i}", "name": f"유물 {i}", "_raw": {"id": f"r{i}"}}
+
+
+def read_checkpoint(output_path: str) -> dict | None:
+    path = _checkpoint_path(output_path)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def output_path(tmp_path):
+    return str(tmp_path / "catalog.jsonl")
+
+
+def test_harvests_every_page(output_path):
+    service = StubService(total=25)
+    harvest_catalog(output_path=output_path, rows=10, max_workers=2, service=service)
+
+    assert sorted(service.requested) == [1, 2, 3]
+    assert sorted(r["id"] for r in load_catalog(output_path)) == sorted(f"r{i}" for i in range(25))
+    assert read_checkpoint(output_path)["done_pages"] == [1, 2, 3]
+    assert os.path.exists(output_path.replace(".jsonl", ".acat"))
+
+
+def test_resume_refetches_only_failed_pages(output_path):
+    harvest_catalog(output_path=output_path, rows=10, max_workers=2, service=StubService(total=35, failing={2, 4}))
+    checkpoint = read_checkpoint(output_path)
+    assert checkpoint["done_pages"] == [1, 3]
+    assert checkpoint["total_count"] == 35
+
+    service = StubService(total=35)
+    harvest_catalog(output_path=output_path, rows=10, max_workers=2, service=service)
+
+    assert sorted(service.requested) == [2, 4]
+    assert len(load_catalog(output_path)) == 35
+
+
+def test_failed_first_page_writes_no_checkpoint(output_path):
+    with pytest.raises(ConnectionError):
+        harvest_catalog(output_path=output_path, rows=10, service=StubService(total=25, failing={1}))
+    assert read_checkpoint(output_path) is None
+
+    service = StubService(total=25)
+    harvest_catalog(output_path=output_path, rows=10, service=service)
+    assert 1 in service.requested
+    assert len(load_catalog(output_path)) == 25
+
+
+def test_missing_total_count_is_not_checkpointed(output_path):
+    with pytest.raises(ValueError):
+        harvest_catalog(output_path=output_path, rows=10, service=StubService(total=25, total_count=False))
+    assert read_checkpoint(output_path) is None
+
+
+def test_changed_rows_restarts_from_scratch(output_path):
+    harvest_catalog(output_path=output_path, rows=10, service=StubService(total=25, failing={3}))
+
+    service = StubService(total=25)
+    harvest_catalog(output_path=output_path, rows=5, service=service)
+    assert sorted(service.requested) == [1, 2, 3, 4, 5]
+    assert len(load_catalog(output_path)) == 25
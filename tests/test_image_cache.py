@@ -0,0 +1,57 @@
+"""
+🖼️ 이미지 캐시 테스트 - 화면에 보여줄 URL 선택 (다운로드 없음)
+"""
+
+import pytest
+
+from services import image_cache
+from services.image_cache import get_thumbnail
+
+
+ARTIFACT = {
+    "id": "1",
+    "thumbnail_url": "https://example.com/thumb.jpg",
+    "image_url": "https://example.com/original.jpg",
+}
+
+
+class StubCache:
+    def __init__(self, cached: dict = None):
+        self.cached = cached or {}
+        self.prefetched = []
+
+    def lookup(self, url: str, variant: str):
+        return self.cached.get((url, variant))
+
+    def prefetch(self, urls):
+        self.prefetched.extend(urls)
+
+
+@pytest.fixture
+def stub_cache(monkeypatch):
+    cache = StubCache()
+    monkeypatch.setattr(image_cache, "get_image_cache", lambda: cache)
+    return cache
+
+
+def test_thumb_miss_returns_small_source_not_original(stub_cache):
+    assert get_thumbnail(ARTIFACT) == ARTIFACT["thumbnail_url"]
+    assert stub_cache.prefetched == [ARTIFACT["thumbnail_url"]]
+
+
+def test_thumb_hit_returns_local_file(stub_cache):
+    stub_cache.cached[(ARTIFACT["thumbnail_url"], "thumb")] = "/cache/ab12_thumb.jpg"
+    assert get_thumbnail(ARTIFACT) == "/cache/ab12_thumb.jpg"
+    assert stub_cache.prefetched == []
+
+
+def test_detail_uses_original_image(stub_cache):
+    assert get_thumbnail(ARTIFACT, "detail") == ARTIFACT["image_url"]
+    stub_cache.cached[(ARTIFACT["image_url"], "detail")] = "/cache/cd34_detail.jpg"
+    assert get_thumbnail(ARTIFACT, "detail") == "/cache/cd34_detail.jpg"
+
+
+def test_thumb_falls_back_to_original_without_thumbnail_url(stub_cache):
+    artifact = {"id": "2", "image_url": "https://example.com/only.jpg"}
+    assert get_thumbnail(artifact) == "https://example.com/only.jpg"
+    assert get_thumbnail({"id": "3"}) == ""
@@ -0,0 +1,182 @@
+"""
+🧠 LLM 캐시 테스트 - 응답 풀, 계층 조회, 검증 통과한 응답만 저장 (LLM 호출 없음)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from config.settings import AI_CONFIG
+from services import artifact_cache, llm_cache
+from services.llm_cache import LLMCache, MemoryBackend, SQLiteBackend, make_cache_key
+
+
+@pytest.fixture
+def cache():
+    return LLMCache([MemoryBackend(max_entries=10, ttl=100), SQLiteBackend(path=":memory:", ttl=100)])
+
+
+def test_cache_key_depends_on_every_input():
+    key = make_cache_key("gemini", "prompt", {"temperature": 0.7})
+    assert key == make_cache_key("gemini", "prompt", {"temperature": 0.7})
+    assert key != make_cache_key("gemini", "prompt", {"temperature": 0.2})
+    assert key != make_cache_key("gemini", "prompt 2", {"temperature": 0.7})
+    assert key != make_cache_key("other", "prompt", {"temperature": 0.7})
+
+
+def test_single_variant_is_returned_after_one_add(cache):
+    assert cache.get("k") is None
+    cache.add("k", "answer")
+    assert cache.get("k") == "answer"
+
+
+def test_pool_misses_until_full_then_rotates(cache):
+    for text in ("q1", "q2"):
+        cache.add("k", text, variants=3)
+        assert cache.get("k", variants=3) is None
+
+    cache.add("k", "q3", variants=3)
+    assert {cache.get("k", variants=3) for _ in range(200)} == {"q1", "q2", "q3"}
+
+
+def test_pool_ignores_duplicates_and_keeps_latest(cache):
+    for text in ("q1", "q1", "q2", "q3", "q4"):
+        cache.add("k", text, variants=3)
+    assert sorted(cache._load("k")[0]) == ["q2", "q3", "q4"]
+
+
+def test_lower_tier_hit_fills_upper_tier():
+    memory = MemoryBackend(max_entries=10, ttl=100)
+    disk = SQLiteBackend(path=":memory:", ttl=100)
+    disk.set("k", ["from disk"])
+
+    cache = LLMCache([memory, disk])
+    assert cache.get("k") == "from disk"
+    assert memory.get("k") == ["from disk"]
+
+
+def test_memory_backend_is_lru():
+    memory = MemoryBackend(max_entries=2, ttl=100)
+    memory.set("a", ["a"])
+    memory.set("b", ["b"])
+    memory.get("a")
+    memory.set("c", ["c"])
+    assert memory.get("b") is None
+    assert memory.get("a") == ["a"]
+
+
+# ============================================================
+# ⏳ TTL은 처음 저장한 시각 기준
+# ============================================================
+
+@pytest.fixture
+def fake_time(monkeypatch, clock):
+    fake = SimpleNamespace(time=clock.monotonic)
+    monkeypatch.setattr(llm_cache, "time", fake)
+    monkeypatch.setattr(artifact_cache, "time", fake)
+    return clock
+
+
+def test_promotion_keeps_original_age(fake_time):
+    memory = MemoryBackend(max_entries=10, ttl=100)
+    disk = SQLiteBackend(path=":memory:", ttl=100)
+    cache = LLMCache([memory, disk])
+    disk.set("k", ["answer"])
+
+    fake_time.advance(60)
+    assert cache.get("k") == "answer"
+    fake_time.advance(40)
+    assert memory.get("k") is None
+    assert cache.get("k") is None
+
+
+def test_frequent_reads_do_not_extend_ttl(fake_time, cache):
+    cache.add("k", "answer")
+    for _ in range(9):
+        fake_time.advance(10)
+        assert cache.get("k") == "answer"
+    fake_time.advance(10)
+    assert cache.get("k") is None
+
+
+def test_adding_a_variant_keeps_the_pool_age(fake_time, cache):
+    cache.add("k", "q1", variants=2)
+    fake_time.advance(60)
+    cache.add("k", "q2", variants=2)
+    assert cache.get("k", variants=2) in ("q1", "q2")
+
+    fake_time.advance(40)
+    assert cache.get("k", variants=2) is None
+
+    # 만료 후 새 풀은 새로 시작
+    cache.add("k", "q3", variants=2)
+    fake_time.advance(99)
+    assert cache._load("k")[0] == ["q3"]
+
+
+# ============================================================
+# ✅ 검증 통과한 응답만 저장 (LLMService.generate_text)
+# ============================================================
+
+class Response:
+    def __init__(self, text):
+        self.text = text
+        self.usage_metadata = None
+
+
+class StubModel:
+    def __init__(self, *texts):
+        self.texts = list(texts)
+        self.calls = 0
+
+    def generate_content(self, prompt, **kwargs):
+        self.calls += 1
+        return Response(self.texts.pop(0))
+
+
+def make_service(cache, model):
+    from services.circuit_breaker import CircuitBreaker
+    from services.llm_scheduler import LLMScheduler
+    from services.llm_service import LLMService
+
+    service = LLMService(
+        "key",
+        cache=cache,
+        scheduler=LLMScheduler(requests_per_minute=6000, burst=100),
+        breaker=CircuitBreaker("test")
+    )
+    service._model = model
+    return service
+
+
+def is_json(text):
+    return text.startswith("{")
+
+
+def test_invalid_response_is_returned_but_not_cached(cache):
+    model = StubModel("not json", '{"ok": 1}')
+    service = make_service(cache, model)
+
+    assert service.generate_text("prompt", validate=is_json) == "not json"
+    assert service.generate_text("prompt", validate=is_json) == '{"ok": 1}'
+    assert service.generate_text("prompt", validate=is_json) == '{"ok": 1}'
+    assert model.calls == 2
+
+
+def test_variants_fill_the_pool_before_reuse(cache):
+    model = StubModel("v1", "v2", "v3")
+    service = make_service(cache, model)
+
+    texts = [service.generate_text("prompt", variants=2) for _ in range(5)]
+    assert texts[:2] == ["v1", "v2"]
+    assert set(texts[2:]) <= {"v1", "v2"}
+    assert model.calls == 2
+
+
+def test_use_cache_false_skips_the_pool(cache):
+    model = StubModel("a", "b")
+    service = make_service(cache, model)
+
+    assert service.generate_text("prompt", use_cache=False) == "a"
+    assert service.generate_text("prompt", use_cache=False) == "b"
+    assert cache.get(make_cache_key(AI_CONFIG["model"], "prompt")) is None
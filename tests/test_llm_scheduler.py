@@ -0,0 +1,281 @@
+"""
+🚦 LLM 스케줄러 테스트 - 토큰 버킷, 우선순위, 마감, 429 백오프 (가짜 시계, API 호출 없음)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from services import llm_scheduler
+from services.llm_scheduler import (
+    BACKGROUND,
+    BATCH,
+    INTERACTIVE,
+    DeadlineExceeded,
+    LLMScheduler,
+    SchedulerBusy,
+    TokenBucket,
+    is_rate_limited,
+)
+
+
+class RateLimited(Exception):
+    code = 429
+
+
+@pytest.fixture
+def fake_time(monkeypatch, clock):
+    """스케줄러 모듈의 time/random을 가짜 시계와 최대 지터로 교체"""
+    monkeypatch.setattr(llm_scheduler, "time", clock)
+    monkeypatch.setattr(llm_scheduler, "random", SimpleNamespace(uniform=lambda low, high: high))
+    return clock
+
+
+def make_scheduler(**kwargs) -> LLMScheduler:
+    # 기본: 초당 요청 1개, 버스트 2, 토큰 한도는 넉넉하게
+    options = {"requests_per_minute": 60, "tokens_per_minute": 600000, "burst": 2, "max_queue": 8}
+    options.update(kwargs)
+    return LLMScheduler(**options)
+
+
+def acquire(scheduler: LLMScheduler, ticket) -> float:
+    with scheduler._cond:
+        return scheduler._try_acquire(ticket, llm_scheduler.time.monotonic())
+
+
+# ============================================================
+# 🪣 토큰 버킷
+# ============================================================
+
+def test_token_bucket_refills_up_to_capacity(fake_time):
+    bucket = TokenBucket(rate=2, capacity=4)
+    assert bucket.wait_time(4, fake_time.now) == 0.0
+
+    bucket.consume(4)
+    assert bucket.wait_time(1, fake_time.now) == pytest.approx(0.5)
+
+    fake_time.advance(1)
+    assert bucket.wait_time(2, fake_time.now) == 0.0
+
+    fake_time.advance(100)
+    bucket.wait_time(0, fake_time.now)
+    assert bucket.tokens == 4
+
+
+def test_token_bucket_clamps_large_requests_and_drains(fake_time):
+    bucket = TokenBucket(rate=1, capacity=3)
+    # 용량보다 큰 요청은 용량만큼만 기다림 (영원히 막히지 않도록)
+    assert bucket.wait_time(10, fake_time.now) == 0.0
+
+    bucket.drain()
+    assert bucket.wait_time(1, fake_time.now) == pytest.approx(1.0)
+
+
+def test_token_bucket_adjust_returns_overestimate(fake_time):
+    bucket = TokenBucket(rate=1, capacity=100)
+    bucket.consume(50)
+    bucket.adjust(-30)  # 실제 사용량이 추정보다 30 적음
+    assert bucket.tokens == 80
+    bucket.adjust(-100)
+    assert bucket.tokens == 100
+
+
+# ============================================================
+# 📋 대기열 순서 / 한도
+# ============================================================
+
+def test_higher_priority_goes_first(fake_time):
+    scheduler = make_scheduler()
+    batch = scheduler._enqueue(BATCH, 0, fake_time.now + 60)
+    background = scheduler._enqueue(BACKGROUND, 0, fake_time.now + 60)
+    interactive = scheduler._enqueue(INTERACTIVE, 0, fake_time.now + 60)
+
+    assert acquire(scheduler, batch) > 0
+    assert acquire(scheduler, background) > 0
+    assert acquire(scheduler, interactive) == 0
+    assert acquire(scheduler, background) == 0
+
+
+def test_same_priority_is_fifo(fake_time):
+    scheduler = make_scheduler()
+    first = scheduler._enqueue(BACKGROUND, 0, fake_time.now + 60)
+    second = scheduler._enqueue(BACKGROUND, 0, fake_time.now + 60)
+
+    assert acquire(scheduler, second) > 0
+    assert acquire(scheduler, first) == 0
+    assert acquire(scheduler, second) == 0
+
+
+def test_request_bucket_limits_rate(fake_time):
+    scheduler = make_scheduler()
+    tickets = [scheduler._enqueue(INTERACTIVE, 0, fake_time.now + 60) for _ in range(3)]
+
+    assert acquire(scheduler, tickets[0]) == 0
+    assert acquire(scheduler, tickets[1]) == 0
+    # 버스트를 다 쓰면 1초(분당 60개) 기다려야 함
+    assert acquire(scheduler, tickets[2]) == pytest.approx(1.0)
+
+    fake_time.advance(1)
+    assert acquire(scheduler, tickets[2]) == 0
+    assert scheduler.stats()["sent"] == 3
+
+
+def test_token_bucket_limits_large_prompts(fake_time):
+    scheduler = make_scheduler(tokens_per_minute=600)  # 초당 10토큰, 용량 600
+    big = scheduler._enqueue(INTERACTIVE, 600, fake_time.now + 60)
+    next_one = scheduler._enqueue(INTERACTIVE, 100, fake_time.now + 60)
+
+    assert acquire(scheduler, big) == 0
+    assert acquire(scheduler, next_one) == pytest.approx(10.0)
+
+
+def test_full_queue_raises_busy(fake_time):
+    scheduler = make_scheduler(max_queue=2)
+    scheduler._enqueue(BATCH, 0, fake_time.now + 60)
+    scheduler._enqueue(BATCH, 0, fake_time.now + 60)
+
+    with pytest.raises(SchedulerBusy):
+        scheduler._enqueue(INTERACTIVE, 0, fake_time.now + 60)
+    assert scheduler.stats()["rejected"] == 1
+
+
+# ============================================================
+# ⏰ 마감
+# ============================================================
+
+def test_deadline_expires_and_frees_the_queue(fake_time):
+    scheduler = make_scheduler(burst=1)
+    head = scheduler._enqueue(INTERACTIVE, 0, fake_time.now + 60)
+    assert acquire(scheduler, head) == 0
+
+    late = scheduler._enqueue(INTERACTIVE, 0, fake_time.now + 0.5)
+    waiting = scheduler._enqueue(BATCH, 0, fake_time.now + 60)
+    # 남은 마감(0.5초)이 버킷 대기(1초)보다 짧으면 마감까지만 기다림
+    assert acquire(scheduler, late) == pytest.approx(0.5)
+
+    fake_time.advance(0.5)
+    with pytest.raises(DeadlineExceeded):
+        acquire(scheduler, late)
+    assert scheduler.stats()["expired"] == 1
+
+    # 마감된 항목은 뒤 요청을 막지 않음
+    fake_time.advance(0.5)
+    assert acquire(scheduler, waiting) == 0
+    assert scheduler.stats()["waiting"] == 0
+
+
+def test_run_uses_priority_deadline_by_default(fake_time, monkeypatch):
+    monkeypatch.setitem(llm_scheduler.LLM_SCHEDULER_CONFIG, "deadlines", {
+        "interactive": 1, "background": 2, "batch": 3,
+    })
+    scheduler = make_scheduler()
+    seen = []
+    original = scheduler._enqueue
+    monkeypatch.setattr(scheduler, "_enqueue", lambda p, t, d: seen.append(d - fake_time.now) or original(p, t, d))
+
+    scheduler.run(lambda: "ok", priority=BATCH)
+    scheduler.run(lambda: "ok", priority=BACKGROUND, timeout=7)
+    assert seen == [3, 7]
+
+
+# ============================================================
+# 🔁 429 백오프
+# ============================================================
+
+def test_is_rate_limited():
+    assert is_rate_limited(RateLimited())
+    assert is_rate_limited(Exception("429 Resource has been exhausted"))
+    assert is_rate_limited(type("ResourceExhausted", (Exception,), {})())
+    assert not is_rate_limited(ValueError("bad request"))
+
+
+def test_run_retries_429_with_exponential_backoff(fake_time, monkeypatch):
+    monkeypatch.setitem(llm_scheduler.LLM_SCHEDULER_CONFIG, "backoff_base", 1.0)
+    monkeypatch.setitem(llm_scheduler.LLM_SCHEDULER_CONFIG, "backoff_max", 20.0)
+    scheduler = make_scheduler()
+    calls = []
+
+    def fn():
+        calls.append(fake_time.now)
+        if len(calls) < 3:
+            raise RateLimited()
+        return "ok"
+
+    assert scheduler.run(fn, timeout=60) == "ok"
+    assert len(calls) == 3
+    assert fake_time.sleeps == [1.0, 2.0]
+    assert scheduler.stats()["rate_limited"] == 2
+
+
+def test_run_backoff_is_capped(fake_time, monkeypatch):
+    monkeypatch.setitem(llm_scheduler.LLM_SCHEDULER_CONFIG, "backoff_base", 4.0)
+    monkeypatch.setitem(llm_scheduler.LLM_SCHEDULER_CONFIG, "backoff_max", 5.0)
+    scheduler = make_scheduler()
+    results = iter([RateLimited(), RateLimited(), "ok"])
+
+    def fn():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    assert scheduler.run(fn, timeout=60) == "ok"
+    assert fake_time.sleeps == [4.0, 5.0]
+
+
+def test_429_drains_the_request_bucket(fake_time):
+    scheduler = make_scheduler(burst=5)
+    scheduler._on_rate_limited(0)
+    assert scheduler.requests.tokens <= 0
+    other = scheduler._enqueue(INTERACTIVE, 0, fake_time.now + 60)
+    assert acquire(scheduler, other) == pytest.approx(1.0)
+
+
+def test_run_gives_up_when_backoff_passes_deadline(fake_time):
+    scheduler = make_scheduler()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        raise RateLimited()
+
+    with pytest.raises(RateLimited):
+        scheduler.run(fn, timeout=2.5)
+    # 1초 대기 후 재시도, 다음 2초 대기는 마감을 넘으므로 포기
+    assert len(calls) == 2
+    assert fake_time.sleeps == [1.0]
+
+
+def test_run_gives_up_after_max_retries(fake_time, monkeypatch):
+    monkeypatch.setitem(llm_scheduler.LLM_SCHEDULER_CONFIG, "max_retries", 2)
+    monkeypatch.setitem(llm_scheduler.LLM_SCHEDULER_CONFIG, "backoff_max", 1.0)
+    scheduler = make_scheduler()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        raise RateLimited()
+
+    with pytest.raises(RateLimited):
+        scheduler.run(fn, timeout=600)
+    assert len(calls) == 3
+
+
+def test_run_does_not_retry_other_errors(fake_time):
+    scheduler = make_scheduler()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        scheduler.run(fn)
+    assert len(calls) == 1
+    assert fake_time.sleeps == []
+
+
+def test_run_settles_actual_token_usage(fake_time):
+    scheduler = make_scheduler(tokens_per_minute=1000)
+    scheduler.run(lambda: 100, tokens=400, count_tokens=lambda result: result)
+    assert scheduler.tokens.tokens == 900
@@ -0,0 +1,84 @@
+"""
+🏛️ e뮤지엄 API 응답 파싱 테스트 - 목록 XML 인코딩/오류 응답 (네트워크 없음)
+"""
+
+import io
+
+import pytest
+
+pytest.importorskip("requests")
+
+from services.museum_api import MuseumAPIError, MuseumAPIService
+
+
+LIST_XML = (
+    '<?xml version="1.0" encoding="{encoding}"?>'
+    "<response><header><resultCode>{code}</resultCode><resultMsg>{msg}</resultMsg></header>"
+    "<body><totalCount>2</totalCount><items>"
+    '<data><item key="id" value="PS1"/><item key="name" value="청자 상감운학문 매병"/></data>'
+    '<data><item key="id" value="PS2"/><item key="name" value="백자 달항아리"/></data>'
+    "</items></body></response>"
+)
+
+
+def list_xml(encoding: str = "UTF-8", code: str = "0000", msg: str = "OK") -> str:
+    return LIST_XML.format(encoding=encoding, code=code, msg=msg)
+
+
+@pytest.fixture
+def service():
+    return MuseumAPIService("key", use_cache=False)
+
+
+@pytest.mark.parametrize("encoding", ["UTF-8", "EUC-KR", "CP949"])
+def test_raw_bytes_are_read_with_declared_encoding(service, encoding):
+    artifacts, total = service._parse_list_page(list_xml(encoding).encode(encoding))
+
+    assert [a["name"] for a in artifacts] == ["청자 상감운학문 매병", "백자 달항아리"]
+    assert total == 2
+
+
+@pytest.mark.parametrize("encoding", ["UTF-8", "EUC-KR"])
+def test_decoded_text_ignores_the_declaration(service, encoding):
+    artifacts, _ = service._parse_list_page(list_xml(encoding))
+    assert artifacts[0]["name"] == "청자 상감운학문 매병"
+
+
+def test_stream_with_multibyte_encoding(service):
+    source = io.BytesIO(list_xml("EUC-KR").encode("euc-kr"))
+    assert [a["id"] for a in service._iter_list_items(source)] == ["PS1", "PS2"]
+
+
+def test_error_result_code_raises(service):
+    with pytest.raises(MuseumAPIError) as error:
+        service._parse_list_page(list_xml(code="22", msg="LIMITED NUMBER OF SERVICE REQUESTS EXCEEDS ERROR").encode())
+    assert error.value.result_code == "22"
+
+
+def test_broken_xml_raises(service):
+    with pytest.raises(MuseumAPIError):
+        service._parse_list_page(b'<?xml version="1.0" encoding="EUC-KR"?><response><header>')
+
+
+def test_unknown_encoding_raises(service):
+    with pytest.raises(MuseumAPIError):
+        service._parse_list_page(b'<?xml version="1.0" encoding="x-unknown"?><response/>')
+
+
+# ============================================================
+# 🔎 상세 응답
+# ============================================================
+
+@pytest.mark.parametrize("text", ['["PS1"]', "null", "[]"])
+def test_detail_that_is_not_an_object_raises(service, text):
+    with pytest.raises(MuseumAPIError):
+        service._parse_detail_response(text)
+
+
+def test_detail_with_empty_body_is_a_miss(service):
+    assert service._parse_detail_response('{"header": {"resultCode": "0000"}, "item": {}}') is None
+
+
+def test_detail_error_code_raises(service):
+    with pytest.raises(MuseumAPIError):
+        service._parse_detail_response('{"header": {"resultCode": "30", "resultMsg": "SERVICE KEY IS NOT REGISTERED"}}')
@@ -0,0 +1,119 @@
+"""
+⏩ 퀴즈 파이프라인 테스트 - 다음 문제 우선 생성, 시간 초과 시 기본 퀴즈 유지 (LLM 호출 없음)
+"""
+
+import threading
+
+import pytest
+
+from services import quiz_pipeline
+from services.quiz_pipeline import QuizPipeline
+
+
+ARTIFACTS = [{"id": f"a{i}", "name": f"유물 {i}"} for i in range(5)]
+
+
+def fallback(artifact):
+    return {"question": f"기본 {artifact['id']}"}
+
+
+@pytest.fixture
+def generated(monkeypatch):
+    """생성 순서를 기록하는 generate_dynamic_quiz 대체"""
+    order = []
+
+    def generate(artifact, llm_service, timeout, seen_questions):
+        order.append(artifact["id"])
+        return {"question": f"생성 {artifact['id']}"}
+
+    monkeypatch.setattr(quiz_pipeline, "generate_dynamic_quiz", generate)
+    monkeypatch.setattr(quiz_pipeline, "get_fallback_quiz", fallback)
+    return order
+
+
+def test_generates_in_order_from_the_start(generated):
+    pipeline = QuizPipeline(ARTIFACTS, max_workers=1)
+    pipeline._worker()
+
+    assert generated == ["a0", "a1", "a2", "a3", "a4"]
+    assert pipeline.is_done()
+
+
+def test_focus_goes_first_then_wraps_around(generated):
+    pipeline = QuizPipeline(ARTIFACTS, max_workers=1)
+    pipeline.prioritize(3)
+    pipeline._worker()
+
+    assert generated == ["a3", "a4", "a0", "a1", "a2"]
+
+
+def test_prioritize_during_generation(generated, monkeypatch):
+    pipeline = QuizPipeline(ARTIFACTS, max_workers=1)
+    original = quiz_pipeline.generate_dynamic_quiz
+
+    def generate(artifact, *args):
+        if artifact["id"] == "a0":
+            pipeline.prioritize(2)  # 사용자가 문제를 건너뜀
+        return original(artifact, *args)
+
+    monkeypatch.setattr(quiz_pipeline, "generate_dynamic_quiz", generate)
+    pipeline._worker()
+
+    assert generated == ["a0", "a2", "a3", "a4", "a1"]
+
+
+def test_generation_error_becomes_fallback(generated, monkeypatch):
+    def broken(artifact, *args):
+        raise RuntimeError("LLM down")
+
+    monkeypatch.setattr(quiz_pipeline, "generate_dynamic_quiz", broken)
+    pipeline = QuizPipeline(ARTIFACTS[:2], max_workers=1)
+    pipeline._worker()
+
+    assert pipeline.results() == {"a0": fallback(ARTIFACTS[0]), "a1": fallback(ARTIFACTS[1])}
+
+
+def test_wait_for_returns_generated_quiz(generated):
+    pipeline = QuizPipeline(ARTIFACTS, max_workers=2).start()
+    assert pipeline.wait_for(4, timeout=5) == {"question": "생성 a4"}
+
+
+def test_wait_for_timeout_keeps_fallback_and_skips_generation(generated):
+    pipeline = QuizPipeline(ARTIFACTS, max_workers=1)
+
+    assert pipeline.wait_for(1, timeout=0.01) == fallback(ARTIFACTS[1])
+    pipeline._worker()
+
+    assert "a1" not in generated
+    assert pipeline.results()["a1"] == fallback(ARTIFACTS[1])
+    assert pipeline.is_done()
+
+
+def test_late_result_does_not_replace_shown_fallback(generated, monkeypatch):
+    release = threading.Event()
+    original = quiz_pipeline.generate_dynamic_quiz
+
+    def slow(artifact, *args):
+        release.wait(5)
+        return original(artifact, *args)
+
+    monkeypatch.setattr(quiz_pipeline, "generate_dynamic_quiz", slow)
+    pipeline = QuizPipeline(ARTIFACTS[:1], max_workers=1).start()
+
+    shown = pipeline.wait_for(0, timeout=0.05)
+    release.set()
+    pipeline._threads[0].join(5)
+
+    assert generated == ["a0"]
+    assert shown == fallback(ARTIFACTS[0])
+    assert pipeline.results()["a0"] == shown
+    assert pipeline.wait_for(0) == shown
+
+
+def test_cancel_stops_pending_work(generated):
+    pipeline = QuizPipeline(ARTIFACTS, max_workers=1)
+    pipeline.cancel()
+    pipeline._worker()
+
+    assert generated == []
+    assert not pipeline.is_done()
@@ -0,0 +1,74 @@
+"""
+🎯 추천 테스트 - 이웃 테이블 계산/저장과 서버 쪽 로드 (외부 호출 없음)
+"""
+
+import pytest
+
+from config.settings import RECOMMENDER_CONFIG
+from data import recommender
+from data.artifact_index import ArtifactIndex
+from data.recommender import Recommender, build_neighbor_table
+
+
+ARTIFACTS = [
+    {"id": "a1", "name": "청동 거울", "period": "고려", "material": "청동", "description": "청동으로 만든 거울"},
+    {"id": "a2", "name": "청동 종", "period": "고려", "material": "청동", "description": "청동으로 만든 종"},
+    {"id": "a3", "name": "백자 항아리", "period": "조선", "material": "흙", "description": "흰 백자 항아리"},
+    {"id": "a4", "name": "백자 병", "period": "조선", "material": "흙", "description": "흰 백자 병"},
+]
+
+
+@pytest.fixture
+def table_dir(monkeypatch, tmp_path):
+    monkeypatch.setitem(RECOMMENDER_CONFIG, "dir", str(tmp_path / "table"))
+    index = ArtifactIndex()
+    for artifact in ARTIFACTS:
+        index.add(artifact)
+    monkeypatch.setattr("data.artifact_index._artifact_index", index)
+    monkeypatch.setattr(recommender, "_recommender", None)
+    return RECOMMENDER_CONFIG["dir"]
+
+
+def test_neighbors_prefer_similar_artifacts(table_dir):
+    build_neighbor_table(ARTIFACTS, k=2)
+    table = Recommender.load()
+
+    assert table.ids == ["a1", "a2", "a3", "a4"]
+    assert table.neighbors_of("a1")[0][0] == "a2"
+    assert table.neighbors_of("a3")[0][0] == "a4"
+    assert all(neighbor != "a1" for neighbor, _ in table.neighbors_of("a1"))
+
+
+def test_small_memory_budget_gives_same_table(table_dir, tmp_path):
+    build_neighbor_table(ARTIFACTS, k=2, memory_mb=64)
+    build_neighbor_table(ARTIFACTS, k=2, out_dir=str(tmp_path / "small"), memory_mb=1e-6)
+    assert Recommender.load().neighbors.tolist() == Recommender.load(str(tmp_path / "small")).neighbors.tolist()
+
+
+def test_streamed_index_matches_dict_input(table_dir, tmp_path):
+    build_neighbor_table(ARTIFACTS, k=2, out_dir=str(tmp_path / "dicts"))
+    build_neighbor_table(k=2)
+    assert Recommender.load().catalog_hash == Recommender.load(str(tmp_path / "dicts")).catalog_hash
+
+
+def test_warm_recommender_only_loads(table_dir, monkeypatch):
+    monkeypatch.setattr(recommender, "build_neighbor_table", pytest.fail)
+    recommender.warm_recommender()
+    assert recommender.get_recommender() is None
+
+
+def test_build_recommender_skips_fresh_table(table_dir):
+    assert recommender.build_recommender() == table_dir
+    assert recommender.build_recommender() is None
+    assert recommender.build_recommender(force=True) == table_dir
+
+    recommender.warm_recommender()
+    assert recommender.get_recommender().ids == ["a1", "a2", "a3", "a4"]
+
+
+def test_recommend_weights_wrong_answers(table_dir):
+    build_neighbor_table(ARTIFACTS, k=1)
+    table = Recommender.load()
+    answers = [{"artifact_id": "a3", "is_correct": False}]
+    assert table.recommend(answers, count=1) == ["a4"]
+    assert len(table.recommend(answers, count=3)) == 3
@@ -0,0 +1,48 @@
+"""
+🔍 검색 엔진 테스트 - 토큰화와 한 글자 검색어
+"""
+
+import pytest
+
+from data.search import SearchEngine, tokenize
+
+
+ARTIFACTS = [
+    {"id": "1", "name": "경천사 십층석탑", "period": "고려", "material": "돌"},
+    {"id": "2", "name": "청동검", "period": "청동기", "material": "청동"},
+    {"id": "3", "name": "금동미륵보살반가사유상", "period": "삼국", "material": "금동"},
+]
+
+
+def test_tokenize_bigrams_and_words():
+    assert tokenize("석탑 Stone 10") == ["석탑", "stone", "10"]
+    assert tokenize("탑") == ["탑"]
+
+
+def test_tokenize_unigrams_for_index():
+    assert tokenize("청동검", unigrams=True) == ["청동", "동검", "청", "동", "검"]
+
+
+def test_single_syllable_query_matches_longer_names():
+    engine = SearchEngine(ARTIFACTS)
+    assert [r["artifact"]["id"] for r in engine.search("탑")["results"]] == ["1"]
+    assert [r["artifact"]["id"] for r in engine.search("검")["results"]] == ["2"]
+
+
+def test_multi_syllable_query_still_ranks_by_bigrams():
+    engine = SearchEngine(ARTIFACTS)
+    results = engine.search("반가사유상")["results"]
+    assert results[0]["artifact"]["id"] == "3"
+
+
+def test_unfiltered_facets_are_precomputed(monkeypatch):
+    engine = SearchEngine(ARTIFACTS + [{"id": "4", "name": "청자 매병", "period": "고려 (12세기)"}])
+    monkeypatch.setattr(engine, "_matches", lambda *args: pytest.fail("unfiltered facets must not scan documents"))
+
+    assert engine.facets("period") == [("고려", 2), ("청동기", 1), ("삼국", 1)]
+    assert engine.facets("period", {"period": "고려"}) == engine.facets("period")
+
+
+def test_filtered_facets_use_other_filters():
+    engine = SearchEngine(ARTIFACTS)
+    assert engine.facets("period", {"material": "청동"}) == [("청동기", 1)]